@@ -58,11 +58,21 @@ Configs: Dict[str, Dict] = {
     'dedicatedasynclogging': DedicatedAsyncLogConf,
 }
 
+# Layouts of the fork views used by the "layers" benchmarks.  The overlap is the fraction of the ipv4 nodes which
+# are edited in each fork layer.  A high overlap stacks storage nodes for the same node in many layers while a low
+# overlap spreads the edited nodes across the layers.
+Layouts: Dict[str, Dict] = {
+    'fork3many': {'layers': 3, 'overlap': 1.0},
+    'fork3few': {'layers': 3, 'overlap': 0.1},
+    'fork10many': {'layers': 10, 'overlap': 1.0},
+    'fork10few': {'layers': 10, 'overlap': 0.1},
+}
+
 '''
 Benchmark cortex operations
 
 TODO:  separate client process, multiple clients
-TODO:  tagprops, regex, control flow, node data, multiple layers, spawn option
+TODO:  tagprops, regex, control flow, node data, spawn option
 '''
 
 logger = logging.getLogger(__name__)
@@ -226,7 +236,7 @@ def benchmark(tags=None):
 class Benchmarker:
 
     def __init__(self, config: Dict[Any, Any], testdata: TestData, workfactor: int, num_iters=4, tmpdir=None,
-                 bench=None, tags=None):
+                 bench=None, tags=None, layout=None):
         '''
         Args:
             config: the cortex config
@@ -235,6 +245,7 @@ class Benchmarker:
             num_iters:  the number of times each test is run
             tags:  filters which individual measurements should be run (all tags must be present)
             remote: the remote telepath URL of a remote cortex
+            layout: the fork view layout used by the "layers" benchmarks
 
         All the benchmark methods are independent and should not have an effect (other than btree caching and size)
         on the other tests.  The only precondition is that the testdata has been loaded.
@@ -248,8 +259,39 @@ class Benchmarker:
         self.bench = bench
         self.tags = tags
 
+        if layout is None:
+            layout = Layouts['fork3few']
+
+        self.layout = layout
+        self._initLayerData()
+
+    def _initLayerData(self):
+        '''
+        Pregenerates the edits made in each fork layer of the layout
+        '''
+        ips = self.testdata.ips
+        count = max(1, int(len(ips) * self.layout['overlap']))
+
+        self.layerfeeds: List[FeedT] = []
+
+        edited = set()
+        for indx in range(1, self.layout['layers']):
+            # slide the window of edited nodes so a low overlap spreads the nodes across layers
+            start = (indx - 1) * count
+            feed: FeedT = []
+            for offs in range(start, start + count):
+                ndef = ips[offs % len(ips)][0]
+                edited.add(ndef)
+                feed.append((ndef, {'tags': {'layr': (None, None)}, 'props': {'loc': f'layr{indx}'}}))
+            self.layerfeeds.append(feed)
+
+        self.layernodes = len(edited)
+        self.topnodes = len(self.layerfeeds[-1]) if self.layerfeeds else 0
+
     def printreport(self, configname: str):
         print(f'Config {configname}: {self.coreconfig}, Num Iters: {self.num_iters} Debug: {__debug__}')
+        if any('layers' in func._tags for _, func in self._getTrialFuncs()):
+            print(f'Layout: {self.layout}')
         for name, info in self.reportdata():
             totmean = info.get('totmean')
             count = info.get('count')
@@ -321,6 +363,43 @@ class Benchmarker:
                     $lib.layer.del($layer)
                 ''', opts={'vars': {'view': self.viewiden, 'layer': layeriden}})
 
+    @contextlib.asynccontextmanager
+    async def getLayeredCortexAndProxy(self) -> AsyncIterator[Tuple[Any, Any]]:
+        '''
+        Prepares a cortex/proxy with a view of stacked fork layers for a benchmark run
+        '''
+        async with self.getCortexAndProxy() as (core, prox):
+
+            views = [self.viewiden]
+
+            try:
+                for indx, feed in enumerate(self.layerfeeds, start=1):
+                    opts = {'view': views[-1], 'vars': {'name': f'tmp fork {indx} for benchmark'}}
+                    viewiden = await prox.callStorm('return($lib.view.get().fork(name=$name).iden)', opts=opts)
+                    views.append(viewiden)
+
+                    await prox.addFeedData('syn.nodes', feed, viewiden=viewiden)
+
+                self.viewiden = views[-1]
+                self.opts = {'view': self.viewiden}
+
+                yield core, prox
+
+            finally:
+                # some benchmarks merge away the top view and its layer
+                await prox.callStorm('''
+                    for $iden in $views {
+                        try {
+                            $view = $lib.view.get($iden)
+                            $layr = $view.layers.0.iden
+                            $lib.view.del($iden)
+                            $lib.layer.del($layr)
+                        } catch NoSuchView as err {}
+                    }
+                ''', opts={'vars': {'views': views[:0:-1]}})
+
+                self.viewiden = views[0]
+
     @benchmark({'remote'})
     async def do00EmptyQuery(self, core: s_cortex.Cortex, prox: s_telepath.Proxy) -> int:
         for _ in range(self.workfactor // 10):
@@ -502,11 +581,92 @@ class Benchmarker:
         assert count == self.workfactor
         return self.workfactor
 
+    @benchmark({'layers', 'remote'})
+    async def do20LayersLiftSimple(self, core: s_cortex.Cortex, prox: s_telepath.Proxy) -> int:
+        count = await acountPodes(prox.storm('inet:ipv4', opts=self.opts))
+        assert count == self.workfactor
+        return count
+
+    @benchmark({'layers', 'remote'})
+    async def do20LayersLiftByTag(self, core: s_cortex.Cortex, prox: s_telepath.Proxy) -> int:
+        count = await acountPodes(prox.storm('inet:ipv4#layr', opts=self.opts))
+        assert count == self.layernodes
+        return count
+
+    @benchmark({'layers', 'remote'})
+    async def do20LayersLiftByProp(self, core: s_cortex.Cortex, prox: s_telepath.Proxy) -> int:
+        count = await acountPodes(prox.storm('inet:ipv4:loc', opts=self.opts))
+        assert count == self.layernodes
+        return count
+
+    @benchmark({'layers', 'remote'})
+    async def do21LayersFilter(self, core: s_cortex.Cortex, prox: s_telepath.Proxy) -> int:
+        count = await acountPodes(prox.storm('inet:ipv4 +#layr +:loc', opts=self.opts))
+        assert count == self.layernodes
+        return self.workfactor
+
+    @benchmark({'layers', 'remote'})
+    async def do21LayersPivot(self, core: s_cortex.Cortex, prox: s_telepath.Proxy) -> int:
+        count = await acountPodes(prox.storm('inet:ipv4#even -> inet:dns:a', opts=self.opts))
+        assert count == self.workfactor // 2 + self.workfactor // 10
+        return count
+
+    @benchmark({'layers', 'remote'})
+    async def do22LayersPropCount(self, core: s_cortex.Cortex, prox: s_telepath.Proxy) -> int:
+        q = '''
+            $view = $lib.view.get()
+            for $i in $lib.range($count) {
+                $view.getPropCount(inet:ipv4)
+                $view.getPropCount(inet:ipv4:loc)
+                $view.getPropCount(inet:ipv4:loc, valu=layr1)
+            }
+            return($view.getPropCount(inet:ipv4:loc))
+        '''
+        count = self.workfactor // 10
+        opts = {'view': self.viewiden, 'vars': {'count': count}}
+        # storage nodes are counted in every layer they are present in
+        assert await prox.callStorm(q, opts=opts) >= self.layernodes
+        return count * 3
+
+    @benchmark({'layers', 'remote'})
+    async def do23LayersMerge(self, core: s_cortex.Cortex, prox: s_telepath.Proxy) -> int:
+        await prox.callStorm('$lib.view.get().merge()', opts=self.opts)
+        return self.topnodes
+
+    @benchmark({'layers', 'remote'})
+    async def do23LayersMergeDiff(self, core: s_cortex.Cortex, prox: s_telepath.Proxy) -> int:
+        count = await acountPodes(prox.storm('diff | merge --apply | spin', opts=self.opts))
+        assert count == 0
+        return self.topnodes
+
+    @benchmark({'layers'})
+    async def do23LayersRunViewMerge(self, core: s_cortex.Cortex, prox: s_telepath.Proxy) -> int:
+        '''
+        Merge the top fork with the quorum based merge process
+        '''
+        view = core.getView(self.viewiden)
+        await view.parent.setViewInfo('quorum', {'count': 1, 'roles': [core.auth.allrole.iden]})
+        await view.setMergeRequest({'creator': core.auth.rootuser.iden})
+        await view.runViewMerge()
+        assert core.getView(self.viewiden) is None
+        return self.topnodes
+
+    @benchmark({'layers', 'remote'})
+    async def do24LayersMoveNodes(self, core: s_cortex.Cortex, prox: s_telepath.Proxy) -> int:
+        count = await acountPodes(prox.storm('inet:ipv4#layr | movenodes --apply | spin', opts=self.opts))
+        assert count == 0
+        return self.layernodes
+
     async def run(self, name: str, testdirn: str, coro, do_profiling=False) -> None:
         for _ in range(self.num_iters):
             # We set up the cortex each time to avoid intra-cortex caching
             # (there's still a substantial amount of OS caching)
-            async with self.getCortexAndProxy() as (core, prox):
+            if 'layers' in coro._tags:
+                ctx = self.getLayeredCortexAndProxy()
+            else:
+                ctx = self.getCortexAndProxy()
+
+            async with ctx as (core, prox):
                 gc.collect()
                 gc.disable()
 
@@ -579,6 +739,7 @@ async def benchmarkAll(confignames: List = None,
                        tags: Sequence = None,
                        remote: str = None,
                        keep: bool = False,
+                       layouts: List = None,
                        ) -> None:
 
     if jsondir:
@@ -594,12 +755,16 @@ async def benchmarkAll(confignames: List = None,
             if not confignames:
                 confignames = ['simple']
 
-            for configname in confignames:
+            if not layouts:
+                layouts = ['fork3few']
+
+            for configname, layoutname in itertools.product(confignames, layouts):
                 tick = s_common.now()
                 config = Configs[configname]
+                layout = Layouts[layoutname]
                 bencher = Benchmarker(config, testdata, workfactor, num_iters=niters, tmpdir=tmpdir, bench=bench,
-                                      tags=tags)
-                print(f'{num_procs}-process benchmarking: {configname}')
+                                      tags=tags, layout=layout)
+                print(f'{num_procs}-process benchmarking: {configname} {layoutname}')
                 initProgress(niters * len(bencher._getTrialFuncs()))
                 try:
                     await bencher.runSuite(num_procs, do_profiling=do_profiling)
@@ -622,6 +787,8 @@ async def benchmarkAll(confignames: List = None,
                                 'configname': configname,
                                 'workfactor': workfactor,
                                 'niters': niters,
+                                'layout': layout,
+                                'layoutname': layoutname,
                                 'results': bencher.reportdata()
                                 }
                         fn = f'{s_time.repr(tick, pack=True)}_{configname}.json'
@@ -650,6 +817,8 @@ def getParser():
     parser.add_argument('--do-profiling', action='store_true')
     parser.add_argument('--keep', action='store_true',
                         help='Whether to keep and use existing initial benchmark data')
+    parser.add_argument('--layout', nargs='*', default=['fork3few'], choices=sorted(Layouts),
+                        help='Fork view layouts for the "layers" benchmarks (run with --tags layers)')
     return parser
 
 if __name__ == '__main__':
@@ -673,4 +842,4 @@ if __name__ == '__main__':
     asyncio.run(benchmarkAll(opts.config, 1, opts.workfactor, opts.tmpdir,
                              jsondir=opts.jsondir, jsonprefix=opts.jsonprefix,
                              niters=opts.niters, bench=opts.bench, do_profiling=opts.do_profiling, tags=opts.tags,
-                             remote=opts.remote, keep=opts.keep))
+                             remote=opts.remote, keep=opts.keep, layouts=opts.layout))
@@ -0,0 +1,320 @@
+import sys
+import time
+import asyncio
+import logging
+import argparse
+import statistics
+import collections
+from typing import List, Dict, Tuple, Callable, Sequence
+
+import synapse.common as s_common
+import synapse.cortex as s_cortex
+
+import synapse.lib.base as s_base
+import synapse.lib.time as s_time
+import synapse.lib.spooled as s_spooled
+
+import synapse.tests.utils as s_t_utils
+
+'''
+Benchmark spooled sets and dictionaries
+
+Measures Spooled.Set and Spooled.Dict operations once they have fallen back to a
+slab, and the Storm uniq command and exportStorm() API which use them, against a
+local Cortex.
+'''
+
+logger = logging.getLogger(__name__)
+if __debug__:
+    logger.warning('Running benchmark without -O.  Performance will be slower.')
+
+s_common.setlogging(logger, 'ERROR')
+
+syntest = s_t_utils.SynTest()
+
+def benchmark(tags=None):
+
+    def _inner(meth):
+        '''
+        Mark a method as being a benchmark
+        '''
+        meth._benchmark = True
+
+        mytags = set() if tags is None else tags
+        mytags.add('all')
+
+        meth._tags = mytags
+        return meth
+
+    return _inner
+
+class SpooledBenchmarker(s_base.Base):
+    '''
+    Benchmarks spooled objects directly and through a local Cortex.
+    '''
+    async def __anit__(self, dirn: str, count=200000, size=s_spooled.MAX_SPOOL_SIZE, num_iters=3,  # type: ignore
+                       bench=None, tags=None):
+        '''
+        Args:
+            dirn: directory where to put the temporary Cortex and spooled slabs
+            count: the number of items per benchmark iteration
+            size: the number of items a spooled object holds in RAM before falling back to a slab
+            num_iters: the number of times each benchmark is run
+            bench: prefixes of the benchmarks to run
+            tags: filters which benchmarks should be run (all tags must be present)
+        '''
+        await s_base.Base.__anit__(self)
+
+        self.dirn = dirn
+        self.count = count
+        self.size = size
+        self.num_iters = num_iters
+        self.bench = bench
+        self.tags = tags
+
+        self.measurements: Dict[str, List[Tuple[float, int]]] = collections.defaultdict(list)
+
+        self.core = None
+
+    async def _getCore(self) -> s_cortex.Cortex:
+
+        if self.core is not None:
+            return self.core
+
+        conf = {'nexslog:en': False, 'layers:logedits': False}
+        self.core = await s_cortex.Cortex.anit(s_common.gendir(self.dirn, 'cortex'), conf=conf)
+        self.onfini(self.core)
+
+        await self.core.nodes('for $i in $lib.range($count) { [ inet:ipv4=$i ] }',
+                              opts={'vars': {'count': self.count}})
+
+        return self.core
+
+    async def _getSet(self) -> s_spooled.Set:
+
+        sset = await s_spooled.Set.anit(dirn=self.dirn, size=self.size)
+
+        for i in range(self.count):
+            await sset.add(i)
+
+        return sset
+
+    @benchmark({'set'})
+    async def doSetAddUnique(self) -> Tuple[float, int]:
+        '''
+        Add new items to a spooled set.
+        '''
+        async with await s_spooled.Set.anit(dirn=self.dirn, size=self.size) as sset:
+
+            start = time.perf_counter()
+            for i in range(self.count):
+                await sset.add(i)
+
+            return time.perf_counter() - start, self.count
+
+    @benchmark({'set'})
+    async def doSetAddDuplicate(self) -> Tuple[float, int]:
+        '''
+        Add items which are already present to a spooled set.
+        '''
+        async with await self._getSet() as sset:
+
+            start = time.perf_counter()
+            for i in range(self.count):
+                await sset.add(i)
+
+            return time.perf_counter() - start, self.count
+
+    @benchmark({'set'})
+    async def doSetHasMissing(self) -> Tuple[float, int]:
+        '''
+        Check for items which are not present in a spooled set.
+        '''
+        async with await self._getSet() as sset:
+
+            start = time.perf_counter()
+            found = 0
+            for i in range(self.count, self.count * 2):
+                if sset.has(i):
+                    found += 1
+
+            took = time.perf_counter() - start
+            assert found == 0
+
+            return took, self.count
+
+    @benchmark({'set'})
+    async def doSetIter(self) -> Tuple[float, int]:
+        '''
+        Iterate the items of a spooled set.
+        '''
+        async with await self._getSet() as sset:
+
+            start = time.perf_counter()
+            count = 0
+            async for _ in sset:
+                count += 1
+
+            return time.perf_counter() - start, count
+
+    @benchmark({'dict'})
+    async def doDictSetGet(self) -> Tuple[float, int]:
+        '''
+        Set and then get items in a spooled dictionary.
+        '''
+        async with await s_spooled.Dict.anit(dirn=self.dirn, size=self.size) as sdict:
+
+            start = time.perf_counter()
+            for i in range(self.count):
+                await sdict.set(i, i)
+
+            total = 0
+            for i in range(self.count):
+                total += sdict.get(i)
+
+            took = time.perf_counter() - start
+            assert total == sum(range(self.count))
+
+            return took, self.count * 2
+
+    @benchmark({'storm'})
+    async def doStormUniq(self) -> Tuple[float, int]:
+        '''
+        Lift every node twice and pipe them through the Storm uniq command.
+        '''
+        core = await self._getCore()
+
+        start = time.perf_counter()
+        count = await core.count('inet:ipv4 inet:ipv4 | uniq')
+        assert count == self.count
+
+        return time.perf_counter() - start, self.count * 2
+
+    @benchmark({'storm'})
+    async def doStormExport(self) -> Tuple[float, int]:
+        '''
+        Export every node using exportStorm().
+        '''
+        core = await self._getCore()
+
+        start = time.perf_counter()
+        count = 0
+        async for _ in core.exportStorm('inet:ipv4'):
+            count += 1
+
+        assert count == self.count
+
+        return time.perf_counter() - start, count
+
+    def _getTrialFuncs(self):
+        funcs: List[Tuple[str, Callable]] = []
+        funcnames = sorted(f for f in dir(self))
+        tags = set(self.tags) if self.tags is not None else set()
+        for funcname in funcnames:
+            func = getattr(self, funcname)
+            if not hasattr(func, '_benchmark'):
+                continue
+            if self.bench is not None:
+                if not any(funcname.startswith(b) for b in self.bench):
+                    continue
+            if not tags.issubset(func._tags):
+                continue
+            funcs.append((funcname, func))
+        return funcs
+
+    async def runSuite(self):
+
+        for funcname, func in self._getTrialFuncs():
+
+            for _ in range(self.num_iters):
+                took, count = await func()
+                self.measurements[funcname].append((took, count))
+
+            print('.', end='', flush=True)
+
+        print()
+
+    def reportdata(self):
+        retn = []
+        for name, measurements in self.measurements.items():
+            tottimes = [m[0] for m in measurements]
+            rates = [m[1] / m[0] for m in measurements]
+            retn.append((name, {'count': measurements[0][1],
+                                'tottimes': tottimes,
+                                'mean': statistics.mean(tottimes),
+                                'rate': statistics.mean(rates)}))
+        return retn
+
+    def printreport(self):
+        print(f'Count: {self.count}, Spool Size: {self.size}, Num Iters: {self.num_iters} Debug: {__debug__}')
+        for name, info in self.reportdata():
+            mean = info.get('mean')
+            rate = info.get('rate')
+            print(f'{name:24}: {mean:8.3f}s {rate:10.0f}/s')
+
+async def benchmarkAll(count: int = 200000,
+                       size: int = s_spooled.MAX_SPOOL_SIZE,
+                       niters: int = 3,
+                       tmpdir: str = None,
+                       jsondir: str = None,
+                       jsonprefix: str = None,
+                       bench=None,
+                       tags: Sequence = None,
+                       ) -> None:
+
+    if jsondir:
+        s_common.gendir(jsondir)
+
+    tick = s_common.now()
+
+    with syntest.getTestDir(startdir=tmpdir) as dirn:
+
+        async with await SpooledBenchmarker.anit(dirn, count=count, size=size, num_iters=niters, bench=bench,
+                                                 tags=tags) as bencher:
+
+            await bencher.runSuite()
+            bencher.printreport()
+
+            if jsondir:
+                data = {'time': tick,
+                        'count': count,
+                        'size': size,
+                        'niters': niters,
+                        'results': bencher.reportdata()
+                        }
+                fn = f'{s_time.repr(tick, pack=True)}_spooled.json'
+                if jsonprefix:
+                    fn = f'{jsonprefix}{fn}'
+                    data['prefix'] = jsonprefix
+                s_common.jssave(data, jsondir, fn)
+
+def getParser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=200000,
+                        help='Number of items or nodes per benchmark iteration')
+    parser.add_argument('--size', type=int, default=s_spooled.MAX_SPOOL_SIZE,
+                        help='Number of items held in RAM before the spooled objects fall back to a slab. '
+                             'The Storm benchmarks always use the default.')
+    parser.add_argument('--niters', type=int, default=3, help='Number of times to run each benchmark')
+    parser.add_argument('--tmpdir', type=str),
+    parser.add_argument('--jsondir', default=None, type=str,
+                        help='Directory to output JSON report data too.')
+    parser.add_argument('--jsonprefix', default=None, type=str,
+                        help='Prefix to append to the autogenerated filename for json output.')
+    parser.add_argument('--bench', '-b', nargs='*', default=None,
+                        help='Prefixes of which benchmarks to run (defaults to run all)')
+    parser.add_argument('--tags', '-t', nargs='*',
+                        help='Tag(s) of which benchmarks to run (set, dict, storm)')
+    return parser
+
+if __name__ == '__main__':
+
+    parser = getParser()
+    opts = parser.parse_args()
+
+    if opts.count <= s_spooled.MAX_SPOOL_SIZE:
+        print(f'Error: --count must be larger than {s_spooled.MAX_SPOOL_SIZE} for the Storm benchmarks to spool')
+        sys.exit(1)
+
+    asyncio.run(benchmarkAll(opts.count, opts.size, opts.niters, tmpdir=opts.tmpdir, jsondir=opts.jsondir,
+                             jsonprefix=opts.jsonprefix, bench=opts.bench, tags=opts.tags))
@@ -1,5 +1,6 @@
 import csv
 import json
+import time
 import asyncio
 import hashlib
 import logging
@@ -56,9 +57,8 @@ class AxonHttpUploadV1(AxonHandlerMixin, s_httpapi.StreamHandler):
 
     async def data_received(self, chunk):
         if chunk is not None:
-            await self.upfd.write(chunk)
-            self.hashset.update(chunk)
-            await asyncio.sleep(0)
+            # hash and spool the chunk in parallel threads off the ioloop
+            await asyncio.gather(self.upfd.write(chunk), s_coro.executor(self.hashset.update, chunk))
 
     def on_finish(self):
         if self.upfd is not None and not self.upfd.isfini:
@@ -298,10 +298,35 @@ class UpLoad(s_base.Base):
         self.fd = tempfile.SpooledTemporaryFile(max_size=MAX_SPOOL_SIZE, dir=dirn)
         self.size = 0
         self.sha256 = hashlib.sha256()
+
+        # executor futures which are using the spool file
+        self.fdfutus = set()
+
         self.onfini(self._uploadFini)
 
-    def _uploadFini(self):
+        self.axon.uploadmetrics['upload:active'] += 1
+
+    async def _uploadFini(self):
+
+        # the spool file may not be closed while an executor thread is using it
+        if self.fdfutus:
+            done, _ = await asyncio.wait(self.fdfutus)
+            for futu in done:
+                if not futu.cancelled():
+                    futu.exception()
+
         self.fd.close()
+        self.axon.uploadmetrics['upload:active'] -= 1
+
+    async def _execFdOper(self, func, *args):
+        # run a spool file operation in the executor and track it until it completes,
+        # even if the calling task is cancelled.
+        futu = s_coro.executor(func, *args)
+
+        self.fdfutus.add(futu)
+        futu.add_done_callback(self.fdfutus.discard)
+
+        return await asyncio.shield(futu)
 
     def _reset(self):
         if self.fd._rolled or self.fd.closed:
@@ -322,9 +347,24 @@ class UpLoad(s_base.Base):
         Args:
             byts (bytes): Bytes to write to the current Upload object.
 
+        Notes:
+            The bytes are hashed and spooled in a thread in the ioloop executor pool.
+
         Returns:
             (None): Returns None.
         '''
+        if self.isfini:
+            raise s_exc.IsFini()
+
+        tick = time.monotonic()
+
+        await self._execFdOper(self._write, byts)
+
+        metrics = self.axon.uploadmetrics
+        metrics['upload:bytes'] += len(byts)
+        metrics['upload:time'] += time.monotonic() - tick
+
+    def _write(self, byts):
         self.size += len(byts)
         self.sha256.update(byts)
         self.fd.write(byts)
@@ -343,11 +383,13 @@ class UpLoad(s_base.Base):
         sha256 = self.sha256.digest()
         rsize = self.size
 
+        self.axon.uploadmetrics['upload:count'] += 1
+
         if await self.axon.has(sha256):
             self._reset()
             return rsize, sha256
 
-        def genr():
+        async def genr():
 
             self.fd.seek(0)
 
@@ -356,7 +398,7 @@ class UpLoad(s_base.Base):
                 if self.isfini:
                     raise s_exc.IsFini()
 
-                byts = self.fd.read(CHUNK_SIZE)
+                byts = await self._execFdOper(self.fd.read, CHUNK_SIZE)
                 if not byts:
                     return
 
@@ -683,6 +725,16 @@ class AxonApi(s_cell.CellApi, s_share.Share):  # type: ignore
         await self._reqUserAllowed(('axon', 'has'))
         return await self.cell.metrics()
 
+    async def getUploadMetrics(self):
+        '''
+        Get the upload throughput metrics of the Axon.
+
+        Returns:
+            dict: A dictionary of upload metrics since the Axon was started.
+        '''
+        await self._reqUserAllowed(('axon', 'has'))
+        return await self.cell.getUploadMetrics()
+
     async def iterMpkFile(self, sha256):
         '''
         Yield items from a MsgPack (.mpk) file in the Axon.
@@ -778,6 +830,12 @@ class Axon(s_cell.Cell):
             'minimum': 1,
             'hidecmdl': True,
         },
+        'get:readahead': {
+            'default': 2,
+            'description': 'The number of blob chunks to read ahead while streaming file bytes. Set to 0 to disable.',
+            'type': 'integer',
+            'minimum': 0,
+        },
         'http:proxy': {
             'description': 'An aiohttp-socks compatible proxy URL to use in the wget API.',
             'type': 'string',
@@ -802,6 +860,13 @@ class Axon(s_cell.Cell):
 
         self.axonmetrics = await self.axonslab.getHotCount('metrics')
 
+        self.uploadmetrics = {
+            'upload:active': 0,
+            'upload:count': 0,
+            'upload:bytes': 0,
+            'upload:time': 0.0,
+        }
+
         if self.inaugural:
             self.axonmetrics.set('size:bytes', 0)
             self.axonmetrics.set('file:count', 0)
@@ -812,6 +877,7 @@ class Axon(s_cell.Cell):
 
         self.maxbytes = self.conf.get('max:bytes')
         self.maxcount = self.conf.get('max:count')
+        self.readahead = self.conf.get('get:readahead')
 
         # modularize blob storage
         await self._initBlobStor()
@@ -1032,6 +1098,10 @@ class Axon(s_cell.Cell):
 
                 await dostuff(buf)
 
+        Notes:
+            Up to ``get:readahead`` chunks are read from storage by a separate task
+            while the caller processes the previous chunks.
+
         Yields:
             bytes: Chunks of the file bytes.
 
@@ -1059,11 +1129,16 @@ class Axon(s_cell.Cell):
                 yield b''
                 return
 
-            async for byts in self._getBytsOffsSize(sha256, offs, size):
-                yield byts
+            genr = self._getBytsOffsSize(sha256, offs, size)
 
         else:
-            async for byts in self._get(sha256):
+            genr = self._get(sha256)
+
+        if self.readahead:
+            genr = s_base.schedGenr(genr, maxsize=self.readahead)
+
+        async with contextlib.aclosing(genr) as agen:
+            async for byts in agen:
                 yield byts
 
     async def _get(self, sha256):
@@ -1194,13 +1269,32 @@ class Axon(s_cell.Cell):
         '''
         return self.axonmetrics.pack()
 
+    async def getUploadMetrics(self):
+        '''
+        Get the upload throughput metrics of the Axon.
+
+        Notes:
+            The upload:rate value is the number of bytes per second written
+            to UpLoad objects while they were being hashed and spooled.
+
+        Returns:
+            dict: A dictionary of upload metrics since the Axon was started.
+        '''
+        info = dict(self.uploadmetrics)
+
+        info['upload:rate'] = 0
+        if info['upload:time']:
+            info['upload:rate'] = int(info['upload:bytes'] / info['upload:time'])
+
+        return info
+
     async def save(self, sha256, genr, size):
         '''
         Save a generator of bytes to the Axon.
 
         Args:
             sha256 (bytes): The sha256 hash of the file in bytes.
-            genr: The bytes generator function.
+            genr: The bytes generator or async generator.
 
         Returns:
             int: The size of the bytes saved.
@@ -1250,12 +1344,14 @@ class Axon(s_cell.Cell):
     async def _saveFileGenr(self, sha256, genr, size):
 
         size = 0
+        indx = 0
 
-        for i, byts in enumerate(genr):
+        async for byts in s_coro.agen(genr):
 
             size += len(byts)
-            await self._axonBytsSave(sha256, i, size, byts)
+            await self._axonBytsSave(sha256, indx, size, byts)
 
+            indx += 1
             await asyncio.sleep(0)
 
         return size
@@ -1,5 +1,6 @@
 import os
 import copy
+import time
 import regex
 import asyncio
 import logging
@@ -117,6 +118,19 @@ SYNC_LAYR_DEL = 4   # A layer was deleted
 
 MAX_NEXUS_DELTA = 3_600
 
+# default weights used to select the least-loaded Storm pool mirror
+STORM_POOL_WEIGHTS = {
+    'inflight': 1.0,  # per query running on the mirror
+    'latency': 1.0,   # per second of recent query latency
+    'lag': 0.01,      # per nexus entry the mirror is behind the leader
+}
+
+# The number of lift results to resolve storage nodes for at once in multi-layer views
+SODE_CHUNK_SIZE = 100
+
+# number of (buid, sodes) rows per chunk yielded by single layer lifts
+LIFT_CHUNK_SIZE = 256
+
 reqValidTagModel = s_config.getJsValidator({
     'type': 'object',
     'properties': {
@@ -163,6 +177,22 @@ async def wrap_liftgenr(iden, genr):
     async for indx, buid, sode in genr:
         yield iden, (indx, buid), sode
 
+async def wrap_liftrows(iden, genr):
+    '''
+    Collect the (indx, buid, sode) rows from a single layer lift into lists of (buid, sodes) rows.
+    '''
+    rows = []
+    async for _, buid, sode in genr:
+
+        rows.append((buid, [(iden, sode)]))
+
+        if len(rows) >= LIFT_CHUNK_SIZE:
+            yield rows
+            rows = []
+
+    if rows:
+        yield rows
+
 class CortexAxonMixin:
 
     async def prepare(self):
@@ -790,6 +820,17 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             'hidecmdl': True,
             'hideconf': True,
         },
+        'layers:buidcache:maxbytes': {
+            'description': 'An optional limit on the approximate size in bytes of the storage node cache in each layer.',
+            'type': 'integer',
+            'minimum': 0,
+        },
+        'layers:buidcache:size': {
+            'default': 10000,
+            'description': 'The maximum number of storage nodes cached in each layer.',
+            'type': 'integer',
+            'minimum': 0,
+        },
         'layers:lockmemory': {
             'default': False,
             'description': 'Should new layers lock memory for performance by default.',
@@ -904,6 +945,8 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         self.tagvalid = s_cache.FixedCache(self._isTagValid, size=1000)
         self.tagprune = s_cache.FixedCache(self._getTagPrune, size=1000)
 
+        self.stormparses = 0
+        self.stormparsetime = 0.0
         self.querycache = s_cache.FixedCache(self._getStormQuery, size=10000)
 
         self.stormpool = None
@@ -1620,6 +1663,21 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             await self.stormpool.fini()
             self.stormpool = None
 
+    def getStormPoolWeights(self, opts=None):
+        '''
+        Get the weights used to select the least-loaded Storm pool mirror.
+
+        Args:
+            opts (dict): Storm pool options to use instead of the current options.
+
+        Returns:
+            dict: A dictionary of inflight, latency and lag weights.
+        '''
+        if opts is None:
+            opts = self.stormpoolopts or {}
+
+        return {name: opts.get(f'weight:{name}', valu) for (name, valu) in STORM_POOL_WEIGHTS.items()}
+
     async def getStormPool(self):
         byts = self.slab.get(b'storm:pool', db='cell:conf')
         if byts is None:
@@ -2254,70 +2312,108 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
     async def _getStorNodes(self, buid, layers):
         # NOTE: This API lives here to make it easy to optimize
         #       the cluster case to minimize round trips
-        return [await layr.getStorNode(buid) for layr in layers]
+        # NOTE: The returned storage nodes are read-only
+        sodes = []
+        for layr in layers:
+            sode = layr._getStorNode(buid)
+            if sode is None:
+                sode = {}
+            sodes.append(sode)
+        return sodes
+
+    async def _genSodeLists(self, items, layers, filtercmpr=None):
+        '''
+        Resolve the storage nodes missing from a chunk of (buid, sodes) lift results.
 
-    async def _genSodeList(self, buid, sodes, layers, filtercmpr=None):
-        sodelist = []
+        Notes:
+            The missing storage nodes are retrieved in one pass per layer
+            and are not copied, so the returned sode lists are read-only.
+        '''
+        missing = {}
+        for layr in layers:
+            buids = [buid for (buid, sodes) in items if layr.iden not in sodes]
+            if buids:
+                missing[layr.iden] = dict(zip(buids, layr._getStorNodesByBuids(buids)))
+                await asyncio.sleep(0)
 
-        if filtercmpr is not None:
-            filt = True
-            for layr in layers[-1::-1]:
+        retn = []
+        for buid, sodes in items:
+
+            sodelist = []
+
+            if filtercmpr is not None:
+                filt = True
+                for layr in layers[-1::-1]:
+                    sode = sodes.get(layr.iden)
+                    if sode is None:
+                        sode = missing[layr.iden].get(buid)
+                        if sode is None:
+                            sode = {}
+                        if filt and filtercmpr(sode):
+                            break
+                    else:
+                        filt = False
+                    sodelist.append((layr.iden, sode))
+                else:
+                    retn.append((buid, sodelist[::-1]))
+
+                continue
+
+            for layr in layers:
                 sode = sodes.get(layr.iden)
                 if sode is None:
-                    sode = await layr.getStorNode(buid)
-                    if filt and filtercmpr(sode):
-                        return
-                else:
-                    filt = False
+                    sode = missing[layr.iden].get(buid)
+                    if sode is None:
+                        sode = {}
                 sodelist.append((layr.iden, sode))
 
-            return (buid, sodelist[::-1])
-
-        for layr in layers:
-            sode = sodes.get(layr.iden)
-            if sode is None:
-                sode = await layr.getStorNode(buid)
-            sodelist.append((layr.iden, sode))
+            retn.append((buid, sodelist))
 
-        return (buid, sodelist)
+        return retn
 
     async def _mergeSodes(self, layers, genrs, cmprkey, filtercmpr=None, reverse=False):
+        '''
+        Merge sorted lifts from multiple layers and yield lists of (buid, sodes) rows.
+        '''
         lastbuid = None
         sodes = {}
+        chunk = []
         async for layr, (_, buid), sode in s_common.merggenr2(genrs, cmprkey, reverse=reverse):
             if not buid == lastbuid or layr in sodes:
                 if lastbuid is not None:
-                    sodelist = await self._genSodeList(lastbuid, sodes, layers, filtercmpr)
-                    if sodelist is not None:
-                        yield sodelist
-                    sodes.clear()
+                    chunk.append((lastbuid, sodes))
+                    if len(chunk) >= SODE_CHUNK_SIZE:
+                        if rows := await self._genSodeLists(chunk, layers, filtercmpr):
+                            yield rows
+                        chunk = []
+                    sodes = {}
                 lastbuid = buid
             sodes[layr] = sode
 
         if lastbuid is not None:
-            sodelist = await self._genSodeList(lastbuid, sodes, layers, filtercmpr)
-            if sodelist is not None:
-                yield sodelist
+            chunk.append((lastbuid, sodes))
+
+        if chunk:
+            if rows := await self._genSodeLists(chunk, layers, filtercmpr):
+                yield rows
 
     async def _liftByDataName(self, name, layers):
         if len(layers) == 1:
-            layr = layers[0].iden
-            async for _, buid, sode in layers[0].liftByDataName(name):
-                yield (buid, [(layr, sode)])
+            async for rows in wrap_liftrows(layers[0].iden, layers[0].liftByDataName(name)):
+                yield rows
             return
 
         genrs = []
         for layr in layers:
             genrs.append(wrap_liftgenr(layr.iden, layr.liftByDataName(name)))
 
-        async for sodes in self._mergeSodes(layers, genrs, cmprkey_buid):
-            yield sodes
+        async for rows in self._mergeSodes(layers, genrs, cmprkey_buid):
+            yield rows
 
     async def _liftByProp(self, form, prop, layers, reverse=False):
         if len(layers) == 1:
-            layr = layers[0].iden
-            async for _, buid, sode in layers[0].liftByProp(form, prop, reverse=reverse):
-                yield (buid, [(layr, sode)])
+            async for rows in wrap_liftrows(layers[0].iden, layers[0].liftByProp(form, prop, reverse=reverse)):
+                yield rows
             return
 
         genrs = []
@@ -2330,14 +2426,13 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
             return props.get(prop) is not None
 
-        async for sodes in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse):
-            yield sodes
+        async for rows in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse):
+            yield rows
 
     async def _liftByPropValu(self, form, prop, cmprvals, layers, reverse=False):
         if len(layers) == 1:
-            layr = layers[0].iden
-            async for _, buid, sode in layers[0].liftByPropValu(form, prop, cmprvals, reverse=reverse):
-                yield (buid, [(layr, sode)])
+            async for rows in wrap_liftrows(layers[0].iden, layers[0].liftByPropValu(form, prop, cmprvals, reverse=reverse)):
+                yield rows
             return
 
         def filtercmpr(sode):
@@ -2351,14 +2446,13 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             for layr in layers:
                 genrs.append(wrap_liftgenr(layr.iden, layr.liftByPropValu(form, prop, (cval,), reverse=reverse)))
 
-            async for sodes in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse):
-                yield sodes
+            async for rows in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse):
+                yield rows
 
     async def _liftByPropArray(self, form, prop, cmprvals, layers, reverse=False):
         if len(layers) == 1:
-            layr = layers[0].iden
-            async for _, buid, sode in layers[0].liftByPropArray(form, prop, cmprvals, reverse=reverse):
-                yield (buid, [(layr, sode)])
+            async for rows in wrap_liftrows(layers[0].iden, layers[0].liftByPropArray(form, prop, cmprvals, reverse=reverse)):
+                yield rows
             return
 
         if prop is None:
@@ -2375,14 +2469,13 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             for layr in layers:
                 genrs.append(wrap_liftgenr(layr.iden, layr.liftByPropArray(form, prop, (cval,), reverse=reverse)))
 
-            async for sodes in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse):
-                yield sodes
+            async for rows in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse):
+                yield rows
 
     async def _liftByFormValu(self, form, cmprvals, layers, reverse=False):
         if len(layers) == 1:
-            layr = layers[0].iden
-            async for _, buid, sode in layers[0].liftByFormValu(form, cmprvals, reverse=reverse):
-                yield (buid, [(layr, sode)])
+            async for rows in wrap_liftrows(layers[0].iden, layers[0].liftByFormValu(form, cmprvals, reverse=reverse)):
+                yield rows
             return
 
         for cval in cmprvals:
@@ -2390,14 +2483,13 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             for layr in layers:
                 genrs.append(wrap_liftgenr(layr.iden, layr.liftByFormValu(form, (cval,), reverse=reverse)))
 
-            async for sodes in self._mergeSodes(layers, genrs, cmprkey_indx, reverse=reverse):
-                yield sodes
+            async for rows in self._mergeSodes(layers, genrs, cmprkey_indx, reverse=reverse):
+                yield rows
 
     async def _liftByTag(self, tag, form, layers, reverse=False):
         if len(layers) == 1:
-            layr = layers[0].iden
-            async for _, buid, sode in layers[0].liftByTag(tag, form, reverse=reverse):
-                yield (buid, [(layr, sode)])
+            async for rows in wrap_liftrows(layers[0].iden, layers[0].liftByTag(tag, form, reverse=reverse)):
+                yield rows
             return
 
         if form is None:
@@ -2413,14 +2505,13 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         for layr in layers:
             genrs.append(wrap_liftgenr(layr.iden, layr.liftByTag(tag, form, reverse=reverse)))
 
-        async for sodes in self._mergeSodes(layers, genrs, cmprkey_buid, filtercmpr, reverse=reverse):
-            yield sodes
+        async for rows in self._mergeSodes(layers, genrs, cmprkey_buid, filtercmpr, reverse=reverse):
+            yield rows
 
     async def _liftByTagValu(self, tag, cmpr, valu, form, layers, reverse=False):
         if len(layers) == 1:
-            layr = layers[0].iden
-            async for _, buid, sode in layers[0].liftByTagValu(tag, cmpr, valu, form, reverse=reverse):
-                yield (buid, [(layr, sode)])
+            async for rows in wrap_liftrows(layers[0].iden, layers[0].liftByTagValu(tag, cmpr, valu, form, reverse=reverse)):
+                yield rows
             return
 
         def filtercmpr(sode):
@@ -2433,14 +2524,13 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         for layr in layers:
             genrs.append(wrap_liftgenr(layr.iden, layr.liftByTagValu(tag, cmpr, valu, form, reverse=reverse)))
 
-        async for sodes in self._mergeSodes(layers, genrs, cmprkey_buid, filtercmpr, reverse=reverse):
-            yield sodes
+        async for rows in self._mergeSodes(layers, genrs, cmprkey_buid, filtercmpr, reverse=reverse):
+            yield rows
 
     async def _liftByTagProp(self, form, tag, prop, layers, reverse=False):
         if len(layers) == 1:
-            layr = layers[0].iden
-            async for _, buid, sode in layers[0].liftByTagProp(form, tag, prop, reverse=reverse):
-                yield (buid, [(layr, sode)])
+            async for rows in wrap_liftrows(layers[0].iden, layers[0].liftByTagProp(form, tag, prop, reverse=reverse)):
+                yield rows
             return
 
         genrs = []
@@ -2456,14 +2546,13 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
             return props.get(prop) is not None
 
-        async for sodes in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse):
-            yield sodes
+        async for rows in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse):
+            yield rows
 
     async def _liftByTagPropValu(self, form, tag, prop, cmprvals, layers, reverse=False):
         if len(layers) == 1:
-            layr = layers[0].iden
-            async for _, buid, sode in layers[0].liftByTagPropValu(form, tag, prop, cmprvals, reverse=reverse):
-                yield (buid, [(layr, sode)])
+            async for rows in wrap_liftrows(layers[0].iden, layers[0].liftByTagPropValu(form, tag, prop, cmprvals, reverse=reverse)):
+                yield rows
             return
 
         def filtercmpr(sode):
@@ -2480,8 +2569,8 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             for layr in layers:
                 genrs.append(wrap_liftgenr(layr.iden, layr.liftByTagPropValu(form, tag, prop, (cval,), reverse=reverse)))
 
-            async for sodes in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse):
-                yield sodes
+            async for rows in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse):
+                yield rows
 
     async def _setStormCmd(self, cdef):
         '''
@@ -3171,7 +3260,11 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             yield item
 
     async def _cortexHealth(self, health):
-        health.update('cortex', 'nominal')
+        layers = {}
+        for layr in self.layers.values():
+            layers[layr.iden] = {'buidcache': layr.buidcache.stat()}
+
+        health.update('cortex', 'nominal', data={'layers': layers})
 
     async def _migrateTaxonomyIface(self):
 
@@ -5761,7 +5854,7 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         '''
         Add nodes to the Cortex via the packed node format.
         '''
-        async for node in snap.addNodes(items):
+        async for node in snap.addNodes(items, batch=True):
             pass
 
     async def setUserLocked(self, iden, locked):
@@ -5844,7 +5937,8 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
                 mirropts['_loginfo']['pool:from'] = self.ahasvcname
 
                 try:
-                    return await proxy.count(text, opts=mirropts)
+                    with self._trackMirrorProxy(proxy):
+                        return await proxy.count(text, opts=mirropts)
 
                 except s_exc.TimeOut:
                     mesg = 'Timeout waiting for query mirror, running locally instead.'
@@ -5869,6 +5963,16 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         mirropts['nexstimeout'] = self.stormpoolopts.get('timeout:sync')
         return mirropts
 
+    @contextlib.contextmanager
+    def _trackMirrorProxy(self, proxy):
+
+        if self.stormpool is None:  # pragma: no cover
+            yield
+            return
+
+        with self.stormpool.track(proxy):
+            yield
+
     async def _getMirrorProxy(self, opts):
 
         if self.stormpool is None:  # pragma: no cover
@@ -5882,7 +5986,7 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
         try:
             timeout = self.stormpoolopts.get('timeout:connection')
-            proxy = await self.stormpool.proxy(timeout=timeout)
+            proxy = await self.stormpool.proxy(timeout=timeout, weights=self.getStormPoolWeights())
             proxyname = proxy._ahainfo.get('name')
             if proxyname is not None and proxyname == self.ahasvcname:
                 # we are part of the pool and were selected. Convert to local use.
@@ -5890,7 +5994,11 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
             curoffs = opts.setdefault('nexsoffs', await self.getNexsIndx() - 1)
             miroffs = await s_common.wait_for(proxy.getNexsIndx(), timeout) - 1
-            if (delta := curoffs - miroffs) > MAX_NEXUS_DELTA:
+
+            delta = curoffs - miroffs
+            self.stormpool.setProxyLag(proxy, delta)
+
+            if delta > MAX_NEXUS_DELTA:
                 mesg = (f'Pool mirror [{proxyname}] Nexus offset delta too large '
                         f'({delta} > {MAX_NEXUS_DELTA}), running query locally.')
                 logger.warning(mesg, extra=await self.getLogExtra(delta=delta, mirror=proxyname, mirror_offset=miroffs))
@@ -5926,8 +6034,9 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
                 mirropts['_loginfo']['pool:from'] = self.ahasvcname
 
                 try:
-                    async for mesg in proxy.storm(text, opts=mirropts):
-                        yield mesg
+                    with self._trackMirrorProxy(proxy):
+                        async for mesg in proxy.storm(text, opts=mirropts):
+                            yield mesg
                     return
 
                 except s_exc.TimeOut:
@@ -5961,7 +6070,8 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
                 mirropts['_loginfo']['pool:from'] = self.ahasvcname
 
                 try:
-                    return await proxy.callStorm(text, opts=mirropts)
+                    with self._trackMirrorProxy(proxy):
+                        return await proxy.callStorm(text, opts=mirropts)
                 except s_exc.TimeOut:
                     mesg = 'Timeout waiting for query mirror, running locally instead.'
                     logger.warning(mesg)
@@ -5991,8 +6101,9 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
                 mirropts['_loginfo']['pool:from'] = self.ahasvcname
 
                 try:
-                    async for mesg in proxy.exportStorm(text, opts=mirropts):
-                        yield mesg
+                    with self._trackMirrorProxy(proxy):
+                        async for mesg in proxy.exportStorm(text, opts=mirropts):
+                            yield mesg
                     return
 
                 except s_exc.TimeOut:
@@ -6082,8 +6193,8 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             async with await self.snap(user=user, view=view) as snap:
 
                 # feed the items directly to syn.nodes
-                async for items in q.slices(size=100):
-                    async for node in snap.addNodes(items):
+                async for items in q.slices(size=snap.nodeeditbatchsize):
+                    async for node in snap.addNodes(items, batch=True):
                         count += 1
 
                 if feedexc is not None:
@@ -6117,13 +6228,21 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         return astvalu
 
     async def _getStormQuery(self, args):
+        # NOTE: the parsed query is cached and shared by all runtimes, so it is
+        # initialized and optimized once here and must not be modified by a run.
+        tick = time.monotonic()
         try:
-            query = copy.deepcopy(await s_parser.querycache.aget(args))
+            query = await s_parser._forkedParseQuery(args)
         except s_exc.FatalErr:
             logger.exception(f'Fatal error while parsing [{args}]', extra={'synapse': {'text': args[0]}})
             await self.fini()
             raise
+        finally:
+            self.stormparses += 1
+            self.stormparsetime += time.monotonic() - tick
+
         query.init(self)
+        query.optimize()
         await asyncio.sleep(0)
         return query
 
@@ -6200,6 +6319,7 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             'version': synapse.version,
             'modeldef': self.model.getModelDefs(),
             'stormcmds': {cmd: {} for cmd in self.stormcmds.keys()},
+            'querycache': self.getStormQueryCacheInfo(),
         }
 
     async def getCoreInfoV2(self):
@@ -6207,8 +6327,21 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             'version': synapse.version,
             'modeldict': await self.getModelDict(),
             'stormdocs': await self.getStormDocs(),
+            'querycache': self.getStormQueryCacheInfo(),
         }
 
+    def getStormQueryCacheInfo(self):
+        '''
+        Get size, hit rate, and parse time information for the Storm query cache.
+
+        Returns:
+            dict: A dictionary of Storm query cache information.
+        '''
+        info = self.querycache.stat()
+        info['parses'] = self.stormparses
+        info['parsetime'] = self.stormparsetime
+        return info
+
     async def getStormDocs(self):
         '''
         Get a struct containing the Storm Types documentation.
@@ -6260,7 +6393,7 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         '''
         async with await self.snap(view=view) as snap:
             snap.strict = False
-            async for node in snap.addNodes(nodedefs):
+            async for node in snap.addNodes(nodedefs, batch=True):
                 yield node
 
     async def addFeedData(self, name, items, *, viewiden=None):
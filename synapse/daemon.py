@@ -135,13 +135,15 @@ async def t2call(link, meth, args, kwargs):
             first = True
             if isinstance(valu, types.AsyncGeneratorType):
 
-                async for item in valu:
+                async with link.txbatch():
 
-                    if first:
-                        await link.tx(('t2:genr', {}))
-                        first = False
+                    async for item in valu:
 
-                    await link.tx(('t2:yield', {'retn': (True, item)}))
+                        if first:
+                            await link.tx(('t2:genr', {}))
+                            first = False
+
+                        await link.tx(('t2:yield', {'retn': (True, item)}))
 
                 if first:
                     await link.tx(('t2:genr', {}))
@@ -151,13 +153,15 @@ async def t2call(link, meth, args, kwargs):
 
             elif isinstance(valu, types.GeneratorType):
 
-                for item in valu:
+                async with link.txbatch():
+
+                    for item in valu:
 
-                    if first:
-                        await link.tx(('t2:genr', {}))
-                        first = False
+                        if first:
+                            await link.tx(('t2:genr', {}))
+                            first = False
 
-                    await link.tx(('t2:yield', {'retn': (True, item)}))
+                        await link.tx(('t2:yield', {'retn': (True, item)}))
 
                 if first:
                     await link.tx(('t2:genr', {}))
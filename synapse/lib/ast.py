@@ -196,9 +196,17 @@ class Query(AstNode):
 
     async def run(self, runt, genr):
 
+        profiler = runt.profiler
+
         async with contextlib.AsyncExitStack() as stack:
+
+            if profiler is not None:
+                genr = await stack.enter_async_context(contextlib.aclosing(profiler.wrap(runt, self, genr)))
+
             for oper in self.kids:
                 genr = await stack.enter_async_context(contextlib.aclosing(oper.run(runt, genr)))
+                if profiler is not None:
+                    genr = await stack.enter_async_context(contextlib.aclosing(profiler.wrap(runt, oper, genr)))
 
             async for node, path in genr:
                 runt.tick()
@@ -208,7 +216,6 @@ class Query(AstNode):
 
         count = 0
 
-        self.optimize()
         self.validate(runt)
 
         # turtles all the way down...
@@ -1822,45 +1829,122 @@ class LiftProp(LiftOper):
         # check if we can optimize a form lift
         if prop.isform:
 
-            async for hint in self.getRightHints(runt, path):
-                if hint[0] == 'tag':
-                    tagname = hint[1].get('name')
-                    async for node in runt.snap.nodesByTag(tagname, form=prop.full, reverse=self.reverse):
-                        yield node
-                    return
+            hints = [h async for h in self.getRightHints(runt, path) if h[0] in ('tag', 'relprop')]
+            if hints:
 
-                if hint[0] == 'relprop':
-                    relpropname = hint[1].get('name')
-                    isuniv = hint[1].get('univ')
+                hint = hints[0]
+                if len(hints) > 1 and runt.getOpt('lift:optimize', True):
+                    hint = await self._getCheapestHint(runt, prop, hints)
 
-                    if isuniv:
-                        fullname = ''.join([prop.full, relpropname])
-                    else:
-                        fullname = ':'.join([prop.full, relpropname])
+                async for node in self._liftByHint(runt, prop, hint):
+                    yield node
+                return
 
-                    prop = runt.model.prop(fullname)
-                    if prop is None:
-                        return
+        async for node in runt.snap.nodesByProp(prop.full, reverse=self.reverse):
+            yield node
 
-                    cmpr = hint[1].get('cmpr')
-                    valu = hint[1].get('valu')
+    def _getHintPropName(self, prop, hint):
+        relpropname = hint[1].get('name')
+        if hint[1].get('univ'):
+            return ''.join([prop.full, relpropname])
+        return ':'.join([prop.full, relpropname])
 
-                    if cmpr is not None and valu is not None:
-                        try:
-                            # try lifting by valu but no guarantee a cmpr is available
-                            async for node in runt.snap.nodesByPropValu(fullname, cmpr, valu, reverse=self.reverse):
-                                yield node
-                            return
-                        except asyncio.CancelledError:  # pragma: no cover
-                            raise
-                        except:
-                            pass
-
-                    async for node in runt.snap.nodesByProp(fullname, reverse=self.reverse):
-                        yield node
-                    return
+    async def _getHintCost(self, runt, form, hint, maxsize=None):
+        '''
+        Estimate the number of rows a lift by the given hint would visit
+        using the index counters of the layers in the current view.
+        '''
+        layers = runt.snap.view.layers
 
-        async for node in runt.snap.nodesByProp(prop.full, reverse=self.reverse):
+        if hint[0] == 'tag':
+            tagname = hint[1].get('name')
+            count = 0
+            for layr in layers:
+                count += await layr.getTagCount(tagname, formname=form.name)
+            return count
+
+        prop = runt.model.prop(self._getHintPropName(form, hint))
+        if prop is None:
+            return 0
+
+        formname = form.name
+        propname = prop.name
+
+        norm = s_common.novalu
+        if hint[1].get('cmpr') == '=' and hint[1].get('valu') is not None:
+            try:
+                norm, info = prop.type.norm(hint[1].get('valu'))
+            except s_exc.SynErr:
+                pass
+
+        count = 0
+        for layr in layers:
+
+            if norm is not s_common.novalu:
+                count += layr.getPropValuCount(formname, propname, prop.type.stortype, norm)
+            else:
+                remain = None
+                if maxsize is not None:
+                    remain = max(maxsize - count, 1)
+                count += await layr.getPropCount(formname, propname, maxsize=remain)
+
+            if maxsize is not None and count >= maxsize:
+                break
+
+        return count
+
+    async def _getCheapestHint(self, runt, form, hints):
+
+        best = None
+        bestcost = None
+
+        for hint in hints:
+
+            if hint[0] == 'relprop' and runt.model.prop(self._getHintPropName(form, hint)) is None:
+                # preserve the behavior of lifting nothing for an invalid property
+                return hint
+
+            cost = await self._getHintCost(runt, form, hint, maxsize=bestcost)
+            if bestcost is None or cost < bestcost:
+                best = hint
+                bestcost = cost
+
+            await asyncio.sleep(0)
+
+        if runt.debug:
+            await runt.printf(f'Lifting {form.full} by {best[0]} {best[1].get("name")} (estimated rows: {bestcost})')
+
+        return best
+
+    async def _liftByHint(self, runt, form, hint):
+
+        if hint[0] == 'tag':
+            tagname = hint[1].get('name')
+            async for node in runt.snap.nodesByTag(tagname, form=form.full, reverse=self.reverse):
+                yield node
+            return
+
+        fullname = self._getHintPropName(form, hint)
+
+        prop = runt.model.prop(fullname)
+        if prop is None:
+            return
+
+        cmpr = hint[1].get('cmpr')
+        valu = hint[1].get('valu')
+
+        if cmpr is not None and valu is not None:
+            try:
+                # try lifting by valu but no guarantee a cmpr is available
+                async for node in runt.snap.nodesByPropValu(fullname, cmpr, valu, reverse=self.reverse):
+                    yield node
+                return
+            except asyncio.CancelledError:  # pragma: no cover
+                raise
+            except:
+                pass
+
+        async for node in runt.snap.nodesByProp(fullname, reverse=self.reverse):
             yield node
 
     async def getRightHints(self, runt, path):
@@ -2876,8 +2960,8 @@ class AndCond(Cond):
     '''
     async def getLiftHints(self, runt, path):
         h0 = await self.kids[0].getLiftHints(runt, path)
-        h1 = await self.kids[0].getLiftHints(runt, path)
-        return h0 + h1
+        h1 = await self.kids[1].getLiftHints(runt, path)
+        return list(h0) + list(h1)
 
     async def getCondEval(self, runt):
 
@@ -45,9 +45,23 @@ class FixedCache:
         self.cache = {}
         self.fifo = collections.deque()
 
+        self.hits = 0
+        self.misses = 0
+
     def __len__(self):
         return len(self.cache)
 
+    def stat(self):
+        '''
+        Return a dictionary of cache size and effectiveness metrics.
+        '''
+        return {
+            'size': len(self.cache),
+            'maxsize': self.size,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
     def pop(self, key):
         val = self.cache.pop(key, s_common.novalu)
         if val is s_common.novalu:
@@ -70,8 +84,10 @@ class FixedCache:
 
         valu = self.cache.get(key, s_common.novalu)
         if valu is not s_common.novalu:
+            self.hits += 1
             return valu
 
+        self.misses += 1
         valu = self.callback(key)
         if valu is s_common.novalu:
             return valu
@@ -85,8 +101,10 @@ class FixedCache:
 
         valu = self.cache.get(key, s_common.novalu)
         if valu is not s_common.novalu:
+            self.hits += 1
             return valu
 
+        self.misses += 1
         valu = await self.callback(key)
         if valu is s_common.novalu:
             return valu
@@ -101,12 +119,23 @@ class FixedCache:
 class LruDict(collections.abc.MutableMapping):
     '''
     Maintains the last n accessed keys
+
+    Args:
+        size (int): The maximum number of entries to keep.
+        maxbytes (int): An optional limit on the total size of the entries added using put().
     '''
-    def __init__(self, size=10000):
+    def __init__(self, size=10000, maxbytes=None):
         self.data = collections.OrderedDict()
+        self.sizes = {}
         self.maxsize = size
+        self.maxbytes = maxbytes
+        self.cursize = 0
         self.disabled = not self.maxsize
 
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
     def __getitem__(self, key):
         valu = self.data.__getitem__(key)
         self.data.move_to_end(key)
@@ -116,18 +145,62 @@ class LruDict(collections.abc.MutableMapping):
         '''
         Note:  we override default impl from parent to avoid costly KeyError
         '''
-        valu = self.data.get(key, default)
-        if key in self.data:
-            self.data.move_to_end(key)
+        valu = self.data.get(key, s_common.novalu)
+        if valu is s_common.novalu:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self.data.move_to_end(key)
         return valu
 
     def __setitem__(self, key, valu):
+        self.put(key, valu)
+
+    def put(self, key, valu, size=0):
+        '''
+        Add an entry to the cache which counts size bytes towards maxbytes.
+        '''
         if self.disabled:
             return
+
         self.data[key] = valu
         self.data.move_to_end(key)
-        if len(self.data) > self.maxsize:
-            self.data.popitem(last=False)
+
+        self.cursize += size - self.sizes.get(key, 0)
+        self.sizes[key] = size
+
+        self._trim()
+
+    def _trim(self):
+        while len(self.data) > self.maxsize or (self.maxbytes is not None and self.cursize > self.maxbytes):
+            key, _ = self.data.popitem(last=False)
+            self.cursize -= self.sizes.pop(key, 0)
+            self.evictions += 1
+
+    def resize(self, size, maxbytes=None):
+        '''
+        Change the limits of the cache, evicting entries as needed.
+        '''
+        self.maxsize = size
+        self.maxbytes = maxbytes
+        self.disabled = not self.maxsize
+
+        self._trim()
+
+    def stat(self):
+        '''
+        Return a dictionary of cache size and effectiveness metrics.
+        '''
+        return {
+            'size': len(self.data),
+            'maxsize': self.maxsize,
+            'bytes': self.cursize,
+            'maxbytes': self.maxbytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
 
     def __delitem__(self, key):
         '''
@@ -135,6 +208,20 @@ class LruDict(collections.abc.MutableMapping):
         '''
         if key in self.data:
             del self.data[key]
+            self.cursize -= self.sizes.pop(key, 0)
+
+    def pop(self, key, default=s_common.novalu):
+        valu = self.data.pop(key, default)
+        if valu is s_common.novalu:
+            raise KeyError(key)
+
+        self.cursize -= self.sizes.pop(key, 0)
+        return valu
+
+    def clear(self):
+        self.data.clear()
+        self.sizes.clear()
+        self.cursize = 0
 
     def __len__(self):
         return len(self.data)
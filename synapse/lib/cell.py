@@ -307,6 +307,16 @@ class CellApi(s_base.Base):
     async def getMirrorUrls(self):
         return await self.cell.getMirrorUrls()
 
+    @adminapi()
+    async def getMirrorStatus(self):
+        '''
+        Get the catch-up progress of the mirror loop.
+
+        Returns:
+            dict: A dictionary of mirror sync status or None if the cell is not a mirror.
+        '''
+        return await self.cell.getMirrorStatus()
+
     @adminapi(log=True)
     async def cullNexsLog(self, offs):
         '''
@@ -770,18 +780,24 @@ class CellApi(s_base.Base):
             yield item
 
     @adminapi()
-    async def runBackup(self, name=None, wait=True):
+    async def getNexusChunks(self, offs, size=1000, tellready=False):
+        async for item in self.cell.getNexusChunks(offs, size=size, tellready=tellready):
+            yield item
+
+    @adminapi()
+    async def runBackup(self, name=None, wait=True, base=None):
         '''
         Run a new backup.
 
         Args:
             name (str): The optional name of the backup.
             wait (bool): On True, wait for backup to complete before returning.
+            base (str): The optional name of a previous backup to create an incremental backup from.
 
         Returns:
             str: The name of the newly created backup.
         '''
-        return await self.cell.runBackup(name=name, wait=wait)
+        return await self.cell.runBackup(name=name, wait=wait, base=base)
 
     @adminapi()
     async def getBackupInfo(self):
@@ -839,7 +855,7 @@ class CellApi(s_base.Base):
             yield
 
     @adminapi()
-    async def iterNewBackupArchive(self, name=None, remove=False):
+    async def iterNewBackupArchive(self, name=None, remove=False, base=None):
         '''
         Run a new backup and return it as a compressed stream of bytes.
 
@@ -848,8 +864,9 @@ class CellApi(s_base.Base):
         Args:
             name (str): The name of the backup to retrieve.
             remove (bool): Delete the backup after streaming.
+            base (str): The optional name of a previous backup to create an incremental backup from.
         '''
-        await self.cell.iterNewBackupArchive(user=self.user, name=name, remove=remove)
+        await self.cell.iterNewBackupArchive(user=self.user, name=name, remove=remove, base=base)
 
         # Make this a generator
         if False:  # pragma: no cover
@@ -2386,6 +2403,10 @@ class Cell(s_nexus.Pusher, s_telepath.Aware):
         async for item in self.nexsroot.iter(offs, tellready=tellready):
             yield item
 
+    async def getNexusChunks(self, offs, size=1000, tellready=False):
+        async for item in self.nexsroot.iterChunks(offs, size=size, tellready=tellready):
+            yield item
+
     def _reqBackDirn(self, name):
 
         self._reqBackConf()
@@ -2412,7 +2433,7 @@ class Cell(s_nexus.Pusher, s_telepath.Aware):
                     f'({disk.free} bytes free, {reqspace} required)'
             raise s_exc.LowSpace(mesg=mesg, dirn=self.backdirn)
 
-    async def runBackup(self, name=None, wait=True):
+    async def runBackup(self, name=None, wait=True, base=None):
 
         if self.backuprunning:
             raise s_exc.BackupAlreadyRunning(mesg='Another backup is already running')
@@ -2430,6 +2451,13 @@ class Cell(s_nexus.Pusher, s_telepath.Aware):
                 mesg = 'Backup with name already exists'
                 raise s_exc.BadArg(mesg=mesg)
 
+            basepath = None
+            if base is not None:
+                basepath = self._reqBackDirn(base)
+                if s_t_backup.getBackupManifest(basepath) is None:
+                    mesg = f'Backup {base} does not exist or can not be used as the base of an incremental backup.'
+                    raise s_exc.BadArg(mesg=mesg, name=base)
+
             self._reqBackupSpace()
 
             self.backuprunning = True
@@ -2437,7 +2465,7 @@ class Cell(s_nexus.Pusher, s_telepath.Aware):
             self.backmonostart = time.monotonic()
             self.backstartdt = backupstartdt
 
-            task = self.schedCoro(self._execBackupTask(path))
+            task = self.schedCoro(self._execBackupTask(path, basedirn=basepath))
 
             def done(self, task):
                 try:
@@ -2498,11 +2526,14 @@ class Cell(s_nexus.Pusher, s_telepath.Aware):
 
         return retn
 
-    async def _execBackupTask(self, dirn):
+    async def _execBackupTask(self, dirn, basedirn=None):
         '''
         A task that backs up the cell to the target directory
         '''
-        logger.info(f'Starting backup to [{dirn}]')
+        if basedirn is None:
+            logger.info(f'Starting backup to [{dirn}]')
+        else:
+            logger.info(f'Starting incremental backup to [{dirn}] from [{basedirn}]')
 
         await self.boss.promote('backup', self.auth.rootuser)
         slabs = s_lmdbslab.Slab.getSlabsInDir(self.dirn)
@@ -2532,7 +2563,7 @@ class Cell(s_nexus.Pusher, s_telepath.Aware):
                 dstdir = s_common.gendir(dirn)
                 shutil.copy(os.path.join(self.dirn, 'cell.guid'), os.path.join(dstdir, 'cell.guid'))
 
-                args = (child_pipe, self.dirn, dirn, paths, logconf)
+                args = (child_pipe, self.dirn, dirn, paths, logconf, basedirn)
 
                 def waitforproc1():
                     nonlocal proc
@@ -2566,7 +2597,7 @@ class Cell(s_nexus.Pusher, s_telepath.Aware):
                 proc.terminate()
 
     @staticmethod
-    def _backupProc(pipe, srcdir, dstdir, lmdbpaths, logconf):
+    def _backupProc(pipe, srcdir, dstdir, lmdbpaths, logconf, basedir=None):
         '''
         (In a separate process) Actually do the backup
         '''
@@ -2577,7 +2608,7 @@ class Cell(s_nexus.Pusher, s_telepath.Aware):
             with s_t_backup.capturelmdbs(srcdir) as lmdbinfo:
                 pipe.send('captured')
                 logger.debug('Acquired LMDB transactions')
-                s_t_backup.txnbackup(lmdbinfo, srcdir, dstdir)
+                s_t_backup.txnbackup(lmdbinfo, srcdir, dstdir, basedir=basedir)
         except Exception:
             logger.exception(f'Error running backup of {srcdir}')
             raise
@@ -2598,6 +2629,23 @@ class Cell(s_nexus.Pusher, s_telepath.Aware):
         if not os.path.isfile(cellguid):
             mesg = 'Specified backup path has no cell.guid file.'
             raise s_exc.BadArg(mesg=mesg)
+
+        for other in await self.getBackups():
+
+            othrpath = self._reqBackDirn(other)
+            if othrpath == path:
+                continue
+
+            mani = s_t_backup.getBackupManifest(othrpath)
+            if mani is None:
+                continue
+
+            for info in mani.get('lmdbs', {}).values():
+                frompath = info.get('from')
+                if frompath is not None and os.path.normpath(os.path.join(othrpath, frompath)) == path:
+                    mesg = f'Backup {name} is required by the incremental backup {other}.'
+                    raise s_exc.BadArg(mesg=mesg, name=name)
+
         logger.info(f'Removing backup for [{path}]')
         await s_coro.executor(shutil.rmtree, path, ignore_errors=True)
         logger.info(f'Backup removed from [{path}]')
@@ -2679,7 +2727,7 @@ class Cell(s_nexus.Pusher, s_telepath.Aware):
             logger.log(loglevel, f'iterBackupArchive completed {phrase} for {name}')
             raise s_exc.DmonSpawn(mesg=mesg)
 
-    async def iterNewBackupArchive(self, user, name=None, remove=False):
+    async def iterNewBackupArchive(self, user, name=None, remove=False, base=None):
 
         if self.backupstreaming:
             raise s_exc.BackupAlreadyRunning(mesg='Another streaming backup is already running')
@@ -2704,7 +2752,7 @@ class Cell(s_nexus.Pusher, s_telepath.Aware):
             linkinfo['logconf'] = await self._getSpawnLogConf()
 
             try:
-                await self.runBackup(name)
+                await self.runBackup(name, base=base)
             except Exception:
                 if remove:
                     logger.debug(f'Removing {path}')
@@ -4197,6 +4245,9 @@ class Cell(s_nexus.Pusher, s_telepath.Aware):
 
         logger.warning(f'Bootstrap mirror from: {murl} DONE!')
 
+    async def getMirrorStatus(self):
+        return await self.nexsroot.getMirrorStatus()
+
     async def getMirrorUrls(self):
         if self.ahaclient is None:
             raise s_exc.BadConfValu(mesg='Enumerating mirror URLs is only supported when AHA is configured')
@@ -4545,6 +4596,7 @@ class Cell(s_nexus.Pusher, s_telepath.Aware):
             'features': {
                 'tellready': True,
                 'dynmirror': True,
+                'nexschunks': True,
             },
         }
         return ret
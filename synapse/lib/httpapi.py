@@ -6,16 +6,23 @@ import logging
 from urllib.parse import urlparse
 
 import tornado.web as t_web
+import tornado.iostream as t_iostream
 import tornado.websocket as t_websocket
 
 import synapse.exc as s_exc
 import synapse.common as s_common
 
 import synapse.lib.base as s_base
+import synapse.lib.const as s_const
 import synapse.lib.msgpack as s_msgpack
 
 logger = logging.getLogger(__name__)
 
+# the max bytes of streamed output to buffer before flushing
+streambufsize = 256 * s_const.kibibyte
+# the max seconds buffered output may wait for more items before a flush
+streamflushdelay = 0.05
+
 class Sess(s_base.Base):
 
     async def __anit__(self, cell, iden, info):
@@ -484,6 +491,80 @@ class StormHandler(Handler):
         # a reference to the cortex is returned from the handler.
         return self.cell
 
+    def getStreamEncoder(self, stream):
+        '''
+        Return a (func, batch) tuple for the requested stream format.
+
+        Only self delimiting formats may batch multiple items per flush.
+        '''
+        if stream == 'msgpack':
+            self.set_header('Content-Type', 'application/x-msgpack')
+            return s_msgpack.en, True
+
+        if stream == 'jsonlines':
+            return lambda item: json.dumps(item).encode() + b'\n', True
+
+        return lambda item: json.dumps(item).encode(), False
+
+    async def writeStream(self, genr, func, batch=True):
+        '''
+        Write the encoded items from an async generator to the response.
+
+        The generator is consumed by the handler task. When batching, encoded
+        items are buffered until streambufsize bytes are pending or the oldest
+        pending item has waited streamflushdelay seconds. Waiting on the size
+        based flush applies backpressure to the generator.
+        '''
+        size = 0
+        timer = None
+        closed = None
+
+        async def flush():
+            nonlocal closed
+            try:
+                await self.flush()
+            except t_iostream.StreamClosedError as e:
+                closed = e
+
+        def flushsoon():
+            nonlocal size, timer
+            timer = None
+            size = 0
+            self.cell.schedCoro(flush())
+
+        try:
+
+            async for item in genr:
+
+                # the client went away during a delayed flush
+                if closed is not None:
+                    raise closed
+
+                byts = func(item)
+                self.write(byts)
+
+                if batch:
+
+                    size += len(byts)
+                    if size < streambufsize:
+                        if timer is None:
+                            timer = asyncio.get_running_loop().call_later(streamflushdelay, flushsoon)
+                        continue
+
+                if timer is not None:
+                    timer.cancel()
+                    timer = None
+
+                size = 0
+                await self.flush()
+
+        finally:
+            if timer is not None:
+                timer.cancel()
+
+        if size:
+            await self.flush()
+
 class StormNodesV1(StormHandler):
 
     async def post(self):
@@ -501,7 +582,6 @@ class StormNodesV1(StormHandler):
         opts = body.get('opts')
         query = body.get('query')
         stream = body.get('stream')
-        jsonlines = stream == 'jsonlines'
 
         opts = await self._reqValidOpts(opts)
         if opts is None:
@@ -512,11 +592,8 @@ class StormNodesV1(StormHandler):
         taskinfo = {'query': query, 'view': view.iden}
         await self.cell.boss.promote('storm', user=user, info=taskinfo)
 
-        async for pode in view.iterStormPodes(query, opts=opts):
-            self.write(json.dumps(pode))
-            if jsonlines:
-                self.write("\n")
-            await self.flush()
+        func, batch = self.getStreamEncoder(stream)
+        await self.writeStream(view.iterStormPodes(query, opts=opts), func, batch=batch)
 
 class StormV1(StormHandler):
 
@@ -535,7 +612,6 @@ class StormV1(StormHandler):
         opts = body.get('opts')
         query = body.get('query')
         stream = body.get('stream')
-        jsonlines = stream == 'jsonlines'
 
         # Maintain backwards compatibility with 0.1.x output
         opts = await self._reqValidOpts(opts)
@@ -544,11 +620,8 @@ class StormV1(StormHandler):
 
         opts.setdefault('editformat', 'nodeedits')
 
-        async for mesg in self.getCore().storm(query, opts=opts):
-            self.write(json.dumps(mesg))
-            if jsonlines:
-                self.write("\n")
-            await self.flush()
+        func, batch = self.getStreamEncoder(stream)
+        await self.writeStream(self.getCore().storm(query, opts=opts), func, batch=batch)
 
 class StormCallV1(StormHandler):
 
@@ -607,9 +680,7 @@ class StormExportV1(StormHandler):
 
         try:
             self.set_header('Content-Type', 'application/x-synapse-nodes')
-            async for pode in self.getCore().exportStorm(query, opts=opts):
-                self.write(s_msgpack.en(pode))
-                await self.flush()
+            await self.writeStream(self.getCore().exportStorm(query, opts=opts), s_msgpack.en)
 
         except Exception as e:
             return self.sendRestExc(e)
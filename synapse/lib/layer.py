@@ -100,6 +100,8 @@ reqValidLdef = s_config.getJsValidator({
         'created': {'type': 'integer', 'minimum': 0},
         'lockmemory': {'type': 'boolean'},
         'lmdb:growsize': {'type': 'integer'},
+        'buidcache:size': {'type': 'integer', 'minimum': 0},
+        'buidcache:maxbytes': {'type': 'integer', 'minimum': 0},
         'logedits': {'type': 'boolean', 'default': True},
         'name': {'type': 'string'},
         'readonly': {'type': 'boolean', 'default': False},
@@ -436,6 +438,30 @@ class IndxByTagProp(IndxBy):
         if valu is not None:
             return valu[0]
 
+def copySode(sode):
+    '''
+    Return a copy of a storage node which may be safely modified.
+
+    Notes:
+        The values within a storage node are not modified in place, so only
+        the dictionaries which make up the storage node need to be copied.
+    '''
+    retn = collections.defaultdict(dict, sode)
+
+    if (props := sode.get('props')) is not None:
+        retn['props'] = props.copy()
+
+    if (tags := sode.get('tags')) is not None:
+        retn['tags'] = tags.copy()
+
+    if (tagprops := sode.get('tagprops')) is not None:
+        retn['tagprops'] = {tag: tprops.copy() for (tag, tprops) in tagprops.items()}
+
+    if (nodedata := sode.get('nodedata')) is not None:
+        retn['nodedata'] = nodedata.copy()
+
+    return retn
+
 class StorType:
 
     def __init__(self, layr, stortype):
@@ -1505,7 +1531,7 @@ class Layer(s_nexus.Pusher):
         self.windows = []
         self.upstreamwaits = collections.defaultdict(lambda: collections.defaultdict(list))
 
-        self.buidcache = s_cache.LruDict(BUID_CACHE_SIZE)
+        self.buidcache = s_cache.LruDict(*self._getBuidCacheSize())
 
         self.onfini(self._onLayrFini)
 
@@ -1519,6 +1545,18 @@ class Layer(s_nexus.Pusher):
         # this must be last!
         self.readonly = layrinfo.get('readonly')
 
+    def _getBuidCacheSize(self):
+
+        size = self.layrinfo.get('buidcache:size')
+        if size is None:
+            size = self.core.conf.get('layers:buidcache:size', BUID_CACHE_SIZE)
+
+        maxbytes = self.layrinfo.get('buidcache:maxbytes')
+        if maxbytes is None:
+            maxbytes = self.core.conf.get('layers:buidcache:maxbytes')
+
+        return size, maxbytes
+
     def _reqNotReadOnly(self):
         if self.readonly and not self.core.migration:
             mesg = f'Layer {self.iden} is read only!'
@@ -1640,7 +1678,8 @@ class Layer(s_nexus.Pusher):
     def _testDelTagIndx(self, buid, form, tag):
         formabrv = self.setPropAbrv(form, None)
         tagabrv = self.tagabrv.bytsToAbrv(tag.encode())
-        self.layrslab.delete(tagabrv + formabrv, buid, db=self.bytag)
+        if self.layrslab.delete(tagabrv + formabrv, buid, db=self.bytag):
+            self.tagcounts.inc(tagabrv, valu=-1)
 
     def _testDelPropIndx(self, buid, form, prop):
         sode = self._getStorNode(buid)
@@ -1648,20 +1687,21 @@ class Layer(s_nexus.Pusher):
 
         abrv = self.setPropAbrv(form, prop)
         for indx in self.stortypes[stortype].indx(storvalu):
-            self.layrslab.delete(abrv + indx, buid, db=self.byprop)
+            if self.layrslab.delete(abrv + indx, buid, db=self.byprop):
+                self.propcounts.inc(abrv, valu=-1)
 
     def _testDelTagStor(self, buid, form, tag):
-        sode = self._getStorNode(buid)
+        sode = self._genStorNode(buid)
         sode['tags'].pop(tag, None)
         self.setSodeDirty(buid, sode, form)
 
     def _testDelPropStor(self, buid, form, prop):
-        sode = self._getStorNode(buid)
+        sode = self._genStorNode(buid)
         sode['props'].pop(prop, None)
         self.setSodeDirty(buid, sode, form)
 
     def _testDelFormValuStor(self, buid, form):
-        sode = self._getStorNode(buid)
+        sode = self._genStorNode(buid)
         sode['valu'] = None
         self.setSodeDirty(buid, sode, form)
 
@@ -1669,18 +1709,21 @@ class Layer(s_nexus.Pusher):
         modlprop = self.core.model.prop(f'{form}:{prop}')
         abrv = self.setPropAbrv(form, prop)
         for indx in self.stortypes[modlprop.type.stortype].indx(valu):
-            self.layrslab.put(abrv + indx, buid, db=self.byprop)
+            if self.layrslab.put(abrv + indx, buid, db=self.byprop):
+                self.propcounts.inc(abrv)
 
     def _testAddPropArrayIndx(self, buid, form, prop, valu):
         modlprop = self.core.model.prop(f'{form}:{prop}')
         abrv = self.setPropAbrv(form, prop)
         for indx in self.getStorIndx(modlprop.type.stortype, valu):
-            self.layrslab.put(abrv + indx, buid, db=self.byarray)
+            if self.layrslab.put(abrv + indx, buid, db=self.byarray):
+                self.arraycounts.inc(abrv)
 
     def _testAddTagIndx(self, buid, form, tag):
         formabrv = self.setPropAbrv(form, None)
         tagabrv = self.tagabrv.bytsToAbrv(tag.encode())
-        self.layrslab.put(tagabrv + formabrv, buid, db=self.bytag)
+        if self.layrslab.put(tagabrv + formabrv, buid, db=self.bytag):
+            self.tagcounts.inc(tagabrv)
 
     def _testAddTagPropIndx(self, buid, form, tag, prop, valu):
         tpabrv = self.setTagPropAbrv(None, tag, prop)
@@ -1688,8 +1731,10 @@ class Layer(s_nexus.Pusher):
 
         tagprop = self.core.model.tagprop(prop)
         for indx in self.stortypes[tagprop.type.stortype].indx(valu):
-            self.layrslab.put(tpabrv + indx, buid, db=self.bytagprop)
-            self.layrslab.put(ftpabrv + indx, buid, db=self.bytagprop)
+            if self.layrslab.put(tpabrv + indx, buid, db=self.bytagprop):
+                self.tagpropcounts.inc(tpabrv)
+            if self.layrslab.put(ftpabrv + indx, buid, db=self.bytagprop):
+                self.tagpropcounts.inc(ftpabrv)
 
     async def verify(self, config=None):
 
@@ -1809,7 +1854,8 @@ class Layer(s_nexus.Pusher):
                 sode['tags'][tag] = (None, None)
                 self.setSodeDirty(buid, sode, form)
             elif autofix == 'index':
-                self.layrslab.delete(lkey, buid, db=self.bytag)
+                if self.layrslab.delete(lkey, buid, db=self.bytag):
+                    self.tagcounts.inc(lkey[:8], valu=-1)
 
         for lkey, buid in self.layrslab.scanByPref(tagabrv, db=self.bytag):
 
@@ -1835,7 +1881,8 @@ class Layer(s_nexus.Pusher):
 
         async def tryfix(lkey, buid):
             if autofix == 'index':
-                self.layrslab.delete(lkey, buid, db=self.byprop)
+                if self.layrslab.delete(lkey, buid, db=self.byprop):
+                    self.propcounts.inc(lkey[:8], valu=-1)
 
         for lkey, buid in self.layrslab.scanByPref(abrv, db=self.byprop):
 
@@ -1892,7 +1939,8 @@ class Layer(s_nexus.Pusher):
 
         async def tryfix(lkey, buid):
             if autofix == 'index':
-                self.layrslab.delete(lkey, buid, db=self.byarray)
+                if self.layrslab.delete(lkey, buid, db=self.byarray):
+                    self.arraycounts.inc(lkey[:8], valu=-1)
 
         for lkey, buid in self.layrslab.scanByPref(abrv, db=self.byarray):
 
@@ -1951,7 +1999,8 @@ class Layer(s_nexus.Pusher):
 
         async def tryfix(lkey, buid):
             if autofix == 'index':
-                self.layrslab.delete(lkey, buid, db=self.bytagprop)
+                if self.layrslab.delete(lkey, buid, db=self.bytagprop):
+                    self.tagpropcounts.inc(lkey[:8], valu=-1)
 
         for lkey, buid in self.layrslab.scanByPref(abrv, db=self.bytagprop):
 
@@ -2673,6 +2722,28 @@ class Layer(s_nexus.Pusher):
 
         logger.warning('...complete!')
 
+    async def _layrV11toV12(self):
+
+        logger.warning(f'Adding index counters to layer {self.iden}')
+
+        async def backfill(abrv, counts, db):
+
+            abrvs = list(self.layrslab.scanKeys(db=abrv.abrv2name))
+            for byts in abrvs:
+                count = await self.layrslab.countByPref(byts, db=db)
+                if count:
+                    counts.set(byts, count)
+
+        await backfill(self.tagabrv, self.tagcounts, self.bytag)
+        await backfill(self.propabrv, self.propcounts, self.byprop)
+        await backfill(self.propabrv, self.arraycounts, self.byarray)
+        await backfill(self.tagpropabrv, self.tagpropcounts, self.bytagprop)
+
+        self.meta.set('version', 12)
+        self.layrvers = 12
+
+        logger.warning('...complete!')
+
     async def _initSlabs(self, slabopts):
 
         otherslabopts = {
@@ -2692,6 +2763,12 @@ class Layer(s_nexus.Pusher):
 
         self.formcounts = await self.layrslab.getHotCount('count:forms')
 
+        # index row counts by prop/tag/tagprop abbreviation
+        self.tagcounts = await self.layrslab.getHotAbrvCount('count:tags')
+        self.propcounts = await self.layrslab.getHotAbrvCount('count:props')
+        self.arraycounts = await self.layrslab.getHotAbrvCount('count:arrays')
+        self.tagpropcounts = await self.layrslab.getHotAbrvCount('count:tagprops')
+
         nodeeditpath = s_common.genpath(self.dirn, 'nodeedits.lmdb')
         self.nodeeditslab = await s_lmdbslab.Slab.anit(nodeeditpath, **otherslabopts)
 
@@ -2734,7 +2811,7 @@ class Layer(s_nexus.Pusher):
         await self._initSlabs(slabopts)
 
         if self.fresh:
-            self.meta.set('version', 11)
+            self.meta.set('version', 12)
 
         self.layrslab.addResizeCallback(self.core.checkFreeSpace)
         self.dataslab.addResizeCallback(self.core.checkFreeSpace)
@@ -2772,8 +2849,11 @@ class Layer(s_nexus.Pusher):
         if self.layrvers < 11:
             await self._layrV10toV11()
 
-        if self.layrvers != 11:
-            mesg = f'Got layer version {self.layrvers}.  Expected 11.  Accidental downgrade?'
+        if self.layrvers < 12:
+            await self._layrV11toV12()
+
+        if self.layrvers != 12:
+            mesg = f'Got layer version {self.layrvers}.  Expected 12.  Accidental downgrade?'
             raise s_exc.BadStorageVersion(mesg=mesg)
 
     async def getLayerSize(self):
@@ -2786,6 +2866,12 @@ class Layer(s_nexus.Pusher):
     async def setLayerInfo(self, name, valu):
         if name != 'readonly':
             self._reqNotReadOnly()
+
+        if name in ('buidcache:size', 'buidcache:maxbytes'):
+            if valu is not None and (not isinstance(valu, int) or valu < 0):
+                mesg = f'{name} must be a non-negative integer or None.'
+                raise s_exc.BadArg(mesg=mesg, name=name, valu=valu)
+
         return await self._push('layer:set', name, valu)
 
     @s_nexus.Pusher.onPush('layer:set')
@@ -2793,7 +2879,7 @@ class Layer(s_nexus.Pusher):
         '''
         Set a mutable layer property.
         '''
-        if name not in ('name', 'desc', 'logedits', 'readonly'):
+        if name not in ('name', 'desc', 'logedits', 'readonly', 'buidcache:size', 'buidcache:maxbytes'):
             mesg = f'{name} is not a valid layer info key'
             raise s_exc.BadOptValu(mesg=mesg)
 
@@ -2810,6 +2896,9 @@ class Layer(s_nexus.Pusher):
         else:
             self.layrinfo[name] = valu
 
+        if name in ('buidcache:size', 'buidcache:maxbytes'):
+            self.buidcache.resize(*self._getBuidCacheSize())
+
         self.core.layerdefs.set(self.iden, self.layrinfo)
 
         await self.core.feedBeholder('layer:set', {'iden': self.iden, 'name': name, 'valu': valu}, gates=[self.iden])
@@ -2817,6 +2906,7 @@ class Layer(s_nexus.Pusher):
 
     async def stat(self):
         ret = {**self.layrslab.statinfo(),
+               'buidcache': self.buidcache.stat(),
                }
         if self.logedits:
             ret['nodeeditlog_indx'] = (self.nodeeditlog.index(), 0, 0)
@@ -2897,8 +2987,9 @@ class Layer(s_nexus.Pusher):
         kvlist = []
 
         for buid, sode in self.dirty.items():
-            self.buidcache[buid] = sode
-            kvlist.append((buid, s_msgpack.en(sode)))
+            byts = s_msgpack.en(sode)
+            self.buidcache.put(buid, sode, size=len(byts))
+            kvlist.append((buid, byts))
 
         self.layrslab._putmulti(kvlist, db=self.bybuidv3)
         self.dirty.clear()
@@ -2910,16 +3001,17 @@ class Layer(s_nexus.Pusher):
     async def getStorNode(self, buid):
         sode = self._getStorNode(buid)
         if sode is not None:
-            return deepcopy(sode)
+            return copySode(sode)
         return {}
 
     def _getStorNode(self, buid):
         '''
         Return the storage node for the given buid.
 
-        NOTE: This API returns the *actual* storage node dict if it's
-              dirty. You must make a deep copy if you plan to return it
-              outside of the Layer.
+        NOTE: This API returns the *actual* storage node dict. Storage nodes
+              are copy-on-write, so the dict will not be modified by future
+              edits, but it must be copied before it is modified or returned
+              outside of the Cortex.
         '''
 
         # check the dirty nodes first
@@ -2937,21 +3029,64 @@ class Layer(s_nexus.Pusher):
 
         sode = collections.defaultdict(dict)
         sode.update(s_msgpack.un(byts))
-        self.buidcache[buid] = sode
+        self.buidcache.put(buid, sode, size=len(byts))
 
         return sode
 
+    def _getStorNodesByBuids(self, buids):
+        '''
+        Return a list of storage nodes (or None) for the given list of buids.
+
+        NOTE: This API returns the *actual* storage node dicts. The caller
+              must not modify them or return them outside of the Cortex.
+        '''
+        sodes = []
+        todo = []
+
+        for buid in buids:
+
+            sode = self.dirty.get(buid)
+            if sode is None:
+                sode = self.buidcache.get(buid)
+                if sode is None:
+                    todo.append(len(sodes))
+
+            sodes.append(sode)
+
+        if not todo:
+            return sodes
+
+        loaded = {}
+
+        bytslist = self.layrslab.getmulti([buids[indx] for indx in todo], db=self.bybuidv3)
+        for indx, byts in zip(todo, bytslist):
+
+            if byts is None:
+                continue
+
+            buid = buids[indx]
+
+            # the same buid may be present more than once
+            sode = loaded.get(buid)
+            if sode is None:
+                sode = collections.defaultdict(dict)
+                sode.update(s_msgpack.un(byts))
+                self.buidcache.put(buid, sode, size=len(byts))
+                loaded[buid] = sode
+
+            sodes[indx] = sode
+
+        return sodes
+
     def _genStorNode(self, buid):
-        # get or create the storage node. this returns the *actual* storage node
+        # get or create a copy of the storage node to edit. the copy
+        # replaces the current storage node once it is set dirty.
 
         sode = self._getStorNode(buid)
         if sode is not None:
-            return sode
-
-        sode = collections.defaultdict(dict)
-        self.buidcache[buid] = sode
+            return copySode(sode)
 
-        return sode
+        return collections.defaultdict(dict)
 
     async def getTagCount(self, tagname, formname=None):
         '''
@@ -2966,7 +3101,7 @@ class Layer(s_nexus.Pusher):
         except s_exc.NoSuchAbrv:
             return 0
 
-        return await self.layrslab.countByPref(abrv, db=self.bytag)
+        return self.tagcounts.get(abrv)
 
     async def getPropCount(self, formname, propname=None, maxsize=None):
         '''
@@ -2977,7 +3112,11 @@ class Layer(s_nexus.Pusher):
         except s_exc.NoSuchAbrv:
             return 0
 
-        return await self.layrslab.countByPref(abrv, db=self.byprop, maxsize=maxsize)
+        count = self.propcounts.get(abrv)
+        if maxsize is not None:
+            return min(count, maxsize)
+
+        return count
 
     def getPropValuCount(self, formname, propname, stortype, valu):
         try:
@@ -3003,7 +3142,7 @@ class Layer(s_nexus.Pusher):
         except s_exc.NoSuchAbrv:
             return 0
 
-        return await self.layrslab.countByPref(abrv, db=self.byarray)
+        return self.arraycounts.get(abrv)
 
     def getPropArrayValuCount(self, formname, propname, stortype, valu):
         try:
@@ -3026,7 +3165,11 @@ class Layer(s_nexus.Pusher):
         except s_exc.NoSuchAbrv:
             return 0
 
-        return await self.layrslab.countByPref(abrv, db=self.byprop, maxsize=maxsize)
+        count = self.propcounts.get(abrv)
+        if maxsize is not None:
+            return min(count, maxsize)
+
+        return count
 
     async def getTagPropCount(self, form, tag, prop):
         '''
@@ -3037,7 +3180,7 @@ class Layer(s_nexus.Pusher):
         except s_exc.NoSuchAbrv:
             return 0
 
-        return await self.layrslab.countByPref(abrv, db=self.bytagprop)
+        return self.tagpropcounts.get(abrv)
 
     def getTagPropValuCount(self, form, tag, prop, stortype, valu):
         try:
@@ -3114,7 +3257,7 @@ class Layer(s_nexus.Pusher):
                 # logger.warning(f'TagIndex for #{tag} has {s_common.ehex(buid)} but no storage node.')
                 continue
 
-            yield None, buid, deepcopy(sode)
+            yield None, buid, sode
 
     async def liftByTags(self, tags):
         # todo: support form and reverse kwargs
@@ -3143,7 +3286,7 @@ class Layer(s_nexus.Pusher):
             if sode is None: # pragma: no cover
                 continue
 
-            yield None, buid, deepcopy(sode)
+            yield None, buid, sode
 
     async def liftByTagValu(self, tag, cmpr, valu, form=None, reverse=False):
 
@@ -3172,7 +3315,7 @@ class Layer(s_nexus.Pusher):
                 if sode is None: # pragma: no cover
                     # logger.warning(f'TagValuIndex for #{tag} has {s_common.ehex(buid)} but no storage node.')
                     continue
-                yield None, buid, deepcopy(sode)
+                yield None, buid, sode
 
     async def hasTagProp(self, name):
         async for _ in self.liftTagProp(name):
@@ -3222,7 +3365,7 @@ class Layer(s_nexus.Pusher):
                 # logger.warning(f'TagPropIndex for {form}#{tag}:{prop} has {s_common.ehex(buid)} but no storage node.')
                 continue
 
-            yield lkey[8:], buid, deepcopy(sode)
+            yield lkey[8:], buid, sode
 
     async def liftByTagPropValu(self, form, tag, prop, cmprvals, reverse=False):
         '''
@@ -3237,7 +3380,7 @@ class Layer(s_nexus.Pusher):
                     # logger.warning(f'TagPropValuIndex for {form}#{tag}:{prop} has {s_common.ehex(buid)} but no storage node.')
                     continue
 
-                yield lkey[8:], buid, deepcopy(sode)
+                yield lkey[8:], buid, sode
 
     async def liftByProp(self, form, prop, reverse=False):
 
@@ -3257,7 +3400,7 @@ class Layer(s_nexus.Pusher):
             if sode is None: # pragma: no cover
                 # logger.warning(f'PropIndex for {form}:{prop} has {s_common.ehex(buid)} but no storage node.')
                 continue
-            yield lkey[8:], buid, deepcopy(sode)
+            yield lkey[8:], buid, sode
 
     # NOTE: form vs prop valu lifting is differentiated to allow merge sort
     async def liftByFormValu(self, form, cmprvals, reverse=False):
@@ -3271,7 +3414,7 @@ class Layer(s_nexus.Pusher):
                 if sode is None: # pragma: no cover
                     # logger.warning(f'FormValuIndex for {form} has {s_common.ehex(buid)} but no storage node.')
                     continue
-                yield lkey[8:], buid, deepcopy(sode)
+                yield lkey[8:], buid, sode
 
     async def liftByPropValu(self, form, prop, cmprvals, reverse=False):
         for cmpr, valu, kind in cmprvals:
@@ -3286,7 +3429,7 @@ class Layer(s_nexus.Pusher):
                     # logger.warning(f'PropValuIndex for {form}:{prop} has {s_common.ehex(buid)} but no storage node.')
                     continue
 
-                yield lkey[8:], buid, deepcopy(sode)
+                yield lkey[8:], buid, sode
 
     async def liftByPropArray(self, form, prop, cmprvals, reverse=False):
         for cmpr, valu, kind in cmprvals:
@@ -3295,7 +3438,7 @@ class Layer(s_nexus.Pusher):
                 if sode is None: # pragma: no cover
                     # logger.warning(f'PropArrayIndex for {form}:{prop} has {s_common.ehex(buid)} but no storage node.')
                     continue
-                yield lkey[8:], buid, deepcopy(sode)
+                yield lkey[8:], buid, sode
 
     async def liftByDataName(self, name):
         try:
@@ -3311,7 +3454,7 @@ class Layer(s_nexus.Pusher):
                 # logger.warning(f'PropArrayIndex for {form}:{prop} has {s_common.ehex(buid)} but no storage node.')
                 continue
 
-            sode = deepcopy(sode)
+            sode = copySode(sode)
 
             byts = self.dataslab.get(buid + abrv, db=self.nodedata)
             if byts is None:
@@ -3338,7 +3481,9 @@ class Layer(s_nexus.Pusher):
 
         retn = []
         for buid, _, edits in changes:
-            sode = await self.getStorNode(buid)
+            sode = self._getStorNode(buid)
+            if sode is None:
+                sode = {}
             retn.append((buid, sode, edits))
 
         return saveoff, changes, retn
@@ -3402,6 +3547,11 @@ class Layer(s_nexus.Pusher):
 
                 changes.extend(delt)
 
+                # once set dirty the storage node may be read while we yield,
+                # so the remaining edits are made to another copy.
+                if self.dirty.get(buid) is sode:
+                    sode = copySode(sode)
+
                 await asyncio.sleep(0)
 
             flatedit = results.get(buid)
@@ -3486,16 +3636,19 @@ class Layer(s_nexus.Pusher):
         if stortype & STOR_FLAG_ARRAY:
 
             for indx in self.getStorIndx(stortype, valu):
-                self.layrslab.put(abrv + indx, buid, db=self.byarray)
+                if self.layrslab.put(abrv + indx, buid, db=self.byarray):
+                    self.arraycounts.inc(abrv)
                 await asyncio.sleep(0)
 
             for indx in self.getStorIndx(STOR_TYPE_MSGP, valu):
-                self.layrslab.put(abrv + indx, buid, db=self.byprop)
+                if self.layrslab.put(abrv + indx, buid, db=self.byprop):
+                    self.propcounts.inc(abrv)
 
         else:
 
             for indx in self.getStorIndx(stortype, valu):
-                self.layrslab.put(abrv + indx, buid, db=self.byprop)
+                if self.layrslab.put(abrv + indx, buid, db=self.byprop):
+                    self.propcounts.inc(abrv)
 
         self.formcounts.inc(form)
         if self.nodeAddHook is not None:
@@ -3528,16 +3681,19 @@ class Layer(s_nexus.Pusher):
         if stortype & STOR_FLAG_ARRAY:
 
             for indx in self.getStorIndx(stortype, valu):
-                self.layrslab.delete(abrv + indx, buid, db=self.byarray)
+                if self.layrslab.delete(abrv + indx, buid, db=self.byarray):
+                    self.arraycounts.inc(abrv, valu=-1)
                 await asyncio.sleep(0)
 
             for indx in self.getStorIndx(STOR_TYPE_MSGP, valu):
-                self.layrslab.delete(abrv + indx, buid, db=self.byprop)
+                if self.layrslab.delete(abrv + indx, buid, db=self.byprop):
+                    self.propcounts.inc(abrv, valu=-1)
 
         else:
 
             for indx in self.getStorIndx(stortype, valu):
-                self.layrslab.delete(abrv + indx, buid, db=self.byprop)
+                if self.layrslab.delete(abrv + indx, buid, db=self.byprop):
+                    self.propcounts.inc(abrv, valu=-1)
 
         self.formcounts.inc(form, valu=-1)
         if self.nodeDelHook is not None:
@@ -3590,9 +3746,11 @@ class Layer(s_nexus.Pusher):
                 realtype = oldt & 0x7fff
 
                 for oldi in self.getStorIndx(oldt, oldv):
-                    self.layrslab.delete(abrv + oldi, buid, db=self.byarray)
+                    if self.layrslab.delete(abrv + oldi, buid, db=self.byarray):
+                        self.arraycounts.inc(abrv, valu=-1)
                     if univabrv is not None:
-                        self.layrslab.delete(univabrv + oldi, buid, db=self.byarray)
+                        if self.layrslab.delete(univabrv + oldi, buid, db=self.byarray):
+                            self.arraycounts.inc(univabrv, valu=-1)
 
                     if realtype == STOR_TYPE_NDEF:
                         self.layrslab.delete(oldi, buid + abrv, db=self.byndef)
@@ -3600,16 +3758,20 @@ class Layer(s_nexus.Pusher):
                     await asyncio.sleep(0)
 
                 for indx in self.getStorIndx(STOR_TYPE_MSGP, oldv):
-                    self.layrslab.delete(abrv + indx, buid, db=self.byprop)
+                    if self.layrslab.delete(abrv + indx, buid, db=self.byprop):
+                        self.propcounts.inc(abrv, valu=-1)
                     if univabrv is not None:
-                        self.layrslab.delete(univabrv + indx, buid, db=self.byprop)
+                        if self.layrslab.delete(univabrv + indx, buid, db=self.byprop):
+                            self.propcounts.inc(univabrv, valu=-1)
 
             else:
 
                 for oldi in self.getStorIndx(oldt, oldv):
-                    self.layrslab.delete(abrv + oldi, buid, db=self.byprop)
+                    if self.layrslab.delete(abrv + oldi, buid, db=self.byprop):
+                        self.propcounts.inc(abrv, valu=-1)
                     if univabrv is not None:
-                        self.layrslab.delete(univabrv + oldi, buid, db=self.byprop)
+                        if self.layrslab.delete(univabrv + oldi, buid, db=self.byprop):
+                            self.propcounts.inc(univabrv, valu=-1)
 
                     if oldt == STOR_TYPE_NDEF:
                         self.layrslab.delete(oldi, buid + abrv, db=self.byndef)
@@ -3626,9 +3788,11 @@ class Layer(s_nexus.Pusher):
             realtype = stortype & 0x7fff
 
             for indx in self.getStorIndx(stortype, valu):
-                self.layrslab.put(abrv + indx, buid, db=self.byarray)
+                if self.layrslab.put(abrv + indx, buid, db=self.byarray):
+                    self.arraycounts.inc(abrv)
                 if univabrv is not None:
-                    self.layrslab.put(univabrv + indx, buid, db=self.byarray)
+                    if self.layrslab.put(univabrv + indx, buid, db=self.byarray):
+                        self.arraycounts.inc(univabrv)
 
                 if realtype == STOR_TYPE_NDEF:
                     self.layrslab.put(indx, buid + abrv, db=self.byndef)
@@ -3636,16 +3800,20 @@ class Layer(s_nexus.Pusher):
                 await asyncio.sleep(0)
 
             for indx in self.getStorIndx(STOR_TYPE_MSGP, valu):
-                self.layrslab.put(abrv + indx, buid, db=self.byprop)
+                if self.layrslab.put(abrv + indx, buid, db=self.byprop):
+                    self.propcounts.inc(abrv)
                 if univabrv is not None:
-                    self.layrslab.put(univabrv + indx, buid, db=self.byprop)
+                    if self.layrslab.put(univabrv + indx, buid, db=self.byprop):
+                        self.propcounts.inc(univabrv)
 
         else:
 
             for indx in self.getStorIndx(stortype, valu):
-                self.layrslab.put(abrv + indx, buid, db=self.byprop)
+                if self.layrslab.put(abrv + indx, buid, db=self.byprop):
+                    self.propcounts.inc(abrv)
                 if univabrv is not None:
-                    self.layrslab.put(univabrv + indx, buid, db=self.byprop)
+                    if self.layrslab.put(univabrv + indx, buid, db=self.byprop):
+                        self.propcounts.inc(univabrv)
 
                 if stortype == STOR_TYPE_NDEF:
                     self.layrslab.put(indx, buid + abrv, db=self.byndef)
@@ -3677,9 +3845,11 @@ class Layer(s_nexus.Pusher):
 
             for aval in valu:
                 for indx in self.getStorIndx(realtype, aval):
-                    self.layrslab.delete(abrv + indx, buid, db=self.byarray)
+                    if self.layrslab.delete(abrv + indx, buid, db=self.byarray):
+                        self.arraycounts.inc(abrv, valu=-1)
                     if univabrv is not None:
-                        self.layrslab.delete(univabrv + indx, buid, db=self.byarray)
+                        if self.layrslab.delete(univabrv + indx, buid, db=self.byarray):
+                            self.arraycounts.inc(univabrv, valu=-1)
 
                     if realtype == STOR_TYPE_NDEF:
                         self.layrslab.delete(indx, buid + abrv, db=self.byndef)
@@ -3687,16 +3857,20 @@ class Layer(s_nexus.Pusher):
                 await asyncio.sleep(0)
 
             for indx in self.getStorIndx(STOR_TYPE_MSGP, valu):
-                self.layrslab.delete(abrv + indx, buid, db=self.byprop)
+                if self.layrslab.delete(abrv + indx, buid, db=self.byprop):
+                    self.propcounts.inc(abrv, valu=-1)
                 if univabrv is not None:
-                    self.layrslab.delete(univabrv + indx, buid, db=self.byprop)
+                    if self.layrslab.delete(univabrv + indx, buid, db=self.byprop):
+                        self.propcounts.inc(univabrv, valu=-1)
 
         else:
 
             for indx in self.getStorIndx(stortype, valu):
-                self.layrslab.delete(abrv + indx, buid, db=self.byprop)
+                if self.layrslab.delete(abrv + indx, buid, db=self.byprop):
+                    self.propcounts.inc(abrv, valu=-1)
                 if univabrv is not None:
-                    self.layrslab.delete(univabrv + indx, buid, db=self.byprop)
+                    if self.layrslab.delete(univabrv + indx, buid, db=self.byprop):
+                        self.propcounts.inc(univabrv, valu=-1)
 
                 if stortype == STOR_TYPE_NDEF:
                     self.layrslab.delete(indx, buid + abrv, db=self.byndef)
@@ -3737,7 +3911,8 @@ class Layer(s_nexus.Pusher):
         sode['tags'][tag] = valu
         self.setSodeDirty(buid, sode, form)
 
-        self.layrslab.put(tagabrv + formabrv, buid, db=self.bytag)
+        if self.layrslab.put(tagabrv + formabrv, buid, db=self.bytag):
+            self.tagcounts.inc(tagabrv)
 
         return (
             (EDIT_TAG_SET, (tag, valu, oldv), ()),
@@ -3758,7 +3933,8 @@ class Layer(s_nexus.Pusher):
 
         tagabrv = self.tagabrv.bytsToAbrv(tag.encode())
 
-        self.layrslab.delete(tagabrv + formabrv, buid, db=self.bytag)
+        if self.layrslab.delete(tagabrv + formabrv, buid, db=self.bytag):
+            self.tagcounts.inc(tagabrv, valu=-1)
 
         self.mayDelBuid(buid, sode)
         return (
@@ -3794,8 +3970,10 @@ class Layer(s_nexus.Pusher):
                     return ()
 
                 for oldi in self.getStorIndx(oldt, oldv):
-                    self.layrslab.delete(tp_abrv + oldi, buid, db=self.bytagprop)
-                    self.layrslab.delete(ftp_abrv + oldi, buid, db=self.bytagprop)
+                    if self.layrslab.delete(tp_abrv + oldi, buid, db=self.bytagprop):
+                        self.tagpropcounts.inc(tp_abrv, valu=-1)
+                    if self.layrslab.delete(ftp_abrv + oldi, buid, db=self.bytagprop):
+                        self.tagpropcounts.inc(ftp_abrv, valu=-1)
 
         if sode.get('form') is None:
             formabrv = self.setPropAbrv(form, None)
@@ -3806,12 +3984,11 @@ class Layer(s_nexus.Pusher):
         sode['tagprops'][tag][prop] = (valu, stortype)
         self.setSodeDirty(buid, sode, form)
 
-        kvpairs = []
         for indx in self.getStorIndx(stortype, valu):
-            kvpairs.append((tp_abrv + indx, buid))
-            kvpairs.append((ftp_abrv + indx, buid))
-
-        await self.layrslab.putmulti(kvpairs, db=self.bytagprop)
+            if self.layrslab.put(tp_abrv + indx, buid, db=self.bytagprop):
+                self.tagpropcounts.inc(tp_abrv)
+            if self.layrslab.put(ftp_abrv + indx, buid, db=self.bytagprop):
+                self.tagpropcounts.inc(ftp_abrv)
 
         return (
             (EDIT_TAGPROP_SET, (tag, prop, valu, oldv, stortype), ()),
@@ -3838,8 +4015,10 @@ class Layer(s_nexus.Pusher):
         ftp_abrv = self.setTagPropAbrv(form, tag, prop)
 
         for oldi in self.getStorIndx(oldt, oldv):
-            self.layrslab.delete(tp_abrv + oldi, buid, db=self.bytagprop)
-            self.layrslab.delete(ftp_abrv + oldi, buid, db=self.bytagprop)
+            if self.layrslab.delete(tp_abrv + oldi, buid, db=self.bytagprop):
+                self.tagpropcounts.inc(tp_abrv, valu=-1)
+            if self.layrslab.delete(ftp_abrv + oldi, buid, db=self.bytagprop):
+                self.tagpropcounts.inc(ftp_abrv, valu=-1)
 
         self.mayDelBuid(buid, sode)
         return (
@@ -4342,13 +4521,24 @@ class Layer(s_nexus.Pusher):
                                 perm = perm_tags + key
                                 user.confirm(perm, gateiden=gateiden)
 
-    async def iterLayerNodeEdits(self):
+    async def iterLayerNodeEdits(self, lastbuid=None):
         '''
         Scan the full layer and yield artificial sets of nodeedits.
+
+        Args:
+            lastbuid (bytes): If specified, only yield nodeedits for buids which sort after this buid.
         '''
         await self._saveDirtySodes()
 
-        for buid, byts in self.layrslab.scanByFull(db=self.bybuidv3):
+        if lastbuid is None:
+            genr = self.layrslab.scanByFull(db=self.bybuidv3)
+        else:
+            genr = self.layrslab.scanByRange(lastbuid, db=self.bybuidv3)
+
+        for buid, byts in genr:
+
+            if buid == lastbuid:
+                continue
 
             sode = s_msgpack.un(byts)
 
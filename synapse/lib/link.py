@@ -1,6 +1,7 @@
 import socket
 import asyncio
 import logging
+import contextlib
 import collections
 
 import cryptography.x509 as c_x509
@@ -17,6 +18,11 @@ import synapse.lib.msgpack as s_msgpack
 
 readsize = 10 * s_const.megabyte
 
+# buffered messages within a txbatch() are written once this size is reached
+txbufsize = 256 * s_const.kibibyte
+# ... or once they have been buffered for this many seconds
+txbatchdelay = 0.01
+
 async def connect(host, port, ssl=None, hostname=None, linkinfo=None):
     '''
     Async connect and return a Link().
@@ -111,6 +117,11 @@ class Link(s_base.Base):
 
         self.rxqu = collections.deque()
 
+        self.txbuf = []
+        self.txsize = 0
+        self.txbatching = False
+        self.txtimer = None
+
         self.sock = self.writer.get_extra_info('socket')
         self.peercert = self.writer.get_extra_info('peercert')
 
@@ -159,6 +170,7 @@ class Link(s_base.Base):
         self.unpk = s_msgpack.Unpk()
 
         async def fini():
+            self._txflush()
             self.writer.close()
             if self._forceclose:
                 self.reader._transport.abort()
@@ -220,6 +232,7 @@ class Link(s_base.Base):
             self.schedCoro(relay(link0))
 
         else:
+            self._txflush()
             sock = self.reader._transport._sock
 
         return {
@@ -234,6 +247,7 @@ class Link(s_base.Base):
         return dict(self._addrinfo)
 
     async def send(self, byts):
+        self._txflush()
         self.writer.write(byts)
         # Avoid Python bug.  See https://github.com/python/cpython/issues/74116
         # TODO Remove drain lock in 3.10+
@@ -243,6 +257,8 @@ class Link(s_base.Base):
     async def tx(self, mesg):
         '''
         Async transmit routine which will wait for writer drain().
+
+        Within a txbatch() context, messages are buffered and written together.
         '''
         if self.isfini:
             raise s_exc.IsFini()
@@ -250,7 +266,20 @@ class Link(s_base.Base):
         byts = s_msgpack.en(mesg)
         try:
 
-            self.writer.write(byts)
+            if self.txbatching:
+
+                self.txbuf.append(byts)
+                self.txsize += len(byts)
+
+                if self.txsize < txbufsize:
+                    if self.txtimer is None:
+                        self.txtimer = self.loop.call_later(txbatchdelay, self._txflushsoon)
+                    return
+
+                byts = None
+
+            self._txflush(byts)
+
             # Avoid Python bug.  See https://github.com/python/cpython/issues/74116
             # TODO Remove drain lock in 3.10+
             async with self._drain_lock:
@@ -265,7 +294,77 @@ class Link(s_base.Base):
 
             raise
 
+    @contextlib.asynccontextmanager
+    async def txbatch(self):
+        '''
+        Coalesce the messages sent with tx() within the context into larger writes.
+
+        Buffered messages are written once txbufsize bytes are buffered, when
+        txbatchdelay seconds have passed since the first buffered message, and
+        when the context exits.
+
+        Example:
+
+            async with link.txbatch():
+                for mesg in mesgs:
+                    await link.tx(mesg)
+        '''
+        if self.txbatching:
+            yield
+            return
+
+        self.txbatching = True
+
+        try:
+            yield
+
+        finally:
+            self.txbatching = False
+            if not self.isfini:
+                self._txflush()
+
+        if self.isfini:
+            return
+
+        try:
+            async with self._drain_lock:
+                await self.writer.drain()
+
+        except (asyncio.CancelledError, Exception) as e:
+
+            await self.fini()
+
+            einfo = s_common.retnexc(e)
+            logger.debug('link.txbatch connection trouble %s', einfo)
+
+            raise
+
+    def _txflushsoon(self):
+        self.txtimer = None
+        if not self.isfini:
+            self._txflush()
+
+    def _txflush(self, byts=None):
+
+        if self.txtimer is not None:
+            self.txtimer.cancel()
+            self.txtimer = None
+
+        if self.txbuf:
+
+            if byts is not None:
+                self.txbuf.append(byts)
+
+            byts = b''.join(self.txbuf)
+
+            self.txbuf.clear()
+            self.txsize = 0
+
+        if byts is not None:
+            self.writer.write(byts)
+
     def txfini(self):
+        self._txflush()
         self.sock.shutdown(1)
 
     async def recv(self, size):
@@ -299,8 +398,7 @@ class Link(s_base.Base):
                     await self.fini()
                     return None
 
-                for _, mesg in self.feed(byts):
-                    self.rxqu.append(mesg)
+                self.rxqu.extend(self.unpk.feeditems(byts))
 
             except asyncio.CancelledError:
                 await self.fini()
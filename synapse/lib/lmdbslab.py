@@ -444,6 +444,30 @@ class HotCount(HotKeyVal):
     def get(self, name: str, defv=0):
         return self.cache.get(name.encode(), defv)
 
+class HotAbrvCount(HotCount):
+    '''
+    Like HotCount, but keyed by abbreviation bytes rather than names.
+    '''
+    def inc(self, abrv: bytes, valu=1):
+        self.cache[abrv] += valu
+        self.dirty.add(abrv)
+
+    def set(self, abrv: bytes, valu):
+        self.cache[abrv] = valu
+        self.dirty.add(abrv)
+        self.slab.dirty = True
+
+    def get(self, abrv: bytes, defv=0):
+        return self.cache.get(abrv, defv)
+
+    def delete(self, abrv: bytes):
+        self.cache.pop(abrv, None)
+        self.dirty.discard(abrv)
+        self.slab.delete(abrv, db=self.db)
+
+    def pack(self):
+        return dict(self.cache)
+
 class MultiQueue(s_base.Base):
     '''
     Allows creation/consumption of multiple durable queues in a slab.
@@ -978,6 +1002,11 @@ class Slab(s_base.Base):
         self.onfini(item)
         return item
 
+    async def getHotAbrvCount(self, name):
+        item = await HotAbrvCount.anit(self, name)
+        self.onfini(item)
+        return item
+
     def getSeqn(self, name):
         return s_slabseqn.SlabSeqn(self, name)
 
@@ -1301,6 +1330,22 @@ class Slab(s_base.Base):
         finally:
             self._relXactForReading()
 
+    def getmulti(self, lkeys, db=None):
+        '''
+        Return a list of values (or None) for the given keys in a single pass.
+
+        Notes:
+            The keys are retrieved in sorted order using a single cursor.
+        '''
+        self._acqXactForReading()
+        realdb, dupsort = self.dbnames[db]
+        try:
+            with self.xact.cursor(db=realdb) as curs:
+                vals = dict(curs.getmulti(sorted(set(lkeys))))
+            return [vals.get(lkey) for lkey in lkeys]
+        finally:
+            self._relXactForReading()
+
     def last(self, db=None):
         '''
         Return the last key/value pair from the given db.
@@ -225,6 +225,23 @@ class Unpk:
 
         return retn
 
+    def feeditems(self, byts):
+        '''
+        Feed bytes to the unpacker and return completed objects without their sizes.
+
+        Args:
+            byts (bytes): Bytes to unpack.
+
+        Returns:
+            list: List of the unpacked items.
+        '''
+        self.unpk.feed(byts)
+
+        retn = list(self.unpk)
+        self.size = self.unpk.tell()
+
+        return retn
+
 def loadfile(path):
     '''
     Load and upack the msgpack bytes from a file by path.
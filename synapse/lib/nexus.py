@@ -20,6 +20,12 @@ leaderversion = 'Leader is a higher version than we are.'
 # As a mirror follower, amount of time before giving up on a write request
 FOLLOWER_WRITE_WAIT_S = 30.0
 
+# As a mirror follower, number of nexus log entries requested from the leader per chunk
+MIRROR_CHUNK_SIZE = 1000
+
+# As a mirror follower, number of chunks to prefetch from the leader while applying changes
+MIRROR_PREFETCH = 8
+
 class RegMethType(type):
     '''
     Metaclass that collects all methods in class with _regme prop into a class member called _regclstupls
@@ -98,6 +104,12 @@ class NexsRoot(s_base.Base):
         self.miruplink = asyncio.Event()
         self._mirready = asyncio.Event()  # for testing
 
+        # mirror catch-up progress ( see getMirrorStatus() )
+        self.mirleadindx = None
+        self.mirsynctick = None
+        self.mirsyncoffs = None
+        self.mirsyncrate = 0.0
+
         self._mirrors: List[ChangeDist] = []
         self._nexskids: Dict[str, 'Pusher'] = {}
 
@@ -436,6 +448,48 @@ class NexsRoot(s_base.Base):
                     raise s_exc.IsFini()
                 yield item
 
+    async def iterChunks(self, offs: int, size=MIRROR_CHUNK_SIZE, tellready=False) -> AsyncIterator[Any]:
+        '''
+        Returns an iterator of (nexsindx, items) tuples containing lists of change entries in the log.
+
+        Notes:
+            Entries which are already in the log are sent in chunks of up to size entries.  Once the
+            realtime window is reached, each new entry is sent as soon as it is available.  The nexsindx
+            value is the current index of the log when the chunk was sent.
+        '''
+        if not self.donexslog:
+            return
+
+        if self.isfini:
+            raise s_exc.IsFini()
+
+        maxoffs = offs
+
+        chunk = []
+        async for item in self.nexslog.iter(offs):
+
+            if self.isfini:  # pragma: no cover
+                raise s_exc.IsFini()
+
+            maxoffs = item[0] + 1
+            chunk.append(item)
+
+            if len(chunk) >= size:
+                yield (self.nexslog.index(), chunk)
+                chunk = []
+
+        if chunk:
+            yield (self.nexslog.index(), chunk)
+
+        if tellready:
+            yield None
+
+        async with self.getChangeDist(maxoffs) as dist:
+            async for item in dist:
+                if self.isfini:
+                    raise s_exc.IsFini()
+                yield (self.nexslog.index(), [item])
+
     @contextlib.asynccontextmanager
     async def getChangeDist(self, offs: int) -> AsyncIterator[ChangeDist]:
 
@@ -541,45 +595,63 @@ class NexsRoot(s_base.Base):
                 if synvers >= (2, 95, 0):
                     opts['tellready'] = True
 
-                genr = proxy.getNexusChanges(offs, **opts)
-                async for item in genr:
+                if features.get('nexschunks'):
+                    genr = proxy.getNexusChunks(offs, size=MIRROR_CHUNK_SIZE, **opts)
+                else:
+                    genr = self._iterChangeChunks(proxy.getNexusChanges(offs, **opts))
 
-                    if proxy.isfini:  # pragma: no cover
-                        break
+                self.mirsynctick = None
+                self.mirleadindx = cellinfo['cell'].get('nexsindx')
 
-                    if self.readonly:
-                        break
+                async with contextlib.aclosing(self._prefetchChunks(genr)) as chunks:
+                    async for chunk in chunks:
 
-                    # with tellready we move to ready=true when we get a None
-                    if item is None:
-                        logger.info(f'Entering realtime change window for syncing data at offset={offs}')
-                        await self.setNexsReady(True)
-                        self._mirready.set()
-                        continue
+                        if proxy.isfini:  # pragma: no cover
+                            break
 
-                    offs, args = item
-                    if offs != self.nexslog.index():
-                        logger.error('Local Nexus offset is out of sync from remote cell! Aborting mirror sync')
-                        await self.fini()
-                        return
+                        if self.readonly:
+                            break
+
+                        # with tellready we move to ready=true when we get a None
+                        if chunk is None:
+                            offs = self.nexslog.index()
+                            logger.info(f'Entering realtime change window for syncing data at offset={offs}')
+                            await self.setNexsReady(True)
+                            self._mirready.set()
+                            continue
+
+                        leadindx, items = chunk
 
-                    meta = args[-1]
-                    respiden = meta.get('resp')
-                    respfutu = self._futures.get(respiden)
+                        try:
+                            rets = await self._eatMirrorChunk(items)
 
-                    try:
-                        retn = await self.eat(*args)
+                        except Exception as e:
+                            rets = [(False, e) for item in items]
+
+                        for (offs, args), (ok, retn) in zip(items, rets):
+
+                            respfutu = self._futures.get(args[-1].get('resp'))
+                            if respfutu is None:
+                                if not ok:  # pragma: no cover
+                                    logger.exception(retn)
+                                continue
 
-                    except Exception as e:
-                        if respfutu is not None:
                             assert not respfutu.done()
-                            respfutu.set_exception(e)
-                        else:  # pragma: no cover
-                            logger.exception(e)
+                            if ok:
+                                respfutu.set_result(retn)
+                            else:
+                                respfutu.set_exception(retn)
+
+                        self._updMirrorStatus(leadindx)
+
+                        if len(rets) < len(items):
 
-                    else:
-                        if respfutu is not None:
-                            respfutu.set_result(retn)
+                            if self.readonly:
+                                break
+
+                            logger.error('Local Nexus offset is out of sync from remote cell! Aborting mirror sync')
+                            await self.fini()
+                            return
 
             except s_exc.LinkShutDown:
                 logger.warning(f'mirror loop: leader closed the connection.')
@@ -593,6 +665,174 @@ class NexsRoot(s_base.Base):
         if not self.isfini:
             await self.setNexsReady(not self.cell.conf.get('mirror'))
 
+    async def _iterChangeChunks(self, genr):
+        # adapt the per-entry getNexusChanges() API of older leaders to chunks
+        async for item in genr:
+
+            if item is None:
+                yield None
+                continue
+
+            yield (item[0] + 1, [item])
+
+    async def _prefetchChunks(self, genr):
+        '''
+        Consume chunks from the leader in a separate task so the next chunks are
+        already transferred and decoded while the current chunk is being applied.
+
+        Notes:
+            Once the realtime window is reached, chunks are consumed directly to
+            avoid adding latency to changes made by this mirror.
+        '''
+        done = object()
+        genr = genr.__aiter__()
+        queue = asyncio.Queue(maxsize=MIRROR_PREFETCH)
+
+        async def fill():
+
+            try:
+                async for chunk in genr:
+
+                    await queue.put(chunk)
+
+                    if chunk is None:
+                        return
+
+            except Exception as e:
+                await queue.put(e)
+                return
+
+            await queue.put(done)
+
+        task = self.schedCoro(fill())
+
+        try:
+
+            while True:
+
+                chunk = await queue.get()
+                if chunk is done:
+                    return
+
+                if isinstance(chunk, Exception):
+                    raise chunk
+
+                yield chunk
+
+                if chunk is None:
+                    break
+
+        finally:
+            task.cancel()
+
+        async for chunk in genr:
+            yield chunk
+
+    async def _eatMirrorChunk(self, items):
+        '''
+        Apply a chunk of change entries from the leader while holding the nexslock once.
+        '''
+        async with self.cell.nexslock:
+            self.reqNotReadOnly()
+            # Keep a reference to the shielded task to ensure it isn't GC'd
+            self.applytask = asyncio.create_task(self._eatChunk(items))
+            return await asyncio.shield(self.applytask)
+
+    async def _eatChunk(self, items):
+        '''
+        Returns a list of (ok, retn) tuples for the applied entries. The list is
+        shorter than items if the local log is out of sync with the leader or a
+        write hold was added while applying the chunk.
+        '''
+        rets = []
+        for offs, item in items:
+
+            if offs != self.nexslog.index() or self.readonly:
+                break
+
+            nexsiden, event = item[:2]
+
+            try:
+
+                if (nexus := self._nexskids.get(nexsiden)) is None:
+                    raise s_exc.NoSuchIden(mesg=f'No Nexus Pusher with iden {nexsiden}.', iden=nexsiden)
+
+                if event not in nexus._nexshands:
+                    raise s_exc.NoSuchName(mesg=f'No Nexus handler for event {event}.', name=event)
+
+                rets.append((True, await self._eat(item)))
+
+            except Exception as e:
+                rets.append((False, e))
+
+        return rets
+
+    def _updMirrorStatus(self, leadindx):
+
+        if leadindx is not None and (self.mirleadindx is None or leadindx > self.mirleadindx):
+            self.mirleadindx = leadindx
+
+        tick = s_common.now()
+        offs = self.nexslog.index()
+
+        if self.mirsynctick is None:
+            self.mirsynctick = tick
+            self.mirsyncoffs = offs
+            return
+
+        took = tick - self.mirsynctick
+        if took < 1000:
+            return
+
+        rate = (offs - self.mirsyncoffs) * 1000 / took
+        if self.mirsyncrate:
+            rate = (self.mirsyncrate + rate) / 2
+
+        self.mirsyncrate = rate
+        self.mirsynctick = tick
+        self.mirsyncoffs = offs
+
+    async def getMirrorStatus(self):
+        '''
+        Return a dictionary describing the progress of the mirror loop or None if not a mirror.
+
+        Notes:
+            The rate value is the number of change entries applied per second and the eta value is
+            the estimated number of milliseconds until the mirror reaches the realtime window.
+            Both are None until enough changes have been applied to estimate them.
+        '''
+        if self.client is None:
+            return None
+
+        offs = await self.index()
+        leadindx = self.mirleadindx
+
+        lag = None
+        eta = None
+        rate = None
+
+        if self.mirsyncrate:
+            rate = self.mirsyncrate
+
+        if leadindx is not None:
+
+            lag = max(0, leadindx - offs)
+
+            if lag == 0:
+                eta = 0
+            elif rate is not None:
+                eta = int(lag * 1000 / rate)
+
+        return {
+            'ready': self.ready.is_set(),
+            'uplink': self.miruplink.is_set(),
+            'offs': offs,
+            'leader': leadindx,
+            'lag': lag,
+            'rate': rate,
+            'eta': eta,
+        }
+
     async def _tellAhaReady(self, status):
 
         if self.cell.ahaclient is None:
@@ -610,7 +610,6 @@ async def _forkedParseEval(text):
     return await s_coro._parserforked(parseEval, text)
 
 evalcache = s_cache.FixedCache(_forkedParseEval, size=100)
-querycache = s_cache.FixedCache(_forkedParseQuery, size=100)
 
 def massage_vartokn(astinfo, x):
     return s_ast.Const(astinfo, '' if not x else (x[1:-1] if x[0] == "'" else (unescape(x) if x[0] == '"' else x)))
@@ -284,6 +284,9 @@ _stormPoolOptsSchema = {
     'properties': {
         'timeout:sync': {'type': 'integer', 'minimum': 1},
         'timeout:connection': {'type': 'integer', 'minimum': 1},
+        'weight:inflight': {'type': 'number', 'minimum': 0},
+        'weight:latency': {'type': 'number', 'minimum': 0},
+        'weight:lag': {'type': 'number', 'minimum': 0},
     },
     'additionalProperties': False,
 }
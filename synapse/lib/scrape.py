@@ -1,3 +1,4 @@
+import codecs
 import string
 import asyncio
 import logging
@@ -15,6 +16,7 @@ import synapse.common as s_common
 
 import synapse.lib.chop as s_chop
 import synapse.lib.coro as s_coro
+import synapse.lib.const as s_const
 import synapse.lib.link as s_link
 import synapse.lib.msgpack as s_msgpack
 
@@ -24,6 +26,11 @@ ipaddress = s_common.ipaddress
 
 logger = logging.getLogger(__name__)
 
+# number of characters of text scraped at once when scraping a stream of bytes
+SCRAPE_WINDOW_SIZE = 4 * s_const.mebibyte
+# number of characters shared between consecutive windows of text
+SCRAPE_WINDOW_OVERLAP = 64 * s_const.kibibyte
+
 tldlist = list(s_data.get('iana.tlds'))
 tldlist.extend([
     'bit',
@@ -244,50 +251,68 @@ def unc_path_check(match: regex.Match):
 
     return valu, {}
 
+# Cheap patterns used to find the spans of text which may contain a match for the more expensive
+# scrape rules. A rule with a hint is only run over the text matched by its hint plus one character
+# of context on each side, so each hint must match every run of characters a rule match may span.
+_fqdn_chars = r'\p{L}\p{M}\p{N}\p{S}_\-\u3002\uff0e\uff61.'
+fqdn_hint = r'(?<![' + _fqdn_chars + r'])[\p{L}\p{M}\p{N}\p{S}_\-]*+[\u3002\uff0e\uff61.][' + _fqdn_chars + r']*+'
+email_hint = r'(?<!\S)[^\s@]*+@\S*+'
+url_hint = r'''(?<![^ '"\t\n\r\f\v])(?:[^ '"\t\n\r\f\v:]|:(?!//))*+://[^ '"\t\n\r\f\v]*+'''
+ipv4_hint = r'(?<![\d.])[\d.]{7,}+'
+ipv6_hint = r'(?<![\da-f:.\[\]])[\da-f.\[\]]*+:[\da-f:.\[\]]*+'
+alnum_hint = r'(?<![A-Za-z0-9])[A-Za-z0-9]{25,}+'
+cwe_hint = r'(?<![A-Za-z0-9])cwe-[0-9]++'
+bch_hint = r'(?<![A-Za-z0-9])(?:bitcoincash|bchtest):[A-Za-z0-9]++'
+
 # these must be ordered from most specific to least specific to allow first=True to work
 scrape_types = [  # type: ignore
     ('file:path', linux_path_regex, {'callback': linux_path_check, 'flags': regex.VERBOSE}),
     ('file:path', windows_path_regex, {'callback': windows_path_check, 'flags': regex.VERBOSE}),
     ('inet:url', r'(?P<prefix>[\\{<\(\[]?)(?P<valu>[a-zA-Z][a-zA-Z0-9]*://(?(?=[,.]+[ \'\"\t\n\r\f\v])|[^ \'\"\t\n\r\f\v])+)',
-     {'callback': fqdn_prefix_check}),
+     {'callback': fqdn_prefix_check, 'hint': url_hint}),
     ('inet:url', r'(["\'])?(?P<valu>\\[^\n]+?)(?(1)\1|\s)', {'callback': unc_path_check}),
-    ('inet:email', r'(?=(?:[^a-z0-9_.+-]|^)(?P<valu>[a-z0-9_\.\-+]{1,256}@(?:[a-z0-9_-]{1,63}\.){1,10}(?:%s))(?:[^a-z0-9_.-]|[.\s]|$))' % tldcat, {}),
+    ('inet:email', r'(?=(?:[^a-z0-9_.+-]|^)(?P<valu>[a-z0-9_\.\-+]{1,256}@(?:[a-z0-9_-]{1,63}\.){1,10}(?:%s))(?:[^a-z0-9_.-]|[.\s]|$))' % tldcat, {'hint': email_hint}),
     ('inet:server', fr'(?P<valu>(?:(?<!\d|\d\.|[0-9a-f:]:)((?P<addr>{ipv4_match})|\[(?P<v6addr>{ipv6_match})\]):(?P<port>\d{{1,5}})(?!\d|\.\d)))',
-     {'callback': inet_server_check, 'flags': regex.VERBOSE}),
-    ('inet:ipv4', ipv4_regex, {'flags': regex.VERBOSE}),
-    ('inet:ipv6', ipv6_regex, {'callback': ipv6_check, 'flags': regex.VERBOSE}),
-    ('inet:fqdn', r'(?=(?:[^\p{L}\p{M}\p{N}\p{S}\u3002\uff0e\uff61_.-]|^|[' + idna_disallowed + '])(?P<valu>(?:((?![' + idna_disallowed + r'])[\p{L}\p{M}\p{N}\p{S}_-]){1,63}[\u3002\uff0e\uff61\.]){1,10}(?:' + tldcat + r'))(?:[^\p{L}\p{M}\p{N}\p{S}\u3002\uff0e\uff61_.-]|[\u3002\uff0e\uff61.]([\p{Z}\p{Cc}]|$)|$|[' + idna_disallowed + r']))', {'callback': fqdn_check}),
-    ('hash:md5', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>[A-Fa-f0-9]{32})(?:[^A-Za-z0-9]|$))', {}),
-    ('hash:sha1', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>[A-Fa-f0-9]{40})(?:[^A-Za-z0-9]|$))', {}),
-    ('hash:sha256', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>[A-Fa-f0-9]{64})(?:[^A-Za-z0-9]|$))', {}),
+     {'callback': inet_server_check, 'flags': regex.VERBOSE, 'hint': ipv6_hint}),
+    ('inet:ipv4', ipv4_regex, {'flags': regex.VERBOSE, 'hint': ipv4_hint}),
+    ('inet:ipv6', ipv6_regex, {'callback': ipv6_check, 'flags': regex.VERBOSE, 'hint': ipv6_hint}),
+    ('inet:fqdn', r'(?=(?:[^\p{L}\p{M}\p{N}\p{S}\u3002\uff0e\uff61_.-]|^|[' + idna_disallowed + '])(?P<valu>(?:((?![' + idna_disallowed + r'])[\p{L}\p{M}\p{N}\p{S}_-]){1,63}[\u3002\uff0e\uff61\.]){1,10}(?:' + tldcat + r'))(?:[^\p{L}\p{M}\p{N}\p{S}\u3002\uff0e\uff61_.-]|[\u3002\uff0e\uff61.]([\p{Z}\p{Cc}]|$)|$|[' + idna_disallowed + r']))', {'callback': fqdn_check, 'hint': fqdn_hint}),
+    ('hash:md5', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>[A-Fa-f0-9]{32})(?:[^A-Za-z0-9]|$))', {'hint': alnum_hint}),
+    ('hash:sha1', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>[A-Fa-f0-9]{40})(?:[^A-Za-z0-9]|$))', {'hint': alnum_hint}),
+    ('hash:sha256', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>[A-Fa-f0-9]{64})(?:[^A-Za-z0-9]|$))', {'hint': alnum_hint}),
     ('it:sec:cve', fr'(?:[^a-z0-9]|^)(?P<valu>CVE[{cve_dashes}][0-9]{{4}}[{cve_dashes}][0-9]{{4,}})(?:[^a-z0-9]|$)', {'callback': cve_check}),
-    ('it:sec:cwe', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>CWE-[0-9]{1,8})(?:[^A-Za-z0-9]|$))', {}),
+    ('it:sec:cwe', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>CWE-[0-9]{1,8})(?:[^A-Za-z0-9]|$))', {'hint': cwe_hint}),
     ('it:sec:cpe', _cpe23_regex, {'flags': regex.VERBOSE}),
     ('crypto:currency:address', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>[1][a-zA-HJ-NP-Z0-9]{25,39})(?:[^A-Za-z0-9]|$))',
-     {'callback': s_coin.btc_base58_check}),
+     {'callback': s_coin.btc_base58_check, 'hint': alnum_hint}),
     ('crypto:currency:address', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>3[a-zA-HJ-NP-Z0-9]{33})(?:[^A-Za-z0-9]|$))',
-     {'callback': s_coin.btc_base58_check}),
+     {'callback': s_coin.btc_base58_check, 'hint': alnum_hint}),
     ('crypto:currency:address', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>(bc|bcrt|tb)1[qpzry9x8gf2tvdw0s3jn54khce6mua7l]{3,71})(?:[^A-Za-z0-9]|$))',
-     {'callback': s_coin.btc_bech32_check}),
+     {'callback': s_coin.btc_bech32_check, 'hint': alnum_hint}),
     ('crypto:currency:address', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>0x[A-Fa-f0-9]{40})(?:[^A-Za-z0-9]|$))',
-     {'callback': s_coin.eth_check}),
+     {'callback': s_coin.eth_check, 'hint': alnum_hint}),
     ('crypto:currency:address', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>(bitcoincash|bchtest):[qpzry9x8gf2tvdw0s3jn54khce6mua7l]{42})(?:[^A-Za-z0-9]|$))',
-     {'callback': s_coin.bch_check}),
+     {'callback': s_coin.bch_check, 'hint': bch_hint}),
     ('crypto:currency:address', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>[xr][a-zA-HJ-NP-Z0-9]{25,46})(?:[^A-Za-z0-9]|$))',
-     {'callback': s_coin.xrp_check}),
+     {'callback': s_coin.xrp_check, 'hint': alnum_hint}),
     ('crypto:currency:address', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>[1a-z][a-zA-HJ-NP-Z0-9]{46,47})(?:[^A-Za-z0-9]|$))',
-     {'callback': s_coin.substrate_check}),
+     {'callback': s_coin.substrate_check, 'hint': alnum_hint}),
     ('crypto:currency:address', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>(DdzFF|Ae2td)[a-zA-HJ-NP-Z0-9]{54,99})(?:[^A-Za-z0-9]|$))',
-     {'callback': s_coin.cardano_byron_check}),
+     {'callback': s_coin.cardano_byron_check, 'hint': alnum_hint}),
     ('crypto:currency:address', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>addr1[qpzry9x8gf2tvdw0s3jn54khce6mua7l]{53,})(?:[^A-Za-z0-9]|$))',
-     {'callback': s_coin.cardano_shelly_check}),
+     {'callback': s_coin.cardano_shelly_check, 'hint': alnum_hint}),
 ]
 
+_hints = {}
 _regexes = collections.defaultdict(list)
 for (name, rule, opts) in scrape_types:
     blob = (regex.compile(rule, regex.IGNORECASE | opts.get('flags', 0)), opts)
     _regexes[name].append(blob)
 
+    hint = opts.get('hint')
+    if hint is not None and hint not in _hints:
+        _hints[hint] = regex.compile(hint, regex.IGNORECASE)
+
 def getForms():
     '''
     Get a list of forms recognized by the scrape APIs.
@@ -446,32 +471,57 @@ def _rewriteRawValu(text: str, offsets: dict, info: dict):
 def _genMatchList(text: str, regx: regex.Regex, opts: dict):
     return [info for info in _genMatches(text, regx, opts)]
 
-def _genMatches(text: str, regx: regex.Regex, opts: dict):
+def _getHintSpans(text: str, hint: str):
+    '''
+    Get a list of (pos, endpos) tuples for the text which may be matched by rules using the given hint.
+    '''
+    spans = []
+    size = len(text)
+
+    for match in _hints[hint].finditer(text):
+
+        pos = max(0, match.start() - 1)
+        endpos = min(size, match.end() + 1)
+
+        if spans and pos <= spans[-1][1]:
+            spans[-1] = (spans[-1][0], endpos)
+            continue
+
+        spans.append((pos, endpos))
+
+    return spans
+
+def _genMatches(text: str, regx: regex.Regex, opts: dict, spans=None):
 
     cb = opts.get('callback')
 
-    for valu in regx.finditer(text):  # type: regex.Match
-        raw_span = valu.span('valu')
-        raw_valu = valu.group('valu')
+    if spans is None:
+        spans = ((0, len(text)),)
 
-        info = {
-            'match': raw_valu,
-            'offset': raw_span[0]
-        }
+    for (pos, endpos) in spans:
 
-        if cb:
-            # CB is expected to return a tufo of <new valu, info>
-            valu, cbfo = cb(valu)
-            if valu is None:
-                continue
-            # Smash cbfo into our info dict
-            info.update(**cbfo)
-        else:
-            valu = raw_valu
+        for valu in regx.finditer(text, pos, endpos):  # type: regex.Match
+            raw_span = valu.span('valu')
+            raw_valu = valu.group('valu')
 
-        info['valu'] = valu
+            info = {
+                'match': raw_valu,
+                'offset': raw_span[0]
+            }
 
-        yield info
+            if cb:
+                # CB is expected to return a tufo of <new valu, info>
+                valu, cbfo = cb(valu)
+                if valu is None:
+                    continue
+                # Smash cbfo into our info dict
+                info.update(**cbfo)
+            else:
+                valu = raw_valu
+
+            info['valu'] = valu
+
+            yield info
 
 def genMatches(text: str, regx: regex.Regex, opts: dict):
     '''
@@ -538,11 +588,22 @@ async def genMatchesAsync(text: str, regx: regex.Regex, opts: dict):
     for info in matches:
         yield info
 
-def _contextMatches(scrape_text, text, ruletype, refang, offsets):
+def _contextMatches(scrape_text, text, ruletype, refang, offsets, hintspans=None):
+
+        if hintspans is None:
+            hintspans = {}
 
         for (regx, opts) in _regexes[ruletype]:
 
-            for info in genMatches(scrape_text, regx, opts):
+            spans = None
+
+            hint = opts.get('hint')
+            if hint is not None:
+                spans = hintspans.get(hint)
+                if spans is None:
+                    spans = hintspans[hint] = _getHintSpans(scrape_text, hint)
+
+            for info in _genMatches(scrape_text, regx, opts, spans=spans):
 
                 info['form'] = ruletype
 
@@ -560,11 +621,14 @@ def _contextScrape(text, form=None, refang=True, first=False):
     if refang:
         scrape_text, offsets = refang_text2(text)
 
+    # hint spans are shared by the rules which use the same hint
+    hintspans = {}
+
     for ruletype, blobs in _regexes.items():
         if form and form != ruletype:
             continue
 
-        for info in _contextMatches(scrape_text, text, ruletype, refang, offsets):
+        for info in _contextMatches(scrape_text, text, ruletype, refang, offsets, hintspans=hintspans):
 
             yield info
 
@@ -666,3 +730,126 @@ async def scrapeAsync(text, ptype=None, refang=True, first=False):
     matches = await s_coro.semafork(_contextScrapeList, text, form=ptype, refang=refang, first=first)
     for info in matches:
         yield info.get('form'), info.get('valu')
+
+async def genTextWindows(genr, errors='ignore', size=None, overlap=None):
+    '''
+    Decode an async generator of utf8 bytes into overlapping windows of text.
+
+    Args:
+        genr: An async generator which yields bytes.
+        errors (str): Specify how encoding errors should handled.
+        size (int): The number of characters in each window. Defaults to SCRAPE_WINDOW_SIZE.
+        overlap (int): The number of characters shared between consecutive windows. Defaults to SCRAPE_WINDOW_OVERLAP.
+
+    Notes:
+        Each window shares overlap characters of leading context with the previous window
+        and overlap characters of trailing context with the next window. Results found
+        in a window should only be kept if their offset is within the lo and hi offsets of
+        the window, which ensures each offset in the text is only scraped once. Values
+        longer than the overlap may be truncated at a window boundary.
+
+    Yields:
+        (int, int, int, str): The offset of the window in the full text, the lo and hi
+        offsets within the window for results to keep, and the text of the window.
+    '''
+    if size is None:
+        size = SCRAPE_WINDOW_SIZE
+
+    if overlap is None:
+        overlap = SCRAPE_WINDOW_OVERLAP
+
+    if size <= overlap * 2:
+        raise s_exc.BadArg(mesg=f'Scrape window size must be more than twice the overlap ({overlap}).')
+
+    decoder = codecs.getincrementaldecoder('utf8')(errors=errors)
+
+    base = 0
+    lo = 0
+    text = ''
+
+    parts = []
+    partsize = 0
+
+    async for byts in genr:
+
+        part = decoder.decode(byts)
+
+        parts.append(part)
+        partsize += len(part)
+
+        if len(text) + partsize < size:
+            continue
+
+        parts.insert(0, text)
+        text = ''.join(parts)
+
+        parts.clear()
+        partsize = 0
+
+        while len(text) >= size:
+
+            hi = size - overlap
+            yield base, lo, hi, text[:size]
+
+            base += hi - overlap
+            text = text[hi - overlap:]
+            lo = overlap
+
+    parts.insert(0, text)
+    parts.append(decoder.decode(b'', final=True))
+    text = ''.join(parts)
+
+    if text:
+        yield base, lo, len(text), text
+
+async def contextScrapeGenr(genr, form=None, refang=True, first=False, errors='ignore'):
+    '''
+    Scrape types from an async generator of bytes and yield info dictionaries, using the shared forked process pool.
+
+    Args:
+        genr: An async generator which yields utf8 encoded bytes.
+        form (str): Optional form to scrape. If present, only scrape items which match the provided form.
+        refang (bool): Whether to remove de-fanging schemes from text before scraping.
+        first (bool): If true, only yield the first item scraped.
+        errors (str): Specify how encoding errors should handled.
+
+    Notes:
+        The bytes are decoded incrementally and scraped in overlapping windows of text so the
+        full text is never held in memory. The offsets in the yielded dictionaries are relative
+        to the full text. Results are yielded for each window as it is scraped, so they are not
+        ordered by form across the full text. See contextScrape() for the yielded keys.
+
+    Returns:
+        (dict): Yield info dicts of results.
+    '''
+    async for (base, lo, hi, text) in genTextWindows(genr, errors=errors):
+
+        matches = await s_coro.semafork(_contextScrapeList, text, form=form, refang=refang)
+        for info in matches:
+
+            offs = info.get('offset')
+            if offs < lo or offs >= hi:
+                continue
+
+            info['offset'] = base + offs
+            yield info
+
+            if first:
+                return
+
+async def scrapeGenr(genr, ptype=None, refang=True, first=False, errors='ignore'):
+    '''
+    Scrape types from an async generator of bytes and return node tuples, using the shared forked process pool.
+
+    Args:
+        genr: An async generator which yields utf8 encoded bytes.
+        ptype (str): Optional ptype to scrape. If present, only scrape items which match the provided type.
+        refang (bool): Whether to remove de-fanging schemes from text before scraping.
+        first (bool): If true, only yield the first item scraped.
+        errors (str): Specify how encoding errors should handled.
+
+    Returns:
+        (str, object): Yield tuples of node ndef values.
+    '''
+    async for info in contextScrapeGenr(genr, form=ptype, refang=refang, first=first, errors=errors):
+        yield info.get('form'), info.get('valu')
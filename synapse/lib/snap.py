@@ -15,9 +15,11 @@ import synapse.lib.coro as s_coro
 import synapse.lib.node as s_node
 import synapse.lib.time as s_time
 import synapse.lib.cache as s_cache
+import synapse.lib.const as s_const
 import synapse.lib.layer as s_layer
 import synapse.lib.storm as s_storm
 import synapse.lib.types as s_types
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.spooled as s_spooled
 
 logger = logging.getLogger(__name__)
@@ -75,6 +77,21 @@ class ProtoNode:
 
         self.edgedels = set()
 
+    def fork(self, ctx):
+        '''
+        Return a copy of this ProtoNode bound to a child SnapEditor.
+        '''
+        protonode = ProtoNode(ctx, self.buid, self.form, self.valu, self.node)
+
+        protonode.tags.update(self.tags)
+        protonode.props.update(self.props)
+        protonode.edges.update(self.edges)
+        protonode.tagprops.update(self.tagprops)
+        protonode.nodedata.update(self.nodedata)
+        protonode.edgedels.update(self.edgedels)
+
+        return protonode
+
     def iden(self):
         return s_common.ehex(self.buid)
 
@@ -458,12 +475,39 @@ class ProtoNode:
 class SnapEditor:
     '''
     A SnapEditor allows tracking node edits with subs/deps as a transaction.
+
+    If a parent SnapEditor is specified, pending edits from the parent are visible
+    to the child and the child may be merged back into the parent once complete.
     '''
-    def __init__(self, snap):
+    def __init__(self, snap, parent=None):
         self.snap = snap
+        self.parent = parent
         self.protonodes = {}
         self.maxnodes = snap.core.maxnodes
 
+    def _getProtoNode(self, ndef):
+
+        protonode = self.protonodes.get(ndef)
+        if protonode is not None:
+            return protonode
+
+        if self.parent is None:
+            return None
+
+        protonode = self.parent._getProtoNode(ndef)
+        if protonode is None:
+            return None
+
+        protonode = protonode.fork(self)
+        self.protonodes[ndef] = protonode
+        return protonode
+
+    def merge(self, editor):
+        '''
+        Merge the pending edits from a child SnapEditor into this one.
+        '''
+        self.protonodes.update(editor.protonodes)
+
     async def getNodeByBuid(self, buid):
         node = await self.snap.getNodeByBuid(buid)
         if node:
@@ -535,7 +579,7 @@ class SnapEditor:
 
         ndef = (form.name, norm)
 
-        protonode = self.protonodes.get(ndef)
+        protonode = self._getProtoNode(ndef)
         if protonode is not None:
             return ()
 
@@ -563,7 +607,7 @@ class SnapEditor:
         return ops
 
     def loadNode(self, node):
-        protonode = self.protonodes.get(node.ndef)
+        protonode = self._getProtoNode(node.ndef)
         if protonode is None:
             protonode = ProtoNode(self, node.buid, node.form, node.ndef[1], node)
             self.protonodes[node.ndef] = protonode
@@ -573,7 +617,7 @@ class SnapEditor:
 
         ndef = (form.name, norm)
 
-        protonode = self.protonodes.get(ndef)
+        protonode = self._getProtoNode(ndef)
         if protonode is not None:
             return protonode
 
@@ -621,6 +665,10 @@ class Snap(s_base.Base):
     tagcachesize = 1000
     buidcachesize = 100000
 
+    # bounds for the number of nodedefs and node edit bytes in a batched addNodes() commit
+    nodeeditbatchsize = 1000
+    nodeeditbatchbytes = 4 * s_const.mebibyte
+
     async def __anit__(self, view, user):
         '''
         Args:
@@ -653,6 +701,10 @@ class Snap(s_base.Base):
         self.write = False      # True when the snap has a write lock on a layer.
         self.cachebuids = True
 
+        # storage rows and storage nodes joined (used by storm profiling)
+        self.joinrows = 0
+        self.joinsodes = 0
+
         self.tagnorms = s_cache.FixedCache(self._getTagNorm, size=self.tagcachesize)
         self.tagcache = s_cache.FixedCache(self._getTagNode, size=self.tagcachesize)
         # Keeps alive the most recently accessed node objects
@@ -798,6 +850,9 @@ class Snap(s_base.Base):
             async for x in runt.execute():
                 yield x
 
+            if runt.profiler is not None:
+                await self.fire('profile', **runt.profiler.pack(query))
+
     async def eval(self, text, opts=None, user=None):
         '''
         Run a storm query and yield Node() objects.
@@ -879,10 +934,8 @@ class Snap(s_base.Base):
             mesg = f'No tag property named {name}'
             raise s_exc.NoSuchTagProp(name=name, mesg=mesg)
 
-        async for (buid, sodes) in self.core._liftByTagProp(form, tag, name, self.layers, reverse=reverse):
-            node = await self._joinSodes(buid, sodes)
-            if node is not None:
-                yield node
+        async for node in self._joinSodeRows(self.core._liftByTagProp(form, tag, name, self.layers, reverse=reverse)):
+            yield node
 
     async def nodesByTagPropValu(self, form, tag, name, cmpr, valu, reverse=False):
         prop = self.core.model.getTagProp(name)
@@ -895,10 +948,8 @@ class Snap(s_base.Base):
         if not cmprvals:
             return
 
-        async for (buid, sodes) in self.core._liftByTagPropValu(form, tag, name, cmprvals, self.layers, reverse=reverse):
-            node = await self._joinSodes(buid, sodes)
-            if node is not None:
-                yield node
+        async for node in self._joinSodeRows(self.core._liftByTagPropValu(form, tag, name, cmprvals, self.layers, reverse=reverse)):
+            yield node
 
     async def _joinStorNode(self, buid, cache):
 
@@ -923,12 +974,36 @@ class Snap(s_base.Base):
         return await self._joinSodes(buid, sodes)
 
     async def _joinSodes(self, buid, sodes):
+        node = self._joinSodesNode(buid, sodes)
+        await asyncio.sleep(0)
+        return node
+
+    async def _joinSodeRows(self, genr):
+        '''
+        Join the lists of (buid, sodes) rows yielded by a Cortex lift into nodes.
+
+        Notes:
+            This yields to the ioloop once per list of rows rather than once per node.
+        '''
+        async for rows in genr:
+
+            for buid, sodes in rows:
+                node = self._joinSodesNode(buid, sodes)
+                if node is not None:
+                    yield node
+
+            await asyncio.sleep(0)
+
+    def _joinSodesNode(self, buid, sodes):
+
+        self.joinrows += 1
 
         node = self.livenodes.get(buid)
         if node is not None:
-            await asyncio.sleep(0)
             return node
 
+        self.joinsodes += len(sodes)
+
         ndef = None
         tags = {}
         props = {}
@@ -977,7 +1052,6 @@ class Snap(s_base.Base):
                 nodedata.update(stordata)
 
         if ndef is None:
-            await asyncio.sleep(0)
             return None
 
         pode = (buid, {
@@ -993,14 +1067,11 @@ class Snap(s_base.Base):
             self.livenodes[buid] = node
             self.buidcache.append(node)
 
-        await asyncio.sleep(0)
         return node
 
     async def nodesByDataName(self, name):
-        async for (buid, sodes) in self.core._liftByDataName(name, self.layers):
-            node = await self._joinSodes(buid, sodes)
-            if node is not None:
-                yield node
+        async for node in self._joinSodeRows(self.core._liftByDataName(name, self.layers)):
+            yield node
 
     async def nodesByProp(self, full, reverse=False):
 
@@ -1015,17 +1086,13 @@ class Snap(s_base.Base):
             return
 
         if prop.isform:
-            async for (buid, sodes) in self.core._liftByProp(prop.name, None, self.layers, reverse=reverse):
-                node = await self._joinSodes(buid, sodes)
-                if node is not None:
-                    yield node
+            async for node in self._joinSodeRows(self.core._liftByProp(prop.name, None, self.layers, reverse=reverse)):
+                yield node
             return
 
         if prop.isuniv:
-            async for (buid, sodes) in self.core._liftByProp(None, prop.name, self.layers, reverse=reverse):
-                node = await self._joinSodes(buid, sodes)
-                if node is not None:
-                    yield node
+            async for node in self._joinSodeRows(self.core._liftByProp(None, prop.name, self.layers, reverse=reverse)):
+                yield node
             return
 
         formname = None
@@ -1033,10 +1100,8 @@ class Snap(s_base.Base):
             formname = prop.form.name
 
         # Prop is secondary prop
-        async for (buid, sodes) in self.core._liftByProp(formname, prop.name, self.layers, reverse=reverse):
-            node = await self._joinSodes(buid, sodes)
-            if node is not None:
-                yield node
+        async for node in self._joinSodeRows(self.core._liftByProp(formname, prop.name, self.layers, reverse=reverse)):
+            yield node
 
     async def nodesByPropValu(self, full, cmpr, valu, reverse=False, norm=True):
         if cmpr == 'type=':
@@ -1074,37 +1139,27 @@ class Snap(s_base.Base):
             return
 
         if prop.isform:
-            async for (buid, sodes) in self.core._liftByFormValu(prop.name, cmprvals, self.layers, reverse=reverse):
-                node = await self._joinSodes(buid, sodes)
-                if node is not None:
-                    yield node
+            async for node in self._joinSodeRows(self.core._liftByFormValu(prop.name, cmprvals, self.layers, reverse=reverse)):
+                yield node
 
             return
 
         if prop.isuniv:
-            async for (buid, sodes) in self.core._liftByPropValu(None, prop.name, cmprvals, self.layers, reverse=reverse):
-                node = await self._joinSodes(buid, sodes)
-                if node is not None:
-                    yield node
+            async for node in self._joinSodeRows(self.core._liftByPropValu(None, prop.name, cmprvals, self.layers, reverse=reverse)):
+                yield node
             return
 
-        async for (buid, sodes) in self.core._liftByPropValu(prop.form.name, prop.name, cmprvals, self.layers, reverse=reverse):
-            node = await self._joinSodes(buid, sodes)
-            if node is not None:
-                yield node
+        async for node in self._joinSodeRows(self.core._liftByPropValu(prop.form.name, prop.name, cmprvals, self.layers, reverse=reverse)):
+            yield node
 
     async def nodesByTag(self, tag, form=None, reverse=False):
-        async for (buid, sodes) in self.core._liftByTag(tag, form, self.layers, reverse=reverse):
-            node = await self._joinSodes(buid, sodes)
-            if node is not None:
-                yield node
+        async for node in self._joinSodeRows(self.core._liftByTag(tag, form, self.layers, reverse=reverse)):
+            yield node
 
     async def nodesByTagValu(self, tag, cmpr, valu, form=None, reverse=False):
         norm, info = self.core.model.type('ival').norm(valu)
-        async for (buid, sodes) in self.core._liftByTagValu(tag, cmpr, norm, form, self.layers, reverse=reverse):
-            node = await self._joinSodes(buid, sodes)
-            if node is not None:
-                yield node
+        async for node in self._joinSodeRows(self.core._liftByTagValu(tag, cmpr, norm, form, self.layers, reverse=reverse)):
+            yield node
 
     async def nodesByPropTypeValu(self, name, valu, reverse=False):
 
@@ -1137,20 +1192,16 @@ class Snap(s_base.Base):
             cmprvals = ((cmpr, valu, prop.type.arraytype.stortype),)
 
         if prop.isform:
-            async for (buid, sodes) in self.core._liftByPropArray(prop.name, None, cmprvals, self.layers, reverse=reverse):
-                node = await self._joinSodes(buid, sodes)
-                if node is not None:
-                    yield node
+            async for node in self._joinSodeRows(self.core._liftByPropArray(prop.name, None, cmprvals, self.layers, reverse=reverse)):
+                yield node
             return
 
         formname = None
         if prop.form is not None:
             formname = prop.form.name
 
-        async for (buid, sodes) in self.core._liftByPropArray(formname, prop.name, cmprvals, self.layers, reverse=reverse):
-            node = await self._joinSodes(buid, sodes)
-            if node is not None:
-                yield node
+        async for node in self._joinSodeRows(self.core._liftByPropArray(formname, prop.name, cmprvals, self.layers, reverse=reverse)):
+            yield node
 
     @contextlib.asynccontextmanager
     async def getNodeEditor(self, node):
@@ -1591,7 +1642,7 @@ class Snap(s_base.Base):
         await self.warn(mesg)
         return None
 
-    async def addNodes(self, nodedefs):
+    async def addNodes(self, nodedefs, batch=False):
         '''
         Add/merge nodes in bulk.
 
@@ -1603,6 +1654,10 @@ class Snap(s_base.Base):
 
         Args:
             nodedefs (list): A list of nodedef tuples.
+            batch (bool): Accumulate the node edits for many nodedefs and save them in a single commit.
+
+        Notes:
+            In batch mode, nodes are yielded once the batch containing them has been saved.
 
         Returns:
             (list): A list of xact messages.
@@ -1614,6 +1669,11 @@ class Snap(s_base.Base):
         oldstrict = self.strict
         self.strict = False
         try:
+            if batch:
+                async for node in self._addNodeDefs(nodedefs, oldstrict):
+                    yield node
+                return
+
             for nodedefn in nodedefs:
                 try:
                     node = await self._addNodeDef(nodedefn)
@@ -1633,9 +1693,82 @@ class Snap(s_base.Base):
         finally:
             self.strict = oldstrict
 
+    async def _addNodeDefs(self, nodedefs, strict):
+
+        count = 0
+        size = 0
+
+        buids = []
+        editor = SnapEditor(self)
+
+        for nodedefn in nodedefs:
+
+            # edit each nodedef in a child editor so a failure
+            # does not leave partial edits in the pending batch
+            subeditor = SnapEditor(self, parent=editor)
+
+            try:
+                protonode = await self._editNodeDef(subeditor, nodedefn)
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as e:
+                if strict:
+                    async for node in self._saveNodeDefs(editor, buids):
+                        pass
+                    raise
+                await self.warn(f'addNodes failed on {nodedefn}: {e}')
+                await asyncio.sleep(0)
+                continue
+
+            editor.merge(subeditor)
+
+            if protonode is not None:
+                buids.append(protonode.buid)
+
+            count += 1
+            nodeedits = subeditor.getNodeEdits()
+            if nodeedits:
+                size += len(s_msgpack.en(nodeedits))
+
+            if count >= self.nodeeditbatchsize or size >= self.nodeeditbatchbytes:
+
+                async for node in self._saveNodeDefs(editor, buids):
+                    yield node
+
+                count = 0
+                size = 0
+                buids = []
+                editor = SnapEditor(self)
+
+            await asyncio.sleep(0)
+
+        async for node in self._saveNodeDefs(editor, buids):
+            yield node
+
+    async def _saveNodeDefs(self, editor, buids):
+
+        nodeedits = editor.getNodeEdits()
+        if nodeedits:
+            nodecache = {proto.buid: proto.node for proto in editor.protonodes.values()}
+            await self.applyNodeEdits(nodeedits, nodecache=nodecache)
+
+        for buid in buids:
+            node = await self.getNodeByBuid(buid)
+            if node is not None:
+                yield node
+
     async def _addNodeDef(self, nodedefn):
 
-        n2buids = set()
+        async with self.getEditor() as editor:
+            protonode = await self._editNodeDef(editor, nodedefn)
+            if protonode is None:
+                return
+
+        return await self.getNodeByBuid(protonode.buid)
+
+    async def _editNodeDef(self, editor, nodedefn):
 
         (formname, formvalu), forminfo = nodedefn
 
@@ -1645,42 +1778,40 @@ class Snap(s_base.Base):
         if props is not None:
             props.pop('.created', None)
 
-        async with self.getEditor() as editor:
-
-            protonode = await editor.addNode(formname, formvalu, props=props)
-            if protonode is None:
-                return
+        protonode = await editor.addNode(formname, formvalu, props=props)
+        if protonode is None:
+            return
 
-            tags = forminfo.get('tags')
-            if tags is not None:
-                for tagname, tagvalu in tags.items():
-                    await protonode.addTag(tagname, tagvalu)
+        tags = forminfo.get('tags')
+        if tags is not None:
+            for tagname, tagvalu in tags.items():
+                await protonode.addTag(tagname, tagvalu)
 
-            nodedata = forminfo.get('nodedata')
-            if isinstance(nodedata, dict):
-                for dataname, datavalu in nodedata.items():
-                    if not isinstance(dataname, str):
-                        continue
-                    await protonode.setData(dataname, datavalu)
+        nodedata = forminfo.get('nodedata')
+        if isinstance(nodedata, dict):
+            for dataname, datavalu in nodedata.items():
+                if not isinstance(dataname, str):
+                    continue
+                await protonode.setData(dataname, datavalu)
 
-            tagprops = forminfo.get('tagprops')
-            if tagprops is not None:
-                for tag, props in tagprops.items():
-                    for name, valu in props.items():
-                        await protonode.setTagProp(tag, name, valu)
+        tagprops = forminfo.get('tagprops')
+        if tagprops is not None:
+            for tag, props in tagprops.items():
+                for name, valu in props.items():
+                    await protonode.setTagProp(tag, name, valu)
 
-            for verb, n2iden in forminfo.get('edges', ()):
+        for verb, n2iden in forminfo.get('edges', ()):
 
-                if isinstance(n2iden, (tuple, list)):
-                    n2proto = await editor.addNode(*n2iden)
-                    if n2proto is None:
-                        continue
+            if isinstance(n2iden, (tuple, list)):
+                n2proto = await editor.addNode(*n2iden)
+                if n2proto is None:
+                    continue
 
-                    n2iden = n2proto.iden()
+                n2iden = n2proto.iden()
 
-                await protonode.addEdge(verb, n2iden)
+            await protonode.addEdge(verb, n2iden)
 
-        return await self.getNodeByBuid(protonode.buid)
+        return protonode
 
     async def getRuntNodes(self, full, valu=None, cmpr=None):
 
@@ -1,3 +1,6 @@
+import array
+import heapq
+import asyncio
 import tempfile
 
 import synapse.common as s_common
@@ -9,6 +12,65 @@ import synapse.lib.lmdbslab as s_lmdbslab
 
 MAX_SPOOL_SIZE = 10000
 
+# maximum memory used by a spooled object after it has fallen back to a slab
+MAX_SPOOL_MEM = 64 * s_const.mebibyte
+
+# default memory allowed per item of the spool size, up to MAX_SPOOL_MEM
+SPOOL_ITEM_MEM = s_const.kibibyte
+
+# estimated python overhead per buffered item
+ITEM_OVERHEAD = 128
+
+# number of slab keys added to a new Bloom filter between yields to the ioloop
+BLOOM_YIELD = 10000
+
+# masks which set two bits of a 64 bit word from 12 bits of a hash
+BLOOM_MASKS = [(1 << (i & 63)) | (1 << (i >> 6)) for i in range(4096)]
+
+class Bloom:
+    '''
+    A blocked Bloom filter used to skip slab lookups for keys which were never added.
+
+    Each key sets four bits within a single 64 bit word chosen using the builtin hash()
+    of the key, so a probe costs one array lookup. The hash is computed once by the
+    caller and passed to has() and add().
+    '''
+    # ~2% false positives using 10 bits per item
+    bitsper = 10
+
+    def __init__(self, capacity=MAX_SPOOL_SIZE, maxsize=MAX_SPOOL_MEM // 4):
+        self.nwords = max(1, min(capacity * self.bitsper // 64, maxsize // 8))
+        self.words = array.array('Q', bytes(self.nwords * 8))
+        self.size = self.nwords * 8
+        self.count = 0
+        self.maxsize = maxsize
+        self.capacity = self.nwords * 64 // self.bitsper
+
+    def add(self, hkey):
+        indx = (hkey >> 24) % self.nwords
+        self.words[indx] |= BLOOM_MASKS[hkey & 4095] | BLOOM_MASKS[(hkey >> 12) & 4095]
+        self.count += 1
+
+    def has(self, hkey):
+        mask = BLOOM_MASKS[hkey & 4095] | BLOOM_MASKS[(hkey >> 12) & 4095]
+        return self.words[(hkey >> 24) % self.nwords] & mask == mask
+
+    def isfull(self):
+        '''
+        Return True if the filter is at capacity and a larger one fits in maxsize.
+        '''
+        return self.count >= self.capacity and self.size * 4 <= self.maxsize
+
+    def copy(self):
+        bloom = Bloom.__new__(Bloom)
+        bloom.nwords = self.nwords
+        bloom.words = array.array('Q', self.words)
+        bloom.size = self.size
+        bloom.count = self.count
+        bloom.maxsize = self.maxsize
+        bloom.capacity = self.capacity
+        return bloom
+
 class Spooled(s_base.Base):
     '''
     A Base class that can be used to implement objects which fallback to lmdb.
@@ -17,20 +79,36 @@ class Spooled(s_base.Base):
     together. Under memory pressure, these objects have a better shot of getting paged out.
     '''
 
-    async def __anit__(self, dirn=None, size=MAX_SPOOL_SIZE, cell=None):
+    async def __anit__(self, dirn=None, size=MAX_SPOOL_SIZE, cell=None, memsize=None):
         '''
         Args:
             dirn(Optional[str]): base directory used for backing slab.  If None, system temporary directory is used
             size(int):  maximum number of items stored in RAM before spooled to disk
+            memsize(int): maximum bytes of RAM used for the Bloom filter and write buffer once spooled to disk.
+                If None, SPOOL_ITEM_MEM bytes per item of size are used, up to MAX_SPOOL_MEM.
+
+        Notes:
+            Once spooled to disk, new items are buffered in RAM and written to the slab as sorted
+            bulk inserts, and a Bloom filter is used to avoid slab lookups for most missing keys.
         '''
         await s_base.Base.__anit__(self)
 
+        if memsize is None:
+            memsize = min(MAX_SPOOL_MEM, size * SPOOL_ITEM_MEM)
+
         self.cell = cell
         self.size = size
         self.dirn = dirn
         self.slab = None
+        self.bloom = None
+        self.bloomadds = None
+        self.memsize = memsize
         self.fallback = False
 
+        # buffered writes which have not been flushed to the slab
+        self.pending = {}
+        self.pendsize = 0
+
         async def fini():
 
             if self.slab is not None:
@@ -52,13 +130,104 @@ class Spooled(s_base.Base):
         if self.cell is not None:
             self.slab.addResizeCallback(self.cell.checkFreeSpace)
 
+        self.bloom = Bloom(capacity=self.size * 2, maxsize=self.memsize // 4)
+
+        self.pending.clear()
+        self.pendsize = 0
+
+    def _hasLkey(self, lkey, hkey):
+
+        if lkey in self.pending:
+            return True
+
+        if not self.bloom.has(hkey):
+            return False
+
+        return self.slab.has(lkey)
+
+    async def _addBloom(self, hkey):
+
+        self.bloom.add(hkey)
+
+        if self.bloomadds is not None:
+            self.bloomadds.append(hkey)
+            return
+
+        if self.bloom.isfull():
+            await self._growBloom()
+
+    async def _growBloom(self):
+        '''
+        Replace the Bloom filter with one four times larger built from the current keys.
+
+        Keys added while the slab is scanned are recorded and added to the new filter
+        before it replaces the current one.
+        '''
+        bloom = self.bloom
+        newbloom = Bloom(capacity=bloom.capacity * 4, maxsize=self.memsize // 4)
+
+        bloomadds = self.bloomadds = []
+
+        try:
+
+            for lkey in self.pending:
+                newbloom.add(hash(lkey))
+
+            for i, lkey in enumerate(self.slab.scanKeys(), 1):
+
+                newbloom.add(hash(lkey))
+
+                if i % BLOOM_YIELD == 0:
+                    await asyncio.sleep(0)
+                    # the spooled object was cleared or fini'd
+                    if self.isfini or self.bloom is not bloom:
+                        return
+
+            for hkey in bloomadds:
+                newbloom.add(hkey)
+
+            self.bloom = newbloom
+
+        finally:
+            if self.bloomadds is bloomadds:
+                self.bloomadds = None
+
+    def _popPending(self, lkey):
+
+        lval = self.pending.pop(lkey, None)
+        if lval is not None:
+            self.pendsize -= len(lkey) + len(lval) + ITEM_OVERHEAD
+
+        return lval
+
+    def _addPending(self, lkey, lval):
+        '''
+        Buffer an item to be written to the slab and return True if the buffer should be flushed.
+        '''
+        self.pending[lkey] = lval
+        self.pendsize += len(lkey) + len(lval) + ITEM_OVERHEAD
+
+        return self.pendsize >= self.memsize - self.bloom.size
+
+    async def _flush(self):
+        '''
+        Write the buffered items to the slab as sorted bulk inserts.
+        '''
+        if not self.pending:
+            return
+
+        # items leave the buffer as each chunk is written so they are always found by other tasks
+        for lkeys in s_common.chunks(sorted(self.pending), self.slab.max_xactops_len):
+            kvpairs = [(lkey, lval) for lkey in lkeys if (lval := self._popPending(lkey)) is not None]
+            await self.slab.putmulti(kvpairs)
+
 class Set(Spooled):
     '''
     A minimal set-like implementation that will spool to a slab on large growth.
     '''
 
-    async def __anit__(self, dirn=None, size=MAX_SPOOL_SIZE, cell=None):
-        await Spooled.__anit__(self, dirn=dirn, size=size, cell=cell)
+    async def __anit__(self, dirn=None, size=MAX_SPOOL_SIZE, cell=None, memsize=None):
+        await Spooled.__anit__(self, dirn=dirn, size=size, cell=cell, memsize=memsize)
         self.realset = set()
         self.len = 0
 
@@ -69,12 +238,15 @@ class Set(Spooled):
                 yield item
             return
 
+        await self._flush()
+
         for byts in self.slab.scanKeys():
             yield s_msgpack.un(byts)
 
     def __contains__(self, valu):
         if self.fallback:
-            return self.slab.get(s_msgpack.en(valu)) is not None
+            lkey = s_msgpack.en(valu)
+            return self._hasLkey(lkey, hash(lkey))
         return valu in self.realset
 
     def __len__(self):
@@ -87,11 +259,13 @@ class Set(Spooled):
         return len(self.realset)
 
     async def copy(self):
-        newset = await Set.anit(dirn=self.dirn, size=self.size, cell=self.cell)
+        newset = await Set.anit(dirn=self.dirn, size=self.size, cell=self.cell, memsize=self.memsize)
 
         if self.fallback:
+            await self._flush()
             await newset._initFallBack()
             await self.slab.copydb(None, newset.slab)
+            newset.bloom = self.bloom.copy()
             newset.len = self.len
 
         else:
@@ -110,27 +284,53 @@ class Set(Spooled):
     async def add(self, valu):
 
         if self.fallback:
-            if self.slab.put(s_msgpack.en(valu), b'\x01', overwrite=False):
-                self.len += 1
+
+            lkey = s_msgpack.en(valu)
+            hkey = hash(lkey)
+            if self._hasLkey(lkey, hkey):
+                return
+
+            self.len += 1
+            if self._addPending(lkey, b'\x01'):
+                await self._flush()
+
+            await self._addBloom(hkey)
             return
 
         self.realset.add(valu)
 
         if len(self.realset) >= self.size:
             await self._initFallBack()
-            [self.slab.put(s_msgpack.en(valu), b'\x01') for valu in self.realset]
+
+            for valu in self.realset:
+                lkey = s_msgpack.en(valu)
+                self._addPending(lkey, b'\x01')
+                self.bloom.add(hash(lkey))
+
             self.len = len(self.realset)
             self.realset.clear()
 
+            await self._flush()
+
     def has(self, key):
         if self.fallback:
-            return self.slab.has(s_msgpack.en(key))
+            lkey = s_msgpack.en(key)
+            return self._hasLkey(lkey, hash(lkey))
         return key in self.realset
 
     def discard(self, valu):
 
         if self.fallback:
-            ret = self.slab.pop(s_msgpack.en(valu))
+
+            lkey = s_msgpack.en(valu)
+            if self._popPending(lkey) is not None:
+                self.len -= 1
+                return
+
+            if not self.bloom.has(hash(lkey)):
+                return
+
+            ret = self.slab.pop(lkey)
             if ret is None:
                 return
             self.len -= 1
@@ -140,9 +340,9 @@ class Set(Spooled):
 
 class Dict(Spooled):
 
-    async def __anit__(self, dirn=None, size=MAX_SPOOL_SIZE, cell=None):
+    async def __anit__(self, dirn=None, size=MAX_SPOOL_SIZE, cell=None, memsize=None):
 
-        await Spooled.__anit__(self, dirn=dirn, size=size, cell=cell)
+        await Spooled.__anit__(self, dirn=dirn, size=size, cell=cell, memsize=memsize)
         self.realdict = {}
         self.len = 0
 
@@ -154,38 +354,83 @@ class Dict(Spooled):
     async def set(self, key, val):
 
         if self.fallback:
-            if self.slab.replace(s_msgpack.en(key), s_msgpack.en(val)) is None:
-                self.len += 1
+
+            lkey = s_msgpack.en(key)
+            lval = s_msgpack.en(val)
+
+            if self._popPending(lkey) is not None:
+                if self._addPending(lkey, lval):
+                    await self._flush()
+                return
+
+            hkey = hash(lkey)
+            if self.bloom.has(hkey) and self.slab.has(lkey):
+                self.slab.put(lkey, lval)
+                return
+
+            self.len += 1
+            if self._addPending(lkey, lval):
+                await self._flush()
+
+            await self._addBloom(hkey)
             return
 
         self.realdict[key] = val
 
         if len(self.realdict) >= self.size:
             await self._initFallBack()
-            [self.slab.put(s_msgpack.en(k), s_msgpack.en(v)) for (k, v) in self.realdict.items()]
+
+            for (k, v) in self.realdict.items():
+                lkey = s_msgpack.en(k)
+                self._addPending(lkey, s_msgpack.en(v))
+                self.bloom.add(hash(lkey))
+
             self.len = len(self.realdict)
             self.realdict.clear()
 
+            await self._flush()
+
     def pop(self, key, defv=None):
         if self.fallback:
-            ret = self.slab.pop(s_msgpack.en(key))
+
+            lkey = s_msgpack.en(key)
+
+            ret = self._popPending(lkey)
             if ret is None:
-                return defv
+
+                if not self.bloom.has(hash(lkey)):
+                    return defv
+
+                ret = self.slab.pop(lkey)
+                if ret is None:
+                    return defv
+
             self.len -= 1
             return s_msgpack.un(ret)
         return self.realdict.pop(key, defv)
 
     def has(self, key):
         if self.fallback:
-            return self.slab.has(s_msgpack.en(key))
+            lkey = s_msgpack.en(key)
+            return self._hasLkey(lkey, hash(lkey))
         return key in self.realdict
 
     def get(self, key, defv=None):
 
         if self.fallback:
-            byts = self.slab.get(s_msgpack.en(key))
+
+            lkey = s_msgpack.en(key)
+
+            byts = self.pending.get(lkey)
             if byts is None:
-                return defv
+
+                if not self.bloom.has(hash(lkey)):
+                    return defv
+
+                byts = self.slab.get(lkey)
+                if byts is None:
+                    return defv
+
             return s_msgpack.un(byts)
 
         return self.realdict.get(key, defv)
@@ -193,7 +438,8 @@ class Dict(Spooled):
     def keys(self):
 
         if self.fallback:
-            for lkey in self.slab.scanKeys():
+            # buffered keys are merged into the sorted slab keys
+            for lkey in heapq.merge(self.slab.scanKeys(), sorted(self.pending)):
                 yield s_msgpack.un(lkey)
 
         # avoid edit while iter issues...
@@ -203,7 +449,7 @@ class Dict(Spooled):
     def items(self):
 
         if self.fallback:
-            for lkey, lval in self.slab.scanByFull():
+            for lkey, lval in heapq.merge(self.slab.scanByFull(), sorted(self.pending.items())):
                 yield s_msgpack.un(lkey), s_msgpack.un(lval)
 
         for item in list(self.realdict.items()):
@@ -1,3 +1,4 @@
+import time
 import types
 import pprint
 import asyncio
@@ -5,6 +6,7 @@ import hashlib
 import logging
 import argparse
 import contextlib
+import contextvars
 import collections
 
 import synapse.exc as s_exc
@@ -1896,6 +1898,109 @@ class StormDmon(s_base.Base):
             # bottom of the loop... wait it out
             await self.waitfini(timeout=1)
 
+# the profile stats of the operator currently pulling nodes
+profoper = contextvars.ContextVar('profoper', default=None)
+
+class Profiler:
+    '''
+    Collect per-operator statistics for a Storm query run with the profile option.
+
+    Time and storage counts are inclusive of the operators which feed each
+    operator; the exclusive values are calculated when the plan is packed.
+    '''
+    def __init__(self):
+        self.stats = {}
+
+    def _getStats(self, item):
+        stat = self.stats.get(id(item))
+        if stat is None:
+            stat = self.stats[id(item)] = {
+                'item': item,
+                'parent': profoper.get(),
+                'runs': 0,
+                'count': 0,
+                'took': 0.0,
+                'rows': 0,
+                'sodes': 0,
+            }
+        return stat
+
+    def wrap(self, runt, item, genr):
+        '''
+        Wrap the output of a query or operator generator to record statistics.
+        '''
+        stat = self._getStats(item)
+        stat['runs'] += 1
+        return self._wrapGenr(runt.snap, stat, genr)
+
+    async def _wrapGenr(self, snap, stat, genr):
+
+        while True:
+
+            rows = snap.joinrows
+            sodes = snap.joinsodes
+            tick = time.perf_counter()
+
+            token = profoper.set(stat)
+            try:
+                valu = await genr.__anext__()
+            except StopAsyncIteration:
+                break
+            finally:
+                profoper.reset(token)
+                stat['took'] += time.perf_counter() - tick
+                stat['rows'] += snap.joinrows - rows
+                stat['sodes'] += snap.joinsodes - sodes
+
+            stat['count'] += 1
+            yield valu
+
+    def pack(self, query):
+        '''
+        Return the annotated plan tree for the given top level query.
+        '''
+        kids = collections.defaultdict(list)
+        for stat in self.stats.values():
+            parent = stat.get('parent')
+            if parent is not None and isinstance(stat.get('item'), s_ast.Query):
+                kids[id(parent)].append(stat)
+
+        return {'query': self._packQuery(self.stats.get(id(query)), kids)}
+
+    def _packQuery(self, qstat, kids):
+
+        query = qstat.get('item')
+
+        info = {
+            'text': query.text,
+            'runs': qstat.get('runs'),
+            'in': qstat.get('count'),
+            'opers': [],
+        }
+
+        prev = qstat
+        for oper in query.kids:
+
+            stat = self.stats.get(id(oper))
+            if stat is None:
+                continue
+
+            info['opers'].append({
+                'name': oper.__class__.__name__,
+                'text': oper.getAstText(),
+                'in': prev.get('count'),
+                'out': stat.get('count'),
+                'took': round(stat.get('took') * 1000, 3),
+                'self': round((stat.get('took') - prev.get('took')) * 1000, 3),
+                'rows': stat.get('rows') - prev.get('rows'),
+                'sodes': stat.get('sodes') - prev.get('sodes'),
+                'queries': [self._packQuery(s, kids) for s in kids.get(id(stat), ())],
+            })
+
+            prev = stat
+
+        return info
+
 class Runtime(s_base.Base):
     '''
     A Runtime represents the instance of a running query.
@@ -1933,6 +2038,11 @@ class Runtime(s_base.Base):
         self.spawn_log_conf = await self.snap.core._getSpawnLogConf()
 
         self.readonly = opts.get('readonly', False)  # EXPERIMENTAL: Make it safe to run untrusted queries
+
+        self.profiler = None
+        if opts.get('profile', False):
+            self.profiler = Profiler()
+
         self.model = snap.core.getDataModel()
 
         self.task = asyncio.current_task()
@@ -2391,6 +2501,7 @@ class Runtime(s_base.Base):
         runt = await Runtime.anit(query, snap, user=self.user, opts=opts, root=self)
         if self.debug:
             runt.debug = True
+        runt.profiler = self.profiler
         runt.asroot = self.asroot
         runt.readonly = self.readonly
 
@@ -2404,6 +2515,7 @@ class Runtime(s_base.Base):
         async with await Runtime.anit(query, self.snap, user=self.user, opts=opts) as runt:
             if self.debug:
                 runt.debug = True
+            runt.profiler = self.profiler
             runt.asroot = self.asroot
             runt.readonly = self.readonly
             yield runt
@@ -2415,6 +2527,7 @@ class Runtime(s_base.Base):
         runt = await Runtime.anit(query, self.snap, user=self.user, opts=opts)
         if self.debug:
             runt.debug = True
+        runt.profiler = self.profiler
         runt.asroot = self.asroot
         runt.readonly = self.readonly
         return runt
@@ -5343,17 +5456,32 @@ class ParallelCmd(Cmd):
     Examples:
         inet:ipv4#foo | parallel { $place = $lib.import(foobar).lookup(:latlong) [ :place=$place ] }
 
+        // Shard a CPU intensive read-only pipeline across 4 Storm pool mirror queries
+        inet:fqdn | parallel --procs 4 { +$lib.regex.search('^[a-z]+$', :host) -> inet:dns:a }
+
     NOTE: Storm variables set within the parallel query pipelines do not interact.
+
+    NOTE: The --procs option requires a configured Storm pool. Batches of inbound nodes are sent
+          to read-only queries on the Storm pool mirrors, which execute in their own processes. Only
+          variables which may be serialized are passed to the mirror queries, and nodes are yielded
+          without their path variables. If there is no Storm pool configured, a warning is issued and
+          the pipelines are executed within the local Cortex process.
     '''
     name = 'parallel'
     readonly = True
 
+    mirrorbatch = 100
+
     def getArgParser(self):
         pars = Cmd.getArgParser(self)
 
         pars.add_argument('--size', default=8,
             help='The number of parallel Storm pipelines to execute.')
 
+        pars.add_argument('--procs', type='int', default=None,
+            help='Shard the inbound nodes across the given number of read-only Storm pool mirror queries '
+                 '(requires a configured Storm pool).')
+
         pars.add_argument('query',
             help='The query to execute in parallel.')
 
@@ -5381,6 +5509,74 @@ class ParallelCmd(Cmd):
         except Exception as e:
             await outq.put(e)
 
+    async def mirrorpipe(self, runt, query, text, varz, inq, outq):
+        try:
+            done = False
+            while not done:
+
+                item = await inq.get()
+                if item is None:
+                    break
+
+                items = [item]
+                while len(items) < self.mirrorbatch and not inq.empty():
+
+                    item = inq.get_nowait()
+                    if item is None:
+                        done = True
+                        break
+
+                    items.append(item)
+
+                async for item in self.execMirrorBatch(runt, query, text, varz, items):
+                    await outq.put(item)
+
+            await outq.put(None)
+
+        except asyncio.CancelledError:  # pragma: no cover
+            raise
+
+        except Exception as e:
+            await outq.put(e)
+
+    async def execMirrorBatch(self, runt, query, text, varz, items):
+
+        core = runt.snap.core
+
+        opts = {
+            'user': runt.user.iden,
+            'view': runt.snap.view.iden,
+            'vars': varz,
+            'idens': [node.iden() for (node, path) in items],
+        }
+
+        proxy = await core._getMirrorProxy(opts)
+        if proxy is None:
+            async with runt.getSubRuntime(query) as subr:
+                async for item in subr.execute(genr=s_common.agen(*items)):
+                    yield item
+            return
+
+        mirropts = await core._getMirrorOpts(opts)
+        mirropts['readonly'] = True
+
+        async for mesg in proxy.storm(text, opts=mirropts):
+
+            if mesg[0] == 'node':
+                node = await runt.snap.getNodeByBuid(s_common.uhex(mesg[1][1]['iden']))
+                if node is not None:
+                    yield node, runt.initPath(node)
+
+            elif mesg[0] in ('print', 'warn'):
+                await runt.snap.fire(mesg[0], **mesg[1])
+
+            elif mesg[0] == 'err':
+                excname, errinfo = mesg[1]
+                errinfo.pop('eline', None)
+                errinfo.pop('efile', None)
+                excctor = getattr(s_exc, excname, s_exc.SynErr)
+                raise excctor(**errinfo)
+
     async def execStormCmd(self, runt, genr):
 
         if not self.runtsafe:
@@ -5388,6 +5584,7 @@ class ParallelCmd(Cmd):
             raise s_exc.StormRuntimeError(mesg=mesg)
 
         size = await s_stormtypes.toint(self.opts.size)
+        procs = await s_stormtypes.toint(self.opts.procs, noneok=True)
 
         _query = await s_stormtypes.tostr(self.opts.query)
         query = await runt.getStormQuery(_query)
@@ -5395,10 +5592,29 @@ class ParallelCmd(Cmd):
         async with runt.getSubRuntime(query) as subr:
             query.validate(subr)
 
+        if procs is not None:
+
+            if procs < 1:
+                mesg = 'parallel --procs must be greater than 0.'
+                raise s_exc.BadArg(mesg=mesg)
+
+            if runt.snap.core.stormpool is None:
+                await runt.warnonce('parallel --procs requires a Storm pool, running the pipelines locally.')
+                procs = None
+
+        varz = None
+        if procs is not None:
+            size = procs
+            varz = {name: valu for (name, valu) in runt.getScopeVars().items() if s_msgpack.isok(valu)}
+
         async with await s_base.Base.anit() as base:
 
-            inq = asyncio.Queue(maxsize=size)
-            outq = asyncio.Queue(maxsize=size)
+            qsize = size
+            if procs is not None:
+                qsize = size * self.mirrorbatch
+
+            inq = asyncio.Queue(maxsize=qsize)
+            outq = asyncio.Queue(maxsize=qsize)
 
             async def pump():
                 try:
@@ -5412,7 +5628,10 @@ class ParallelCmd(Cmd):
 
             base.schedCoro(pump())
             for i in range(size):
-                base.schedCoro(self.pipeline(runt, query, inq, outq))
+                if procs is None:
+                    base.schedCoro(self.pipeline(runt, query, inq, outq))
+                else:
+                    base.schedCoro(self.mirrorpipe(runt, query, _query, varz, inq, outq))
 
             exited = 0
             while True:
@@ -5641,6 +5860,16 @@ class ScrapeCmd(Cmd):
 
         # Limit scrape to specific forms.
         inet:search:query | scrape --forms (inet:fqdn, inet:ipv4)
+
+        # Scrape the contents of the files for inbound file:bytes nodes from the Axon.
+        file:bytes | scrape --axon
+
+        # Scrape the contents of a file in the Axon by SHA256.
+        scrape --axon $sha256
+
+    Notes:
+        When --axon is specified, files are scraped in overlapping windows of text without
+        loading the entire file into memory.
     '''
 
     name = 'scrape'
@@ -5656,10 +5885,31 @@ class ScrapeCmd(Cmd):
                           help='Do not remove de-fanging from text before scraping')
         pars.add_argument('--forms', default=[],
                           help='Only scrape values which match specific forms.')
+        pars.add_argument('--axon', default=False, action='store_true',
+                          help='Scrape the contents of files in the Axon using the values as SHA256 hashes. '
+                               'Inbound nodes default to their :sha256 property.')
         pars.add_argument('values', nargs='*',
                           help='Specific relative properties or variables to scrape')
         return pars
 
+    async def iterScrapes(self, todo, refang=True):
+
+        if not self.opts.axon:
+            for text in todo:
+                async for item in self.runt.snap.view.scrapeIface(str(text), refang=refang):
+                    yield item
+            return
+
+        if not self.runt.allowed(('axon', 'get')):
+            self.runt.confirm(('storm', 'lib', 'axon', 'get'))
+
+        await self.runt.snap.core.getAxon()
+
+        for sha256 in todo:
+            genr = self.runt.snap.core.axon.get(s_common.uhex(str(sha256)))
+            async for item in self.runt.snap.view.scrapeIfaceGenr(genr, refang=refang):
+                yield item
+
     async def execStormCmd(self, runt, genr):
 
         node = None
@@ -5678,15 +5928,18 @@ class ScrapeCmd(Cmd):
             todo = await s_stormtypes.toprim(self.opts.values)
 
             # if a list of props haven't been specified, then default to ALL of them
+            # or to the :sha256 property when scraping files from the Axon
             if not todo:
-                todo = list(node.props.values())
+                if self.opts.axon:
+                    sha256 = node.get('sha256')
+                    todo = () if sha256 is None else (sha256,)
+                else:
+                    todo = list(node.props.values())
 
             link = {'type': 'scrape'}
-            for text in todo:
-
-                text = str(text)
+            if todo:
 
-                async for (form, valu, _) in self.runt.snap.view.scrapeIface(text, refang=refang):
+                async for (form, valu, _) in self.iterScrapes(todo, refang=refang):
                     if forms and form not in forms:
                         continue
 
@@ -5716,16 +5969,15 @@ class ScrapeCmd(Cmd):
             elif not isinstance(forms, (tuple, list, set)):
                 forms = (forms,)
 
-            for item in self.opts.values:
-                text = str(await s_stormtypes.toprim(item))
+            todo = [await s_stormtypes.toprim(item) for item in self.opts.values]
 
-                async for (form, valu, _) in self.runt.snap.view.scrapeIface(text, refang=refang):
-                    if forms and form not in forms:
-                        continue
+            async for (form, valu, _) in self.iterScrapes(todo, refang=refang):
+                if forms and form not in forms:
+                    continue
 
-                    addnode = await runt.snap.addNode(form, valu)
-                    if self.opts.doyield:
-                        yield addnode, runt.initPath(addnode)
+                addnode = await runt.snap.addNode(form, valu)
+                if self.opts.doyield:
+                    yield addnode, runt.initPath(addnode)
 
 class LiftByVerb(Cmd):
     '''
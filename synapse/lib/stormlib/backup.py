@@ -13,6 +13,8 @@ class BackupLib(s_stormtypes.Lib):
                       {'name': 'name', 'type': 'str', 'desc': 'The name of the backup to generate.', 'default': None, },
                       {'name': 'wait', 'type': 'boolean', 'desc': 'If true, wait for the backup to complete before returning.',
                        'default': True, },
+                      {'name': 'base', 'type': 'str', 'desc': 'The name of a previous backup to create an incremental backup from.',
+                       'default': None, },
                   ),
                   'returns': {'type': 'str', 'desc': 'The name of the newly created backup.', }}},
         {'name': 'list', 'desc': 'Get a list of backup names.',
@@ -42,11 +44,12 @@ class BackupLib(s_stormtypes.Lib):
             'del': self._delBackup,
         }
 
-    async def _runBackup(self, name=None, wait=True):
+    async def _runBackup(self, name=None, wait=True, base=None):
         name = await s_stormtypes.tostr(name, noneok=True)
         wait = await s_stormtypes.tobool(wait)
+        base = await s_stormtypes.tostr(base, noneok=True)
 
-        todo = s_common.todo('runBackup', name=name, wait=wait)
+        todo = s_common.todo('runBackup', name=name, wait=wait, base=base)
         gatekeys = ((self.runt.user.iden, ('backup', 'run'), None),)
         return await self.dyncall('cortex', todo, gatekeys=gatekeys)
 
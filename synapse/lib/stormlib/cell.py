@@ -140,6 +140,21 @@ class CellLib(s_stormtypes.Lib):
                                '(defaults to the Cortex if not provided).'},
                   ),
                   'returns': {'type': 'list', 'desc': 'A list of Telepath URLs.', }}},
+        {'name': 'getMirrorStatus', 'desc': '''
+            Get the mirror sync status for the Cortex or a connected Service.
+
+            The status includes the local and leader Nexus offsets, the rate at which
+            changes are being applied (per second) and the estimated time (in milliseconds)
+            until the mirror reaches the realtime change window.
+            ''',
+         'type': {'type': 'function', '_funcname': '_getMirrorStatus',
+                  'args': (
+                      {'name': 'name', 'type': 'str', 'default': None,
+                       'desc': 'The name, or iden, of the service to get mirror status for '
+                               '(defaults to the Cortex if not provided).'},
+                  ),
+                  'returns': {'type': ['dict', 'null'],
+                              'desc': 'A dictionary of mirror sync status or null if not a mirror.', }}},
         {'name': 'hotFixesApply', 'desc': 'Apply known data migrations and fixes via storm.',
          'type': {'type': 'function', '_funcname': '_hotFixesApply', 'args': (),
                   'returns': {'type': 'list',
@@ -181,6 +196,7 @@ class CellLib(s_stormtypes.Lib):
             'getSystemInfo': self._getSystemInfo,
             'getHealthCheck': self._getHealthCheck,
             'getMirrorUrls': self._getMirrorUrls,
+            'getMirrorStatus': self._getMirrorStatus,
             'hotFixesApply': self._hotFixesApply,
             'hotFixesCheck': self._hotFixesCheck,
             'trimNexsLog': self._trimNexsLog,
@@ -297,6 +313,26 @@ class CellLib(s_stormtypes.Lib):
         await ssvc.proxy.waitready()
         return await ssvc.proxy.getMirrorUrls()
 
+    @s_stormtypes.stormfunc(readonly=True)
+    async def _getMirrorStatus(self, name=None):
+
+        if not self.runt.isAdmin():
+            mesg = '$lib.cell.getMirrorStatus() requires admin privs.'
+            raise s_exc.AuthDeny(mesg=mesg, user=self.runt.user.iden, username=self.runt.user.name)
+
+        name = await s_stormtypes.tostr(name, noneok=True)
+
+        if name is None:
+            return await self.runt.snap.core.getMirrorStatus()
+
+        ssvc = self.runt.snap.core.getStormSvc(name)
+        if ssvc is None:
+            mesg = f'No service with name/iden: {name}'
+            raise s_exc.NoSuchName(mesg=mesg)
+
+        await ssvc.proxy.waitready()
+        return await ssvc.proxy.getMirrorStatus()
+
     async def _trimNexsLog(self, consumers=None, timeout=30):
         if not self.runt.isAdmin():
             mesg = '$lib.cell.trimNexsLog() requires admin privs.'
@@ -1248,6 +1248,12 @@ class StormPoolSetCmd(s_storm.Cmd):
             help='The maximum amount of time to wait for a connection from the pool to become available.')
         pars.add_argument('--sync-timeout', type='int', default=2,
             help='The maximum amount of time to wait for the mirror to be in sync with the leader')
+        pars.add_argument('--inflight-weight', type='float', default=1.0,
+            help='The weight given to each query currently running on a mirror when selecting a mirror.')
+        pars.add_argument('--latency-weight', type='float', default=1.0,
+            help='The weight given to each second of recent query latency on a mirror when selecting a mirror.')
+        pars.add_argument('--lag-weight', type='float', default=0.01,
+            help='The weight given to each Nexus entry a mirror is behind the leader when selecting a mirror.')
         pars.add_argument('url', type='str', required=True, help='The telepath URL for the AHA service pool.')
         return pars
 
@@ -1271,6 +1277,9 @@ class StormPoolSetCmd(s_storm.Cmd):
         opts = {
             'timeout:sync': self.opts.sync_timeout,
             'timeout:connection': self.opts.connection_timeout,
+            'weight:inflight': self.opts.inflight_weight,
+            'weight:latency': self.opts.latency_weight,
+            'weight:lag': self.opts.lag_weight,
         }
 
         await self.runt.snap.core.setStormPool(self.opts.url, opts)
@@ -1321,3 +1330,19 @@ class StormPoolGetCmd(s_storm.Cmd):
         await self.runt.printf(f'Storm Pool URL: {url}')
         await self.runt.printf(f'Sync Timeout (secs): {opts.get("timeout:sync")}')
         await self.runt.printf(f'Connection Timeout (secs): {opts.get("timeout:connection")}')
+
+        weights = self.runt.snap.core.getStormPoolWeights(opts)
+        await self.runt.printf(f'In-flight Query Weight: {weights.get("inflight")}')
+        await self.runt.printf(f'Latency Weight (per sec): {weights.get("latency")}')
+        await self.runt.printf(f'Nexus Lag Weight (per entry): {weights.get("lag")}')
+
+        stormpool = self.runt.snap.core.stormpool
+        if stormpool is None:
+            return
+
+        for load in sorted(stormpool.getProxyLoad(), key=lambda x: str(x.get('name'))):
+            latency = load.get('latency')
+            if latency is None:
+                latency = '-'
+            await self.runt.printf(f'Mirror {load.get("name")}: in-flight={load.get("inflight")} '
+                                   f'latency={latency}ms lag={load.get("lag")}')
@@ -2280,6 +2280,33 @@ class LibAxon(Lib):
                   ),
                   'returns': {'name': 'yields', 'type': 'list',
                               'desc': 'A list of strings from the CSV file.'}}},
+        {'name': 'scrape', 'desc': '''
+            Scrape a text file stored in the Axon without loading the entire file into memory.
+
+            Notes:
+                The file is decoded and scraped in overlapping windows of text and results
+                are yielded as each window is scraped. The offsets of the results are relative
+                to the start of the file.
+
+            Example:
+                Create nodes for the values scraped from a given file::
+
+                    for ($form, $valu, $info) in $lib.axon.scrape($sha256) {
+                        [ *$form=$valu ]
+                    }
+            ''',
+         'type': {'type': 'function', '_funcname': 'scrape',
+                  'args': (
+                      {'name': 'sha256', 'type': 'str', 'desc': 'The SHA256 hash of the file.'},
+                      {'name': 'refang', 'type': 'boolean', 'default': True,
+                       'desc': 'Whether to remove de-fanging schemes from text before scraping.'},
+                      {'name': 'unique', 'type': 'boolean', 'default': False,
+                       'desc': 'Only yield each unique value once.'},
+                      {'name': 'errors', 'type': 'str', 'default': 'ignore',
+                       'desc': 'Specify how encoding errors should handled.'},
+                  ),
+                  'returns': {'name': 'yields', 'type': 'list',
+                              'desc': 'A list of (form, value, info) for each value scraped from the file.'}}},
         {'name': 'metrics', 'desc': '''
         Get runtime metrics of the Axon.
 
@@ -2393,6 +2420,7 @@ class LibAxon(Lib):
             'readlines': self.readlines,
             'jsonlines': self.jsonlines,
             'csvrows': self.csvrows,
+            'scrape': self.scrape,
             'metrics': self.metrics,
             'put': self.put,
             'has': self.has,
@@ -2627,6 +2655,23 @@ class LibAxon(Lib):
             yield item
             await asyncio.sleep(0)
 
+    @stormfunc(readonly=True)
+    async def scrape(self, sha256, refang=True, unique=False, errors='ignore'):
+
+        if not self.runt.allowed(('axon', 'get')):
+            self.runt.confirm(('storm', 'lib', 'axon', 'get'))
+
+        await self.runt.snap.core.getAxon()
+
+        sha256 = await tostr(sha256)
+        refang = await tobool(refang)
+        unique = await tobool(unique)
+        errors = await tostr(errors)
+
+        genr = self.runt.snap.core.axon.get(s_common.uhex(sha256))
+        async for item in self.runt.snap.view.scrapeIfaceGenr(genr, unique=unique, refang=refang, errors=errors):
+            yield item
+
     @stormfunc(readonly=True)
     async def metrics(self):
         if not self.runt.allowed(('axon', 'has')):
@@ -3565,7 +3610,7 @@ class LibFeed(Lib):
 
         #  small work around for the feed API consistency
         if name == 'syn.nodes':
-            async for node in self.runt.snap.addNodes(data):
+            async for node in self.runt.snap.addNodes(data, batch=True):
                 yield node
             return
 
@@ -7489,6 +7534,11 @@ class Layer(Prim):
             valu = await tobool(valu)
         elif name == 'readonly':
             valu = await tobool(valu)
+        elif name in ('buidcache:size', 'buidcache:maxbytes'):
+            if valu is undef:
+                valu = None
+            else:
+                valu = await toint(valu, noneok=True)
         else:
             mesg = f'Layer does not support setting: {name}'
             raise s_exc.BadOptValu(mesg=mesg)
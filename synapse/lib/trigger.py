@@ -301,6 +301,34 @@ class Triggers:
             for trig in cached:
                 await trig.execute(n1, vars=varz)
 
+    def getTrigForms(self):
+        '''
+        Return the set of form names which may cause an enabled trigger to fire.
+
+        Notes:
+            A None value in the set indicates that a trigger may fire for any form.
+        '''
+        forms = set()
+
+        for trig in self.triggers.values():
+
+            if not trig.tdef.get('enabled'):
+                continue
+
+            prop = trig.tdef.get('prop')
+            if prop is None:
+                forms.add(trig.tdef.get('form'))
+                continue
+
+            pobj = self.view.core.model.prop(prop)
+            if pobj is None or pobj.isuniv:
+                forms.add(None)
+                continue
+
+            forms.add(pobj.form.name)
+
+        return forms
+
     async def load(self, tdef):
 
         trig = Trigger(self.view, tdef)
@@ -7,6 +7,7 @@ import synapse.exc as s_exc
 import synapse.common as s_common
 
 import synapse.lib.cell as s_cell
+import synapse.lib.const as s_const
 import synapse.lib.snap as s_snap
 import synapse.lib.layer as s_layer
 import synapse.lib.nexus as s_nexus
@@ -23,6 +24,10 @@ import synapse.lib.stormtypes as s_stormtypes
 
 logger = logging.getLogger(__name__)
 
+# bounds for the batches of nodeedits applied to the parent view during a merge
+mergechunksize = 4 * s_const.mebibyte
+mergechunkmax = 1000
+
 class ViewApi(s_cell.CellApi):
 
     async def __anit__(self, core, link, user, view):
@@ -404,41 +409,39 @@ class View(s_nexus.Pusher):  # type: ignore
                 'merge': merge.get('iden'),
             }
 
-            async def chunked():
-                nodeedits = []
-
-                async for nodeedit in self.layers[0].iterLayerNodeEdits():
-
-                    nodeedits.append(nodeedit)
-
-                    if len(nodeedits) == 10:
-                        yield nodeedits
-                        nodeedits.clear()
-
-                if nodeedits:
-                    yield nodeedits
-
             total = self.layers[0].getStorNodeCount()
 
             count = 0
-            nextprog = 1000
+            lastbuid = None
+
+            # resume from the last checkpoint if we were interrupted
+            byts = self.core.slab.get(self.bidn + b'merge:prog', db='view:meta')
+            if byts is not None:
+                prog = s_msgpack.un(byts)
+                count = prog.get('count', 0)
+                lastbuid = prog.get('buid')
+
+            nextprog = count + 1000
 
             await self.core.feedBeholder('view:merge:prog', {'view': self.iden, 'count': count, 'total': total, 'merge': merge, 'votes': votes})
 
             async with await self.parent.snap(user=self.core.auth.rootuser) as snap:
 
-                async for edits in chunked():
+                async for edits in self._chunkMergeEdits(lastbuid=lastbuid):
 
                     meta['time'] = s_common.now()
 
-                    await snap.saveNodeEdits(edits, meta)
+                    await self._saveMergeEdits(snap, edits, meta)
                     await asyncio.sleep(0)
 
                     count += len(edits)
 
+                    prog = {'buid': edits[-1][0], 'count': count}
+                    self.core.slab.put(self.bidn + b'merge:prog', s_msgpack.en(prog), db='view:meta')
+
                     if count >= nextprog:
                         await self.core.feedBeholder('view:merge:prog', {'view': self.iden, 'count': count, 'total': total, 'merge': merge, 'votes': votes})
-                        nextprog += 1000
+                        nextprog = count + 1000
 
             await self.core.feedBeholder('view:merge:fini', {'view': self.iden, 'merge': merge, 'merge': merge, 'votes': votes})
 
@@ -448,6 +451,92 @@ class View(s_nexus.Pusher):  # type: ignore
         except Exception as e: # pragma: no cover
             logger.exception(f'Error while merging view: {self.iden}')
 
+    async def _chunkMergeEdits(self, lastbuid=None):
+        # yield lists of nodeedits from the top layer which are bounded by their encoded size
+        size = 0
+        nodeedits = []
+
+        async for nodeedit in self.layers[0].iterLayerNodeEdits(lastbuid=lastbuid):
+
+            nodeedits.append(nodeedit)
+            size += len(s_msgpack.en(nodeedit))
+
+            if size >= mergechunksize or len(nodeedits) >= mergechunkmax:
+                yield nodeedits
+                nodeedits = []
+                size = 0
+
+        if nodeedits:
+            yield nodeedits
+
+    def _getMergeJoinForms(self):
+        # return the set of form names whose edits must be joined in the parent
+        # to fire model callbacks or triggers ( None means every form ).
+        forms = self.parent.triggers.getTrigForms()
+
+        for form in self.core.model.forms.values():
+
+            if form.onadds or form.ondels:
+                forms.add(form.name)
+                continue
+
+            if any(prop.onsets or prop.ondels for prop in form.props.values()):
+                forms.add(form.name)
+
+        return forms
+
+    async def _saveMergeEdits(self, snap, nodeedits, meta):
+        '''
+        Apply a batch of merged nodeedits to the parent view, preserving their order.
+
+        Nodeedits for forms which have no triggers or model callbacks are saved directly
+        to the parent write layer in a single transaction without joining the nodes, and
+        the layer tag:add and tag:del events are fired for the applied changes.
+        '''
+        joinforms = self._getMergeJoinForms()
+        if None in joinforms:
+            await snap.saveNodeEdits(nodeedits, meta)
+            return
+
+        layr = self.parent.layers[0]
+
+        edits = []
+        needjoin = False
+
+        for nodeedit in nodeedits:
+
+            join = nodeedit[1] in joinforms
+            if edits and join != needjoin:
+                if needjoin:
+                    await snap.saveNodeEdits(edits, meta)
+                else:
+                    await self._saveMergeLayrEdits(layr, edits, meta)
+                edits = []
+
+            needjoin = join
+            edits.append(nodeedit)
+
+        if edits:
+            if needjoin:
+                await snap.saveNodeEdits(edits, meta)
+            else:
+                await self._saveMergeLayrEdits(layr, edits, meta)
+
+    async def _saveMergeLayrEdits(self, layr, nodeedits, meta):
+
+        nexsoffs, changes = await layr.saveNodeEdits(nodeedits, meta)
+
+        # fire the layer events which the snap fires when it applies the edits
+        for buid, form, edits in changes:
+
+            for etyp, parms, _ in edits:
+
+                if etyp == s_layer.EDIT_TAG_SET:
+                    await layr.fire('tag:add', tag=parms[0], node=s_common.ehex(buid))
+
+                elif etyp == s_layer.EDIT_TAG_DEL:
+                    await layr.fire('tag:del', tag=parms[0], node=s_common.ehex(buid))
+
     async def isMergeReady(self):
         # count the current votes and potentially trigger a merge
 
@@ -610,7 +699,7 @@ class View(s_nexus.Pusher):  # type: ignore
         '''
         Return a list of storage nodes for the given buid in layer order.
         '''
-        return await self.core._getStorNodes(buid, self.layers)
+        return [s_layer.copySode(sode) for sode in await self.core._getStorNodes(buid, self.layers)]
 
     def init2(self):
         '''
@@ -1707,6 +1796,36 @@ class View(s_nexus.Pusher):  # type: ignore
         return await self.addNodeEdits(edits, meta)
         # TODO remove addNodeEdits?
 
+    async def scrapeIfaceGenr(self, genr, unique=False, refang=True, errors='ignore'):
+        '''
+        Scrape an async generator of utf8 bytes using overlapping windows of decoded text.
+
+        Notes:
+            Each window of text is scraped using scrapeIface() and results are only kept from
+            the portion of the window which was not scraped by an adjacent window. The offsets
+            of the results are relative to the full text.
+        '''
+        async with await s_spooled.Set.anit(dirn=self.core.dirn, cell=self.core) as matches:  # type: s_spooled.Set
+
+            async for (base, lo, hi, text) in s_scrape.genTextWindows(genr, errors=errors):
+
+                async for (form, valu, info) in self.scrapeIface(text, refang=refang):
+
+                    offs = info.get('offset')
+                    if offs is not None:
+                        if offs < lo or offs >= hi:
+                            continue
+                        info['offset'] = base + offs
+
+                    if unique:
+                        key = (form, valu)
+                        if key in matches:
+                            await asyncio.sleep(0)
+                            continue
+                        await matches.add(key)
+
+                    yield form, valu, info
+
     async def scrapeIface(self, text, unique=False, refang=True):
         async with await s_spooled.Set.anit(dirn=self.core.dirn, cell=self.core) as matches:  # type: s_spooled.Set
             # The synapse.lib.scrape APIs handle form arguments for us.
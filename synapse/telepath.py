@@ -29,6 +29,11 @@ logger = logging.getLogger(__name__)
 
 televers = (3, 0)
 
+# weight of the most recent call in the decaying average of pool proxy latency
+LOAD_DECAY = 0.2
+# seconds for pool proxy latency and lag information to lose half of its weight
+LOAD_HALFLIFE = 30.0
+
 aha_clients = {}
 
 async def addAhaUrl(url):
@@ -606,6 +611,18 @@ class Proxy(s_base.Base):
         self.links = collections.deque()
         self._link_poolsize = 4
 
+        # optional maximum number of pool links, further calls wait for a link
+        self._link_poolmax = None
+        self._link_count = 0
+        self._link_waiters = collections.deque()
+        self._link_stats = {
+            'created': 0,
+            'closed': 0,
+            'reused': 0,
+            'waits': 0,
+            'waittime': 0,
+        }
+
         self.synack = None
         self.syndone = asyncio.Event()
 
@@ -625,6 +642,10 @@ class Proxy(s_base.Base):
                 task.reply(mesg)
                 del self.tasks[name]
 
+            for futu in self._link_waiters:
+                if not futu.done():
+                    futu.set_exception(s_exc.IsFini(mesg='Telepath Proxy isfini'))
+
             for link in self.links:
                 await link.fini()
 
@@ -677,17 +698,87 @@ class Proxy(s_base.Base):
 
     async def getPoolLink(self):
 
-        while self.links and not self.isfini:
+        while True:
+
+            if self.isfini:
+                raise s_exc.IsFini()
+
+            while self.links:
+
+                link = self.links.popleft()
+
+                if link.isfini:
+                    continue
+
+                self._link_stats['reused'] += 1
+                return link
+
+            # we need a new one...
+            if self._link_poolmax is None or self._link_count < self._link_poolmax:
+                return await self._initPoolLink()
+
+            link = await self._waitPoolLink()
+            if link is not None:
+                return link
+
+    async def _waitPoolLink(self):
+        '''
+        Wait for a link to be released by another call once the pool is at its maximum size.
+
+        Returns None if a pool link was closed and a new link may be created.
+        '''
+        futu = self.loop.create_future()
+        self._link_waiters.append(futu)
+
+        self._link_stats['waits'] += 1
+        tick = s_common.mononow()
+
+        try:
+            return await futu
+
+        except asyncio.CancelledError:
+            # we may have been handed a link before being cancelled
+            if futu.done() and not futu.cancelled():
+                link = futu.result()
+                if link is not None:
+                    await self._putPoolLink(link)
+            raise
+
+        finally:
+            self._link_stats['waittime'] += s_common.mononow() - tick
+
+    def _wakePoolWaiter(self, link):
 
-            link = self.links.popleft()
+        while self._link_waiters:
 
-            if link.isfini:
+            futu = self._link_waiters.popleft()
+            if futu.done():
                 continue
 
-            return link
+            futu.set_result(link)
+            return True
+
+        return False
 
-        # we need a new one...
-        return await self._initPoolLink()
+    def getPoolInfo(self):
+        '''
+        Get information about the pool of links used for telepath calls.
+
+        Returns:
+            dict: A dictionary containing the number of open pool links (size), idle links (idle),
+            calls waiting for a link (waiting), the configured pool sizes and counters for link
+            creation, closure, reuse and waits. The waittime value is the total time in milliseconds
+            calls have spent waiting for a link.
+        '''
+        info = {
+            'size': self._link_count,
+            'idle': len(self.links),
+            'waiting': len([f for f in self._link_waiters if not f.done()]),
+            'poolsize': self._link_poolsize,
+            'poolmax': self._link_poolmax,
+        }
+        info.update(self._link_stats)
+        return info
 
     async def getPipeline(self, genr, name=None):
         '''
@@ -715,19 +806,37 @@ class Proxy(s_base.Base):
 
         # TODO loop / backoff
 
-        if self.link.get('unix'):
+        # reserve the slot before connecting so concurrent callers respect poolmax
+        self._link_count += 1
+
+        try:
 
-            path = self.link.get('path')
-            link = await s_link.unixconnect(path)
+            if self.link.get('unix'):
 
-        else:
+                path = self.link.get('path')
+                link = await s_link.unixconnect(path)
 
-            ssl = self.link.get('ssl')
-            host = self.link.get('host')
-            port = self.link.get('port')
+            else:
 
-            link = await s_link.connect(host, port, ssl=ssl)
+                ssl = self.link.get('ssl')
+                host = self.link.get('host')
+                port = self.link.get('port')
 
+                link = await s_link.connect(host, port, ssl=ssl)
+
+        except BaseException:
+            self._link_count -= 1
+            self._wakePoolWaiter(None)
+            raise
+
+        self._link_stats['created'] += 1
+
+        def linkfini():
+            self._link_count -= 1
+            self._link_stats['closed'] += 1
+            self._wakePoolWaiter(None)
+
+        link.onfini(linkfini)
         self.onfini(link)
 
         return link
@@ -737,6 +846,10 @@ class Proxy(s_base.Base):
         if link.isfini:
             return
 
+        # Hand the link directly to a call waiting on a full pool.
+        if self._wakePoolWaiter(link):
+            return
+
         # If we've exceeded our poolsize, discard the current link.
         if len(self.links) >= self._link_poolsize:
             return await link.fini()
@@ -1013,6 +1126,10 @@ class ClientV2(s_base.Base):
         self.ready = asyncio.Event()
         self.deque = collections.deque()
 
+        # per-proxy load information used for least-loaded selection
+        self.proxyload = {}
+        self.pickindx = 0
+
         self.mesghands = {
             'svc:add': self._onPoolSvcAdd,
             'svc:del': self._onPoolSvcDel,
@@ -1119,11 +1236,21 @@ class ClientV2(s_base.Base):
                 self.proxies.remove(proxy)
             if proxy in self.deque:
                 self.deque.remove(proxy)
+            self.proxyload.pop(proxy, None)
             if not len(self.proxies):
                 self.ready.clear()
 
         proxy.onfini(onfini)
         self.proxies.add(proxy)
+        self.proxyload[proxy] = {
+            'inflight': 0,
+            'latency': None,
+            'lag': 0,
+            'count': 0,
+            'lagtick': 0,
+            'latetick': 0,
+            'picked': 0,
+        }
         self.ready.set()
 
         if self.onlink is not None:
@@ -1145,6 +1272,7 @@ class ClientV2(s_base.Base):
         self.ready.clear()
         self.clients.clear()
         self.proxies.clear()
+        self.proxyload.clear()
 
     async def _toposync(self):
 
@@ -1172,7 +1300,127 @@ class ClientV2(s_base.Base):
                 logger.warning(f'AHA pool topology task restarting: {e}')
                 await self.waitfini(timeout=1)
 
-    async def proxy(self, timeout=None):
+    @contextlib.contextmanager
+    def track(self, proxy):
+        '''
+        Track a call made using a proxy from the pool to update its load information.
+
+        Args:
+            proxy (Proxy): A proxy returned by the proxy() method.
+
+        Example:
+
+            with client.track(proxy):
+                valu = await proxy.getFooByBar(10)
+        '''
+        load = self.proxyload.get(proxy)
+        if load is None:
+            yield
+            return
+
+        load['inflight'] += 1
+        tick = s_common.mononow()
+
+        try:
+            yield
+
+        finally:
+            took = s_common.mononow() - tick
+
+            load['count'] += 1
+            load['inflight'] -= 1
+            load['latetick'] = s_common.mononow()
+
+            if load['latency'] is None:
+                load['latency'] = took
+            else:
+                load['latency'] = int(load['latency'] * (1.0 - LOAD_DECAY) + took * LOAD_DECAY)
+
+    def setProxyLag(self, proxy, lag):
+        '''
+        Record how far behind its source a proxy from the pool is known to be.
+        '''
+        load = self.proxyload.get(proxy)
+        if load is not None:
+            load['lag'] = max(0, lag)
+            load['lagtick'] = s_common.mononow()
+
+    def getProxyLoad(self):
+        '''
+        Get the load information for the proxies in the pool.
+
+        Returns:
+            list: A list of dictionaries containing the service name, the number of in-flight calls,
+            the decaying average call latency in milliseconds, the last known lag and the number of
+            completed calls for each proxy.
+        '''
+        retn = []
+        for proxy, load in self.proxyload.items():
+            retn.append({
+                'name': proxy._ahainfo.get('name'),
+                'inflight': load['inflight'],
+                'latency': load['latency'],
+                'lag': load['lag'],
+                'count': load['count'],
+            })
+        return retn
+
+    def _getLoadScore(self, proxy, weights):
+
+        load = self.proxyload.get(proxy)
+        if load is None:  # pragma: no cover
+            return 0.0
+
+        # older latency and lag information decays so idle proxies are retried
+        now = s_common.mononow()
+        latency = (load['latency'] or 0) * 0.5 ** ((now - load['latetick']) / 1000.0 / LOAD_HALFLIFE)
+        lag = load['lag'] * 0.5 ** ((now - load['lagtick']) / 1000.0 / LOAD_HALFLIFE)
+
+        return (load['inflight'] * weights.get('inflight', 0.0) +
+                latency / 1000.0 * weights.get('latency', 0.0) +
+                lag * weights.get('lag', 0.0))
+
+    def _getLeastLoaded(self, weights):
+
+        best = None
+        bestkey = None
+
+        for proxy in self.proxies:
+            # ties go to the least recently selected proxy
+            load = self.proxyload.get(proxy)
+            picked = 0 if load is None else load['picked']
+
+            skey = (self._getLoadScore(proxy, weights), picked)
+            if bestkey is None or skey < bestkey:
+                best = proxy
+                bestkey = skey
+
+        self.pickindx += 1
+
+        load = self.proxyload.get(best)
+        if load is not None:
+            load['picked'] = self.pickindx
+
+        return best
+
+    async def proxy(self, timeout=None, weights=None):
+        '''
+        Get a proxy from the pool.
+
+        Args:
+            timeout (int): The maximum amount of time to wait for a proxy.
+            weights (dict): Optional weights used to select the least-loaded proxy.
+
+        Notes:
+            Proxies are selected by round-robin unless weights are specified. The weights dictionary may
+            contain the keys ``inflight`` (per in-flight call), ``latency`` (per second of average call
+            latency) and ``lag`` (per entry of known lag). The proxy with the lowest weighted score is
+            selected. Load information is only gathered for calls made within the track() context manager
+            and previously observed latency and lag lose weight over time.
+
+        Returns:
+            Proxy: A telepath Proxy object.
+        '''
 
         async def getNextProxy():
 
@@ -1190,6 +1438,9 @@ class ClientV2(s_base.Base):
                     self.ready.clear()
                     continue
 
+                if weights is not None:
+                    return self._getLeastLoaded(weights)
+
                 return self.deque.popleft()
 
         # use an inner function so we can wait overall...
@@ -1208,8 +1459,14 @@ class Client(s_base.Base):
                 'timeout': 10,
                 'retrysleep': 0.2,
                 'link_poolsize': 4,
+                'link_poolmax': None,
             }
 
+        The link_poolsize value is the number of idle links kept open for reuse. If link_poolmax is set,
+        at most that many links are opened for concurrent calls and additional calls wait for a link to
+        be released. Callers which consume a streaming call while making other calls on the same Proxy
+        must not set link_poolmax below the number of concurrent calls they require.
+
     '''
     async def __anit__(self, urlinfo, opts=None, conf=None, onlink=None):
 
@@ -1310,6 +1567,7 @@ class Client(s_base.Base):
         self._t_proxy = await openinfo(info)
         self._t_methinfo = self._t_proxy.methinfo
         self._t_proxy._link_poolsize = self._t_conf.get('link_poolsize', 4)
+        self._t_proxy._link_poolmax = self._t_conf.get('link_poolmax')
 
         async def fini():
             if self._t_named_meths:
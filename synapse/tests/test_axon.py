@@ -7,6 +7,7 @@ import shutil
 import asyncio
 import hashlib
 import logging
+import threading
 import unittest.mock as mock
 import tornado.httputil as t_httputil
 
@@ -211,6 +212,22 @@ class AxonTest(s_t_utils.SynTest):
         axfo = [comp for comp in snfo.get('components') if comp.get('name') == 'axon'][0]
         self.eq(axfo.get('data'), await axon.metrics())
 
+        # Upload metrics
+        info = await axon.getUploadMetrics()
+        self.ge(info.get('upload:count'), 3)
+        self.ge(info.get('upload:bytes'), 33554445)
+        self.gt(info.get('upload:time'), 0)
+        self.gt(info.get('upload:rate'), 0)
+
+        async with await axon.upload() as fd:
+            self.ge((await axon.getUploadMetrics()).get('upload:active'), 1)
+            await fd.write(abuf)
+            self.eq(asdfretn, await fd.save())
+
+        newinfo = await axon.getUploadMetrics()
+        self.eq(info.get('upload:count') + 1, newinfo.get('upload:count'))
+        self.eq(info.get('upload:bytes') + 8, newinfo.get('upload:bytes'))
+
         # Upload context reuse
         with mock.patch('synapse.axon.MAX_SPOOL_SIZE', s_axon.CHUNK_SIZE * 2):
 
@@ -510,6 +527,77 @@ bar baz",vv
 
             self.eq(bbufretn[0], await axon.save(bbufhash, emptygen(), size=bbufretn[0]))
 
+    async def test_axon_readahead(self):
+
+        async with self.getTestAxon(conf={'get:readahead': 0}) as axon:
+            self.eq(0, axon.readahead)
+            await self.runAxonTestBase(axon)
+
+        async with self.getTestAxon() as axon:
+
+            self.eq(2, axon.readahead)
+
+            with mock.patch('synapse.axon.CHUNK_SIZE', 10):
+                size, sha256 = await axon.put(b'V' * 100)
+
+            # storage is read ahead of the consumer ( the consumed chunk, two
+            # queued chunks, and one chunk waiting to be queued )
+            reads = []
+            genr = axon._get
+
+            async def _get(sha256):
+                async for byts in genr(sha256):
+                    reads.append(byts)
+                    yield byts
+
+            with mock.patch.object(axon, '_get', _get):
+
+                async for byts in axon.get(sha256):
+                    await asyncio.sleep(0.01)
+                    self.len(4, reads)
+                    break
+
+                self.eq(b'V' * 100, b''.join([byts async for byts in axon.get(sha256)]))
+
+            self.eq(b'V' * 15, b''.join([byts async for byts in axon.get(sha256, 5, 15)]))
+
+    async def test_axon_upload_fini(self):
+
+        async with self.getTestAxon() as axon:
+
+            upfd = await axon.upload()
+
+            started = threading.Event()
+            unblock = threading.Event()
+            _write = upfd._write
+
+            def write(byts):
+                started.set()
+                unblock.wait(timeout=6)
+                _write(byts)
+
+            upfd._write = write
+
+            # the spool file is not closed until a pending write completes
+            task = axon.schedCoro(upfd.write(b'asdfasdf'))
+            self.true(await s_coro.executor(started.wait, timeout=6))
+
+            task.cancel()
+            finitask = axon.schedCoro(upfd.fini())
+
+            await asyncio.sleep(0.1)
+            self.false(finitask.done())
+            self.false(upfd.fd.closed)
+
+            unblock.set()
+            await asyncio.wait_for(finitask, timeout=6)
+
+            self.true(upfd.fd.closed)
+            self.eq(8, upfd.size)
+            self.eq(0, (await axon.getUploadMetrics()).get('upload:active'))
+
+            await self.asyncraises(s_exc.IsFini, upfd.write(b'asdf'))
+
     async def test_axon_proxy(self):
         async with self.getTestAxon() as axon:
             async with axon.getLocalProxy() as prox:
@@ -3005,9 +3005,24 @@ class CortexBasicTest(s_t_utils.SynTest):
 
             coreinfo = await prox.getCoreInfoV2()
 
-            for field in ('version', 'modeldict', 'stormdocs'):
+            for field in ('version', 'modeldict', 'stormdocs', 'querycache'):
                 self.isin(field, coreinfo)
 
+            text = '$x = (10) [ test:int=$x ]'
+            info = core.getStormQueryCacheInfo()
+            query = await core.getStormQuery(text)
+            self.true(query is await core.getStormQuery(text))
+
+            self.len(1, await core.nodes(text))
+            self.len(1, await core.nodes(text))
+
+            newinfo = (await prox.getCoreInfoV2())['querycache']
+            self.eq(10000, newinfo['maxsize'])
+            self.eq(info['parses'] + 1, newinfo['parses'])
+            self.eq(info['misses'] + 1, newinfo['misses'])
+            self.ge(newinfo['hits'], info['hits'] + 3)
+            self.gt(newinfo['parsetime'], info['parsetime'])
+
             layers = list(core.listLayers())
             self.len(1, layers)
             lyr = layers[0]
@@ -8437,6 +8452,59 @@ class CortexBasicTest(s_t_utils.SynTest):
                     msgs = await alist(core01.storm('inet:asn=0', opts={'mirror': False}))
                     self.len(1, [m for m in msgs if m[0] == 'node'])
 
+    async def test_cortex_storm_pool_load(self):
+
+        with self.getTestDir() as dirn:
+
+            path00 = s_common.gendir(dirn, 'core00')
+            path01 = s_common.gendir(dirn, 'core01')
+
+            async with self.getTestCore(dirn=path00) as core00:
+                await core00.nodes('[ inet:asn=0 ]')
+
+            s_tools_backup.backup(path00, path01)
+
+            async with self.getTestCore(dirn=path00) as core00:
+
+                self.eq({'inflight': 1.0, 'latency': 1.0, 'lag': 0.01}, core00.getStormPoolWeights())
+
+                with self.raises(s_exc.SchemaViolation):
+                    await core00.setStormPool('tcp://127.0.0.1/newp', {'weight:lag': -1})
+
+                async with self.getTestCore(dirn=path01, conf={'mirror': core00.getLocalUrl()}) as core01:
+
+                    await core01.sync()
+
+                    url = core01.getLocalUrl()
+                    q = f'cortex.storm.pool.set --connection-timeout 1 --sync-timeout 1 --latency-weight 0 --lag-weight 0.5 {url}'
+                    msgs = await core00.stormlist(q)
+                    self.stormHasNoWarnErr(msgs)
+
+                    self.eq({'inflight': 1.0, 'latency': 0.0, 'lag': 0.5}, core00.getStormPoolWeights())
+
+                    await core00.stormpool.waitready(timeout=12)
+
+                    with self.getLoggerStream('synapse') as stream:
+                        self.eq(1, await core00.count('inet:asn=0'))
+                        self.eq(0, await core00.callStorm('inet:asn=0 return($node.value())'))
+
+                    stream.seek(0)
+                    self.isin('Offloading Storm query to mirror', stream.read())
+
+                    load = core00.stormpool.getProxyLoad()
+                    self.len(1, load)
+                    self.eq(0, load[0]['lag'])
+                    self.eq(0, load[0]['inflight'])
+                    self.eq(2, load[0]['count'])
+                    self.nn(load[0]['latency'])
+
+                    msgs = await core00.stormlist('cortex.storm.pool.get', opts={'mirror': False})
+                    self.stormHasNoWarnErr(msgs)
+                    self.stormIsInPrint('In-flight Query Weight: 1.0', msgs)
+                    self.stormIsInPrint('Latency Weight (per sec): 0.0', msgs)
+                    self.stormIsInPrint('Nexus Lag Weight (per entry): 0.5', msgs)
+                    self.stormIsInPrint('Mirror None: in-flight=0', msgs)
+
     async def test_cortex_authgate(self):
         # TODO - Remove this in 3.0.0
         with self.getTestDir() as dirn:
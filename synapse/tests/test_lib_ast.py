@@ -2884,6 +2884,93 @@ class AstTest(s_test.SynTest):
                 self.len(2, nodes)
                 self.len(0, calls)
 
+    async def test_ast_lift_costopt(self):
+        calls = []
+        origtag = s_snap.Snap.nodesByTag
+        origprop = s_snap.Snap.nodesByProp
+        origvalu = s_snap.Snap.nodesByPropValu
+
+        async def checkTag(self, tag, form=None, reverse=False):
+            calls.append(('tag', tag, form))
+            async for node in origtag(self, tag, form=form, reverse=reverse):
+                yield node
+
+        async def checkProp(self, name, reverse=False):
+            calls.append(('prop', name))
+            async for node in origprop(self, name, reverse=reverse):
+                yield node
+
+        async def checkValu(self, name, cmpr, valu, reverse=False):
+            calls.append(('valu', name, cmpr, valu))
+            async for node in origvalu(self, name, cmpr, valu, reverse=reverse):
+                yield node
+
+        with mock.patch('synapse.lib.snap.Snap.nodesByTag', checkTag), \
+             mock.patch('synapse.lib.snap.Snap.nodesByProp', checkProp), \
+             mock.patch('synapse.lib.snap.Snap.nodesByPropValu', checkValu):
+
+            async with self.getTestCore() as core:
+
+                await core.nodes('for $i in $lib.range(20) { [ test:str=$i :tick=2020 +#big ] }')
+                await core.nodes('[ test:str=0 test:str=1 +#small :hehe=haha ]')
+                await core.nodes('[ test:str=2 :hehe=hoho ]')
+
+                calls.clear()
+                self.len(2, await core.nodes('test:str +#big +#small'))
+                self.eq(calls, [('tag', 'small', 'test:str')])
+
+                # the first hint is used without the optimization
+                calls.clear()
+                opts = {'lift:optimize': False}
+                self.len(2, await core.nodes('test:str +#big +#small', opts=opts))
+                self.eq(calls, [('tag', 'big', 'test:str')])
+
+                calls.clear()
+                self.len(2, await core.nodes('test:str +:tick +#small'))
+                self.eq(calls, [('tag', 'small', 'test:str')])
+
+                calls.clear()
+                self.len(3, await core.nodes('test:str +#big +:hehe'))
+                self.eq(calls, [('prop', 'test:str:hehe')])
+
+                calls.clear()
+                self.len(1, await core.nodes('test:str +#big +:hehe=hoho'))
+                self.eq(calls, [('valu', 'test:str:hehe', '=', 'hoho')])
+
+                calls.clear()
+                self.len(2, await core.nodes('test:str +(#big and #small)'))
+                self.eq(calls, [('tag', 'small', 'test:str')])
+
+                # mixed condition types which return lists and tuples of hints
+                calls.clear()
+                self.len(2, await core.nodes('test:str +($lib.true and #small)'))
+                self.eq(calls, [('tag', 'small', 'test:str')])
+
+                calls.clear()
+                self.len(2, await core.nodes('test:str +(#small and $lib.true and :tick)'))
+                self.eq(calls, [('tag', 'small', 'test:str')])
+
+                # counts from all layers in the view are considered
+                view = await core.callStorm('return($lib.view.get().fork().iden)')
+                opts = {'view': view}
+                await core.nodes('test:str +#big [ +#newp ]', opts=opts)
+                await core.nodes('for $i in $lib.range(30) { [ test:str=`x{$i}` +#small ] }', opts=opts)
+
+                calls.clear()
+                self.len(2, await core.nodes('test:str +#newp +#small', opts=opts))
+                self.eq(calls, [('tag', 'newp', 'test:str')])
+
+                calls.clear()
+                opts['debug'] = True
+                msgs = await core.stormlist('test:str +#small +#newp', opts=opts)
+                self.stormIsInPrint('Lifting test:str by tag newp (estimated rows: 20)', msgs)
+                self.eq(calls, [('tag', 'newp', 'test:str')])
+
+                # invalid props still lift nothing
+                calls.clear()
+                self.len(0, await core.nodes('test:str +#big +:newp'))
+                self.eq(calls, [])
+
     async def test_ast_cmdoper(self):
 
         async with self.getTestCore() as core:
@@ -32,10 +32,12 @@ class CacheTest(s_t_utils.SynTest):
         self.nn(cache.cache.get('FOO'))
         self.nn(cache.cache.get('BAR'))
 
+        self.eq('baz', cache.get('BAZ'))
         self.eq('baz', cache.get('BAZ'))
 
         self.len(2, cache.fifo)
         self.len(2, cache.cache)
+        self.eq(cache.stat(), {'size': 2, 'maxsize': 2, 'hits': 1, 'misses': 3})
 
         self.nn(cache.cache.get('BAR'))
         self.nn(cache.cache.get('BAZ'))
@@ -281,3 +283,44 @@ class CacheTest(s_t_utils.SynTest):
         lru = s_cache.LruDict(0)
         lru['nope'] = 42
         self.none(lru.get('nope', None))
+
+        # Metrics and size limits
+        lru = s_cache.LruDict(3, maxbytes=100)
+        lru.put('foo', 1, size=40)
+        lru.put('bar', 2, size=40)
+        self.eq(lru.get('foo'), 1)
+        self.none(lru.get('newp'))
+
+        lru.put('baz', 3, size=40)
+        self.notin('bar', lru)
+        self.eq(list(lru), ['foo', 'baz'])
+
+        lru.put('baz', 3, size=10)
+        self.eq(lru.pop('foo'), 1)
+        self.none(lru.pop('foo', None))
+        with self.raises(KeyError):
+            lru.pop('foo')
+
+        self.eq(lru.stat(), {
+            'size': 1,
+            'maxsize': 3,
+            'bytes': 10,
+            'maxbytes': 100,
+            'hits': 1,
+            'misses': 1,
+            'evictions': 1,
+        })
+
+        lru['hehe'] = 4
+        lru['haha'] = 5
+        lru.resize(1)
+        self.eq(list(lru), ['haha'])
+        self.eq(lru.stat()['bytes'], 0)
+        lru.put('haha', 5, size=10)
+        self.eq(lru.stat()['bytes'], 10)
+        self.none(lru.stat()['maxbytes'])
+        self.eq(lru.stat()['evictions'], 3)
+
+        lru.clear()
+        self.len(0, lru)
+        self.eq(lru.stat()['bytes'], 0)
@@ -42,13 +42,13 @@ import synapse.tools.backup as s_tools_backup
 import synapse.tests.utils as s_t_utils
 
 # Defective versions of spawned backup processes
-def _sleeperProc(pipe, srcdir, dstdir, lmdbpaths, logconf):
+def _sleeperProc(pipe, srcdir, dstdir, lmdbpaths, logconf, basedir=None):
     time.sleep(3.0)
 
-def _sleeper2Proc(pipe, srcdir, dstdir, lmdbpaths, logconf):
+def _sleeper2Proc(pipe, srcdir, dstdir, lmdbpaths, logconf, basedir=None):
     time.sleep(2.0)
 
-def _exiterProc(pipe, srcdir, dstdir, lmdbpaths, logconf):
+def _exiterProc(pipe, srcdir, dstdir, lmdbpaths, logconf, basedir=None):
     pipe.send('captured')
     sys.exit(1)
 
@@ -1725,7 +1725,7 @@ class CellTest(s_t_utils.SynTest):
                         with self.raises(asyncio.TimeoutError):
                             await asyncio.wait_for(arch, timeout=0.1)
 
-                        async def _fakeBackup(self, name=None, wait=True):
+                        async def _fakeBackup(self, name=None, wait=True, base=None):
                             s_common.gendir(os.path.join(backdirn, name))
 
                         with mock.patch.object(s_cell.Cell, 'runBackup', _fakeBackup):
@@ -1733,7 +1733,7 @@ class CellTest(s_t_utils.SynTest):
                             with self.raises(asyncio.TimeoutError):
                                 await asyncio.wait_for(arch, timeout=0.1)
 
-                        async def _slowFakeBackup(self, name=None, wait=True):
+                        async def _slowFakeBackup(self, name=None, wait=True, base=None):
                             s_common.gendir(os.path.join(backdirn, name))
                             await asyncio.sleep(3.0)
 
@@ -1746,14 +1746,14 @@ class CellTest(s_t_utils.SynTest):
                         evt1 = asyncio.Event()
                         orig = s_cell.Cell.iterNewBackupArchive
 
-                        async def _slowFakeBackup2(self, name=None, wait=True):
+                        async def _slowFakeBackup2(self, name=None, wait=True, base=None):
                             evt0.set()
                             s_common.gendir(os.path.join(backdirn, name))
                             await asyncio.sleep(3.0)
 
-                        async def _iterNewDup(self, user, name=None, remove=False):
+                        async def _iterNewDup(self, user, name=None, remove=False, base=None):
                             try:
-                                await orig(self, user, name=name, remove=remove)
+                                await orig(self, user, name=name, remove=remove, base=base)
                             except asyncio.CancelledError:
                                 evt1.set()
                                 raise
@@ -2012,6 +2012,49 @@ class CellTest(s_t_utils.SynTest):
             foonest = s_common.genpath(core.dirn, 'backups', 'bar', 'backups')
             self.false(os.path.isdir(foonest))
 
+    async def test_cell_backup_incremental(self):
+
+        async with self.getTestCore() as core:
+
+            layriden = core.getLayer().iden
+            await core.nodes('[ inet:ipv4=1.2.3.4 ]')
+
+            with self.raises(s_exc.BadArg):
+                await core.runBackup('nope', base='newp')
+
+            await core.runBackup('full')
+            await core.nodes('[ inet:ipv4=5.6.7.8 ]')
+
+            async with core.getLocalProxy() as proxy:
+                self.eq('inc0', await proxy.runBackup('inc0', base='full'))
+
+            self.eq(2, await core.callStorm('return($lib.len($lib.backup.list()))'))
+
+            fullpath = s_common.genpath(core.dirn, 'backups', 'full')
+            inc0path = s_common.genpath(core.dirn, 'backups', 'inc0')
+
+            mani = s_tools_backup.getBackupManifest(inc0path)
+            self.eq('../full', mani['base'])
+            self.none(mani['lmdbs'][f'layers/{layriden}/layer_v2.lmdb'].get('from'))
+            self.eq('../full', mani['lmdbs']['slabs/graphs.lmdb']['from'])
+            self.false(os.path.exists(s_common.genpath(inc0path, 'slabs', 'graphs.lmdb')))
+
+            # the base backup may not be removed while an incremental backup requires it
+            with self.raises(s_exc.BadArg):
+                await core.delBackup('full')
+
+            with self.getTestDir() as dirn:
+
+                restpath = s_common.genpath(dirn, 'core')
+                s_tools_backup.restore(inc0path, restpath)
+
+                async with self.getTestCore(dirn=restpath) as core01:
+                    self.len(2, await core01.nodes('inet:ipv4'))
+
+            await core.delBackup('inc0')
+            await core.delBackup('full')
+            self.false(os.path.isdir(fullpath))
+
     async def test_mirror_badiden(self):
         with self.getTestDir() as dirn:
 
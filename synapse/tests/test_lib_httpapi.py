@@ -1,15 +1,21 @@
 import ssl
 import json
+import asyncio
 
 import aiohttp
 import aiohttp.client_exceptions as a_exc
 
+import tornado.iostream as t_iostream
+
+from unittest import mock
+
 import synapse.common as s_common
 import synapse.tools.backup as s_backup
 
 import synapse.lib.coro as s_coro
 import synapse.lib.link as s_link
 import synapse.lib.httpapi as s_httpapi
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.version as s_version
 
 import synapse.tests.utils as s_tests
@@ -1579,6 +1585,138 @@ class HttpApiTest(s_tests.SynTest):
                     async with sess.post(url, data=b'foo') as resp:
                         pass
 
+    async def test_http_stream_flushsoon(self):
+
+        async with self.getTestCore() as core:
+
+            flushed = []
+            written = []
+
+            async def flush():
+                flushed.append(len(written))
+
+            handler = mock.Mock(cell=core, flush=flush, write=written.append)
+
+            async def genr():
+                yield 1
+                await asyncio.sleep(s_httpapi.streamflushdelay * 4)
+                yield 2
+
+            # the delayed flush writes pending items while the generator waits
+            await s_httpapi.StormHandler.writeStream(handler, genr(), lambda x: b'%d' % x)
+            self.eq([b'1', b'2'], written)
+            self.eq([1, 2], flushed)
+
+            # a delayed flush to a closed stream stops the generator
+            async def flush():
+                raise t_iostream.StreamClosedError()
+
+            handler.flush = flush
+
+            with self.raises(t_iostream.StreamClosedError):
+                await s_httpapi.StormHandler.writeStream(handler, genr(), lambda x: b'%d' % x)
+
+    async def test_http_storm_stream(self):
+
+        async with self.getTestCore() as core:
+
+            host, port = await core.addHttpsPort(0, host='127.0.0.1')
+
+            root = core.auth.rootuser
+            await root.setPasswd('secret')
+
+            await core.nodes('for $i in $lib.range(500) { [ test:int=$i ] }')
+
+            async with self.getHttpSess(auth=('root', 'secret'), port=port) as sess:
+
+                body = {'query': 'test:int'}
+
+                # without a delimited stream format each message is its own chunk
+                msgs = []
+                async with sess.get(f'https://localhost:{port}/api/v1/storm', json=body) as resp:
+                    async for byts, x in resp.content.iter_chunks():
+                        if not byts:
+                            break
+                        msgs.append(json.loads(byts))
+
+                self.len(500, [m for m in msgs if m[0] == 'node'])
+                self.eq('fini', msgs[-1][0])
+
+                body['stream'] = 'jsonlines'
+                async with sess.get(f'https://localhost:{port}/api/v1/storm', json=body) as resp:
+                    byts = await resp.read()
+                    msgs = [json.loads(line) for line in byts.split(b'\n') if line]
+
+                self.len(500, [m for m in msgs if m[0] == 'node'])
+                self.eq('fini', msgs[-1][0])
+
+                body['stream'] = 'msgpack'
+                async with sess.get(f'https://localhost:{port}/api/v1/storm', json=body) as resp:
+                    self.eq('application/x-msgpack', resp.headers.get('Content-Type'))
+                    unpk = s_msgpack.Unpk()
+                    msgs = []
+                    async for byts, x in resp.content.iter_chunks():
+                        if not byts:
+                            break
+                        msgs.extend(unpk.feeditems(byts))
+
+                self.len(500, [m for m in msgs if m[0] == 'node'])
+                self.eq(('test:int', 499), msgs[-2][1][0])
+                self.eq('fini', msgs[-1][0])
+
+                async with sess.get(f'https://localhost:{port}/api/v1/storm/nodes', json=body) as resp:
+                    unpk = s_msgpack.Unpk()
+                    podes = unpk.feeditems(await resp.read())
+
+                self.len(500, podes)
+                self.eq(('test:int', 0), podes[0][0])
+
+                # output is flushed in batches bounded by the buffer size
+                with mock.patch.object(s_httpapi, 'streambufsize', 100):
+                    async with sess.get(f'https://localhost:{port}/api/v1/storm/nodes', json=body) as resp:
+                        unpk = s_msgpack.Unpk()
+                        podes = []
+                        async for byts, x in resp.content.iter_chunks():
+                            if not byts:
+                                break
+                            podes.extend(unpk.feeditems(byts))
+
+                self.len(500, podes)
+
+                # buffered output is flushed while the query waits
+                body = {'query': '$lib.print(hehe) $lib.time.sleep(10)', 'stream': 'jsonlines'}
+                async with sess.get(f'https://localhost:{port}/api/v1/storm', json=body) as resp:
+
+                    msgs = []
+                    while not any(m[0] == 'print' for m in msgs):
+                        line = await asyncio.wait_for(resp.content.readline(), timeout=5)
+                        msgs.append(json.loads(line))
+
+                    # the request runs as a single storm task which may be killed
+                    tasks = [t for t in core.boss.ps() if t.info.get('query') == body['query']]
+                    self.len(1, tasks)
+                    await tasks[0].kill()
+                    self.len(0, [t for t in core.boss.ps() if t.info.get('query') == body['query']])
+
+                q = 'test:int=1 test:int=2 | if ($node.value() = 2) { $lib.time.sleep(10) }'
+                body = {'query': q, 'stream': 'jsonlines'}
+                async with sess.get(f'https://localhost:{port}/api/v1/storm/nodes', json=body) as resp:
+
+                    line = await asyncio.wait_for(resp.content.readline(), timeout=5)
+                    self.eq(('test:int', 1), json.loads(line)[0])
+
+                    tasks = [t for t in core.boss.ps() if t.info.get('query') == body['query']]
+                    self.len(1, tasks)
+                    await tasks[0].kill()
+                    self.len(0, [t for t in core.boss.ps() if t.info.get('query') == body['query']])
+
+                # errors from the producer are still reported
+                body = {'query': 'test:int | $lib.raise(Foo, bar)'}
+                async with sess.get(f'https://localhost:{port}/api/v1/storm/export', json=body) as resp:
+                    retn = await resp.json()
+                    self.eq('err', retn.get('status'))
+                    self.eq('StormRaise', retn.get('code'))
+
     async def test_http_storm_vars(self):
 
         async with self.getTestCore() as core:
@@ -31,7 +31,7 @@ class LayerTest(s_t_utils.SynTest):
 
     def checkLayrvers(self, core):
         for layr in core.layers.values():
-            self.eq(layr.layrvers, 11)
+            self.eq(layr.layrvers, 12)
 
     async def test_layer_verify(self):
 
@@ -1317,6 +1317,126 @@ class LayerTest(s_t_utils.SynTest):
             nodes = await core.nodes('.created')
             self.len(0, nodes)
 
+    async def test_layer_sode_copyonwrite(self):
+
+        async with self.getTestCore() as core:
+
+            await core.addTagProp('score', ('int', {}), {})
+            await core.nodes('[ test:str=foo :tick=2020 +#foo:score=10 ]')
+
+            layr = core.getLayer(None)
+            buid = s_common.buid(('test:str', 'foo'))
+
+            sode = layr._getStorNode(buid)
+            self.eq(sode['props']['tick'][0], 1577836800000)
+
+            await core.nodes('test:str=foo [ :tick=2021 +#bar -#foo:score ]')
+
+            # the storage node previously handed out is not modified by edits
+            self.eq(sode['props']['tick'][0], 1577836800000)
+            self.nn(sode['tags'].get('foo'))
+            self.none(sode['tags'].get('bar'))
+            self.eq(sode['tagprops']['foo']['score'], (10, s_layer.STOR_TYPE_I64))
+
+            sode = layr._getStorNode(buid)
+            self.eq(sode['props']['tick'][0], 1609459200000)
+            self.nn(sode['tags'].get('bar'))
+            self.none(sode['tagprops'].get('foo'))
+
+            # copies may be modified without changing the layer
+            copy = await layr.getStorNode(buid)
+            copy['props'].pop('tick')
+            copy['tags']['newp'] = (None, None)
+            self.nn(layr._getStorNode(buid)['props'].get('tick'))
+            self.none(layr._getStorNode(buid)['tags'].get('newp'))
+
+            sodes = await core.getView().getStorNodes(buid)
+            sodes[0]['props'].clear()
+            self.len(1, await core.nodes('test:str:tick=2021'))
+
+            # storage nodes read between the edits of a single node edit are not modified
+            reads = []
+            editors = layr.editors
+
+            def wrapEditor(func):
+                async def editor(buid, form, edit, sode, meta):
+                    retn = await func(buid, form, edit, sode, meta)
+                    cur = layr._getStorNode(buid)
+                    reads.append((cur, s_msgpack.deepcopy(cur)))
+                    return retn
+                return editor
+
+            layr.editors = [wrapEditor(func) for func in editors]
+
+            try:
+                await core.nodes('test:str=foo [ :tick=2022 :hehe=haha +#baz -#bar +#foo:score=20 ]')
+            finally:
+                layr.editors = editors
+
+            self.gt(len(reads), 3)
+            for cur, copy in reads:
+                self.eq(s_msgpack.deepcopy(cur), copy)
+
+            sode = layr._getStorNode(buid)
+            self.eq(sode['props']['tick'][0], 1640995200000)
+            self.eq(sode['props']['hehe'][0], 'haha')
+            self.nn(sode['tags'].get('baz'))
+            self.none(sode['tags'].get('bar'))
+            self.eq(sode['tagprops']['foo']['score'], (20, s_layer.STOR_TYPE_I64))
+
+    async def test_layer_buidcache(self):
+
+        conf = {'layers:buidcache:size': 5}
+        async with self.getTestCore(conf=conf) as core:
+
+            layr = core.getLayer(None)
+            self.eq(5, layr.buidcache.maxsize)
+            self.none(layr.buidcache.maxbytes)
+
+            await core.nodes('for $i in $lib.range(10) { [ test:int=$i ] }')
+            await layr.layrslab.sync()
+
+            layr.buidcache.clear()
+            self.len(10, await core.nodes('test:int'))
+
+            stat = (await layr.stat())['buidcache']
+            self.eq(5, stat['size'])
+            self.eq(5, stat['maxsize'])
+            self.ge(stat['misses'], 10)
+            self.ge(stat['evictions'], 5)
+            self.gt(stat['bytes'], 0)
+
+            self.len(1, await core.nodes('test:int=9'))
+            self.gt((await layr.stat())['buidcache']['hits'], stat['hits'])
+
+            health = await core.getHealthCheck()
+            comp = [comp for comp in health['components'] if comp['name'] == 'cortex'][0]
+            self.eq(comp['data']['layers'][layr.iden]['buidcache']['maxsize'], 5)
+
+            await core.callStorm('$lib.layer.get().set(buidcache:size, 100)')
+            await core.callStorm('$lib.layer.get().set(buidcache:maxbytes, 1)')
+            self.eq(100, layr.buidcache.maxsize)
+            self.eq(1, layr.buidcache.maxbytes)
+            self.len(0, layr.buidcache)
+            self.eq(1, await core.callStorm('return($lib.layer.get().get(buidcache:maxbytes))'))
+
+            await core.callStorm('$lib.layer.get().set(buidcache:maxbytes, $lib.null)')
+            self.none(layr.buidcache.maxbytes)
+
+            with self.raises(s_exc.BadArg):
+                await layr.setLayerInfo('buidcache:size', -1)
+
+            with self.raises(s_exc.BadCast):
+                await core.callStorm('$lib.layer.get().set(buidcache:size, newp)')
+
+            ldef = await core.addLayer(ldef={'buidcache:size': 20, 'buidcache:maxbytes': 4096})
+            layr = core.getLayer(ldef.get('iden'))
+            self.eq(20, layr.buidcache.maxsize)
+            self.eq(4096, layr.buidcache.maxbytes)
+
+            with self.raises(s_exc.SchemaViolation):
+                await core.addLayer(ldef={'buidcache:size': -1})
+
     async def test_layer_flat_edits(self):
         nodeedits = (
             (b'asdf', 'test:junk', (
@@ -1602,6 +1722,87 @@ class LayerTest(s_t_utils.SynTest):
         finally:
             s_layer.MIGR_COMMIT_SIZE = oldv
 
+    async def checkLayrCounts(self, layr):
+
+        async def check(abrv, counts, db):
+            for byts in layr.layrslab.scanKeys(db=abrv.abrv2name):
+                self.eq(counts.get(byts), await layr.layrslab.countByPref(byts, db=db))
+
+        await check(layr.tagabrv, layr.tagcounts, layr.bytag)
+        await check(layr.propabrv, layr.propcounts, layr.byprop)
+        await check(layr.propabrv, layr.arraycounts, layr.byarray)
+        await check(layr.tagpropabrv, layr.tagpropcounts, layr.bytagprop)
+
+    async def test_layer_counters(self):
+
+        with self.getTestDir() as dirn:
+
+            async with self.getTestCore(dirn=dirn) as core:
+
+                layr = core.getLayer()
+
+                await core.addTagProp('score', ('int', {}), {})
+
+                await core.nodes('''
+                    for $i in $lib.range(10) {
+                        [ test:str=$i :tick=$i .seen=2020 +#foo.bar=2020 +#baz:score=$i ]
+                    }
+                ''')
+                await core.nodes('[ test:arrayprop=* :ints=(1, 2, 2, 3) :strs=(a, b) ]')
+                await core.nodes('[ test:arrayform=(1, 2, 3) ]')
+
+                self.eq(12, await layr.getPropCount('test:str'))
+                self.eq(10, await layr.getPropCount('test:str', 'tick'))
+                self.eq(5, await layr.getPropCount('test:str', 'tick', maxsize=5))
+                self.eq(10, await layr.getPropCount('test:str', '.seen'))
+                self.eq(10, await layr.getUnivPropCount('.seen'))
+                self.eq(10, await layr.getTagCount('foo'))
+                self.eq(10, await layr.getTagCount('foo.bar'))
+                self.eq(10, await layr.getTagCount('foo.bar', formname='test:str'))
+                self.eq(10, await layr.getTagPropCount('test:str', 'baz', 'score'))
+                self.eq(10, await layr.getTagPropCount(None, 'baz', 'score'))
+                self.eq(3, await layr.getPropArrayCount('test:arrayprop', 'ints'))
+                self.eq(3, await layr.getPropArrayCount('test:arrayform'))
+
+                self.eq(0, await layr.getPropCount('test:str', 'newp'))
+                self.eq(0, await layr.getTagCount('newp'))
+                self.eq(0, await layr.getTagPropCount('test:str', 'newp', 'score'))
+                self.eq(0, await layr.getPropArrayCount('test:arrayprop', 'newp'))
+
+                await core.nodes('test:str=1 [ :tick=2021 .seen=2021 +#foo.bar=2021 +#baz:score=100 ]')
+                await core.nodes('test:str=2 [ -:tick -.seen -#foo.bar -#baz:score ]')
+                await core.nodes('test:str=3 | delnode')
+                await core.nodes('test:arrayprop [ :ints=(4, 5) -:strs ]')
+
+                self.eq(11, await layr.getPropCount('test:str'))
+                self.eq(8, await layr.getPropCount('test:str', 'tick'))
+                self.eq(8, await layr.getUnivPropCount('.seen'))
+                self.eq(9, await layr.getTagCount('foo'))
+                self.eq(8, await layr.getTagCount('foo.bar'))
+                self.eq(8, await layr.getTagPropCount(None, 'baz', 'score'))
+                self.eq(2, await layr.getPropArrayCount('test:arrayprop', 'ints'))
+                self.eq(0, await layr.getPropArrayCount('test:arrayprop', 'strs'))
+
+                await self.checkLayrCounts(layr)
+
+                # simulate a layer from before the counters existed
+                layr.meta.set('version', 11)
+                for counts in (layr.tagcounts, layr.propcounts, layr.arraycounts, layr.tagpropcounts):
+                    for abrv in list(counts.cache.keys()):
+                        counts.delete(abrv)
+
+            with self.getLoggerStream('synapse.lib.layer') as stream:
+                async with self.getTestCore(dirn=dirn) as core:
+                    self.isin('Adding index counters to layer', stream.getvalue())
+
+                    layr = core.getLayer()
+                    self.eq(layr.layrvers, 12)
+                    self.eq(8, await layr.getPropCount('test:str', 'tick'))
+                    self.eq(8, await layr.getTagPropCount(None, 'baz', 'score'))
+                    self.eq(2, await layr.getPropArrayCount('test:arrayprop', 'ints'))
+
+                    await self.checkLayrCounts(layr)
+
     async def test_layer_logedits_default(self):
         async with self.getTestCore() as core:
             self.true(core.getLayer().logedits)
@@ -4,11 +4,14 @@ import socket
 import asyncio
 import multiprocessing
 
+import unittest.mock as mock
+
 import synapse.exc as s_exc
 import synapse.common as s_common
 
 import synapse.lib.coro as s_coro
 import synapse.lib.link as s_link
+import synapse.lib.msgpack as s_msgpack
 
 import synapse.tests.utils as s_test
 
@@ -93,6 +96,105 @@ class LinkTest(s_test.SynTest):
         await link.tx(('me', {'k': 2}))
         await self.asyncraises(ConnectionError, link.tx(('worry?', {'k': 3})))
 
+    async def test_link_tx_batch(self):
+
+        mesgs = [('mesg', {'indx': i}) for i in range(1000)]
+
+        async def onlink(link):
+            async with link.txbatch():
+                for mesg in mesgs:
+                    await link.tx(mesg)
+            await link.fini()
+
+        serv = await s_link.listen('127.0.0.1', 0, onlink)
+        host, port = serv.sockets[0].getsockname()
+
+        link = await s_link.connect(host, port)
+
+        with mock.patch.object(link.reader, 'read', wraps=link.reader.read) as read:
+
+            items = []
+            while (mesg := await link.rx()) is not None:
+                items.append(mesg)
+
+            self.eq(items, mesgs)
+            self.lt(read.call_count, 100)
+
+        # the message which fills the buffer is only written once
+        mesgs = [('mesg', {'indx': i, 'data': 'V' * 1024}) for i in range(1000)]
+
+        serv = await s_link.listen('127.0.0.1', 0, onlink)
+        host, port = serv.sockets[0].getsockname()
+
+        async with await s_link.connect(host, port) as link:
+
+            items = []
+            while (mesg := await link.rx()) is not None:
+                items.append(mesg)
+
+            self.eq(items, mesgs)
+
+        # buffered messages are written after txbatchdelay while the batch waits
+        evt = asyncio.Event()
+
+        async def onlink(link):
+            async with link.txbatch():
+                await link.tx(('hehe', {}))
+                self.len(1, link.txbuf)
+                self.true(await s_coro.event_wait(evt, 6))
+                self.len(0, link.txbuf)
+
+        serv = await s_link.listen('127.0.0.1', 0, onlink)
+        host, port = serv.sockets[0].getsockname()
+
+        async with await s_link.connect(host, port) as link:
+            self.eq(('hehe', {}), await link.rx())
+            evt.set()
+
+        # tx() outside of a batch reaches the transport before returning
+        evt = asyncio.Event()
+
+        async def onlink(link):
+            await link.tx(('hehe', {}))
+            self.len(0, link.txbuf)
+
+            async with link.txbatch():
+                await link.tx(('haha', {}))
+                self.len(1, link.txbuf)
+                async with link.txbatch():
+                    await link.tx(('hoho', {}))
+                self.len(2, link.txbuf)
+
+            self.len(0, link.txbuf)
+            evt.set()
+
+        serv = await s_link.listen('127.0.0.1', 0, onlink)
+        host, port = serv.sockets[0].getsockname()
+
+        async with await s_link.connect(host, port) as link:
+            self.eq(('hehe', {}), await link.rx())
+            self.eq(('haha', {}), await link.rx())
+            self.eq(('hoho', {}), await link.rx())
+            self.true(await s_coro.event_wait(evt, 6))
+
+        # messages are written in order with raw sends and on fini
+        async def onlink(link):
+            async with link.txbatch():
+                await link.tx(('hehe', {}))
+                await link.send(s_msgpack.en(('haha', {})))
+                await link.tx(('hoho', {}))
+                self.len(1, link.txbuf)
+                await link.fini()
+
+        serv = await s_link.listen('127.0.0.1', 0, onlink)
+        host, port = serv.sockets[0].getsockname()
+
+        async with await s_link.connect(host, port) as link:
+            self.eq(('hehe', {}), await link.rx())
+            self.eq(('haha', {}), await link.rx())
+            self.eq(('hoho', {}), await link.rx())
+            self.none(await link.rx())
+
     async def test_link_rx_sadpath(self):
 
         junk = 'a9d0cdafef705b9864bd'
@@ -1527,6 +1527,21 @@ class LmdbSlabTest(s_t_utils.SynTest):
 
                 self.eq(3, slab.count(b'foo', db=dupsdb))
 
+    async def test_lmdbslab_getmulti(self):
+
+        with self.getTestDir() as dirn:
+
+            path = os.path.join(dirn, 'test.lmdb')
+            async with await s_lmdbslab.Slab.anit(path) as slab:
+
+                testdb = slab.initdb('test')
+
+                slab.put(b'foo', b'bar', db=testdb)
+                slab.put(b'baz', b'faz', db=testdb)
+
+                self.eq([], slab.getmulti([], db=testdb))
+                self.eq([b'bar', None, b'faz', b'bar'], slab.getmulti([b'foo', b'newp', b'baz', b'foo'], db=testdb))
+
     async def test_safekeyval(self):
         with self.getTestDir() as dirn:
 
@@ -73,6 +73,12 @@ class MsgPackTest(s_t_utils.SynTest):
 
         self.eq(rets, [(7, ('hehe', 10))] * 3)
 
+        unpk = s_msgpack.Unpk()
+        self.eq([('hehe', 10)] * 2, unpk.feeditems(byts[:17]))
+        self.eq([('hehe', 10)], unpk.feeditems(byts[17:]))
+        self.eq([(7, ('hehe', 10))], unpk.feed(byts[:7]))
+        self.eq(28, unpk.size)
+
     def test_msgpack_byte(self):
         unpk = s_msgpack.Unpk()
         self.len(0, unpk.feed(b'\xa4'))
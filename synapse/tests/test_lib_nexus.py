@@ -8,6 +8,8 @@ import synapse.lib.auth as s_auth
 import synapse.lib.cell as s_cell
 import synapse.lib.nexus as s_nexus
 
+import synapse.tools.backup as s_tools_backup
+
 import synapse.tests.utils as s_t_utils
 
 class SampleNexus(s_cell.Cell):
@@ -379,3 +381,108 @@ class NexusTest(s_t_utils.SynTest):
                     self.isin(mesg, data)
 
                 self.true(restarted)
+
+    async def test_mirror_nexus_chunks(self):
+
+        with self.getTestDir() as dirn:
+
+            path00 = s_common.gendir(dirn, 'core00')
+            path01 = s_common.gendir(dirn, 'core01')
+
+            async with self.getTestCore(dirn=path00) as core00:
+                self.none(await core00.getMirrorStatus())
+                self.true((await core00.getCellInfo())['features']['nexschunks'])
+
+            s_tools_backup.backup(path00, path01)
+
+            async with self.getTestCore(dirn=path00) as core00:
+
+                await core00.nodes('for $i in $lib.range(30) { [ test:int=$i ] }')
+                await core00.nodes('[ test:str=foo ]')
+
+                offs = await core00.getNexsIndx()
+                chunks = []
+                async for chunk in core00.getNexusChunks(0, size=10, tellready=True):
+                    if chunk is None:
+                        break
+                    chunks.append(chunk)
+
+                self.eq(offs, sum(len(c[1]) for c in chunks))
+                self.true(all(len(c[1]) <= 10 for c in chunks))
+                self.eq(list(range(offs)), [item[0] for c in chunks for item in c[1]])
+
+                url = core00.getLocalUrl()
+
+                with mock.patch('synapse.lib.nexus.MIRROR_CHUNK_SIZE', 10):
+                    async with self.getTestCore(dirn=path01, conf={'mirror': url}) as core01:
+
+                        await core01.sync()
+                        self.len(30, await core01.nodes('test:int'))
+
+                        self.len(1, await core01.nodes('[ test:str=bar ]'))
+                        self.len(1, await core00.nodes('test:str=bar'))
+
+                        status = await core01.getMirrorStatus()
+                        self.true(status['ready'])
+                        self.true(status['uplink'])
+                        self.eq(0, status['lag'])
+                        self.eq(0, status['eta'])
+                        self.eq(status['offs'], await core00.getNexsIndx())
+                        self.eq(status['leader'], await core00.getNexsIndx())
+
+                        self.eq(status, await core01.callStorm('return($lib.cell.getMirrorStatus())'))
+                        self.none(await core00.callStorm('return($lib.cell.getMirrorStatus())'))
+
+                        user = await core01.auth.addUser('low')
+                        with self.raises(s_exc.AuthDeny):
+                            await core01.callStorm('return($lib.cell.getMirrorStatus())', opts={'user': user.iden})
+
+                # mirrors still sync from leaders which do not support chunks
+                origInfo = s_cell.Cell.getCellInfo
+                async def getCellInfo(self):
+                    info = await origInfo(self)
+                    info['features'].pop('nexschunks', None)
+                    return info
+
+                await core00.nodes('[ test:str=baz ]')
+
+                with mock.patch('synapse.lib.cell.Cell.getCellInfo', getCellInfo):
+                    async with self.getTestCore(dirn=path01, conf={'mirror': url}) as core01:
+
+                        await core01.sync()
+                        self.len(1, await core01.nodes('test:str=baz'))
+                        self.len(1, await core01.nodes('[ test:str=faz ]'))
+                        self.len(1, await core00.nodes('test:str=faz'))
+
+                        status = await core01.getMirrorStatus()
+                        self.eq(0, status['lag'])
+
+    async def test_mirror_nexus_status(self):
+
+        async with self.getTestCell(s_cell.Cell, conf={'nexslog:en': True}) as cell:
+
+            nexsroot = cell.nexsroot
+            nexsroot.client = True
+
+            status = await nexsroot.getMirrorStatus()
+            self.none(status['leader'])
+            self.none(status['rate'])
+            self.none(status['eta'])
+
+            offs = await nexsroot.index()
+
+            with mock.patch('synapse.common.now', return_value=1000):
+                nexsroot._updMirrorStatus(offs + 1000)
+
+            nexsroot.nexslog.setIndex(offs + 500)
+
+            with mock.patch('synapse.common.now', return_value=2000):
+                nexsroot._updMirrorStatus(offs + 1000)
+
+            status = await nexsroot.getMirrorStatus()
+            self.eq(offs + 1000, status['leader'])
+            self.eq(500, status['lag'])
+            self.eq(500.0, status['rate'])
+            self.eq(1000, status['eta'])
+
+            nexsroot.client = None
@@ -1179,3 +1179,77 @@ class ScrapeTest(s_t_utils.SynTest):
         nodes.remove(('it:sec:cpe', 'cpe:2.3:*:*why*:*:*:*:*:*:*:*:*:*'))
 
         self.len(0, nodes)
+
+    def test_scrape_hints(self):
+
+        # rules with a hint must produce the same results as a scan of the full text
+        texts = (data0, data1, data2, data3, btc_addresses, eth_addresses, bch_addresses,
+                 xrp_addresses, substrate_addresses, cardano_addresses, linux_paths, windows_paths, unc_paths,
+                 cpedata, 'CWE-1 cwe-22,CWE-123456789 bitcoincash:qq ::1 [::1]:80 1.2.3.4:443 a@b.com x.y.')
+
+        for text in texts:
+            text, offsets = s_scrape.refang_text2(text)
+            for (regx, opts) in [blob for blobs in s_scrape._regexes.values() for blob in blobs]:
+
+                hint = opts.get('hint')
+                if hint is None:
+                    continue
+
+                spans = s_scrape._getHintSpans(text, hint)
+                self.eq(list(s_scrape._genMatches(text, regx, opts)),
+                        list(s_scrape._genMatches(text, regx, opts, spans=spans)))
+
+        # spans include one character of context and adjacent spans are merged
+        self.eq([(0, 9), (13, 27)], s_scrape._getHintSpans('woot.com hehe haha.com,b.io', s_scrape.fqdn_hint))
+        self.eq([], s_scrape._getHintSpans('no dots here', s_scrape.fqdn_hint))
+
+    async def test_scrape_genr(self):
+
+        text = (data0 + btc_addresses + 'hxxp://evil[.]com/foo 1.2.3.4 tiré.com CVE–2022–1138 ') * 10
+        byts = text.encode()
+
+        async def genr(size=777):
+            for i in range(0, len(byts), size):
+                yield byts[i:i + size]
+
+        def sortkey(info):
+            return (info['offset'], info['form'], str(info['valu']))
+
+        infos = sorted(s_scrape._contextScrapeList(text), key=sortkey)
+
+        # results from overlapping windows match scraping the full text
+        with mock.patch('synapse.lib.scrape.SCRAPE_WINDOW_SIZE', 2000):
+            with mock.patch('synapse.lib.scrape.SCRAPE_WINDOW_OVERLAP', 500):
+
+                items = [item async for item in s_scrape.contextScrapeGenr(genr())]
+                self.eq(infos, sorted(items, key=sortkey))
+
+                ndefs = [item async for item in s_scrape.scrapeGenr(genr(), ptype='inet:ipv4')]
+                self.eq(sorted(ndefs), sorted((i['form'], i['valu']) for i in infos if i['form'] == 'inet:ipv4'))
+
+                items = [item async for item in s_scrape.contextScrapeGenr(genr(), first=True)]
+                self.len(1, items)
+
+                windows = [item async for item in s_scrape.genTextWindows(genr())]
+                self.gt(len(windows), 10)
+                for (base, lo, hi, wtext) in windows:
+                    self.eq(text[base:base + len(wtext)], wtext)
+
+                self.eq(0, windows[0][0])
+                self.eq(0, windows[0][1])
+                self.eq(len(text), windows[-1][0] + windows[-1][2])
+
+        self.eq(infos, sorted([item async for item in s_scrape.contextScrapeGenr(genr(size=1))], key=sortkey))
+
+        # multi-byte characters split across chunks are decoded
+        items = [item async for item in s_scrape.contextScrapeGenr(genr(size=1), form='inet:fqdn')]
+        self.isin('tiré.com', [item['valu'] for item in items])
+
+        async def empty():
+            if False:
+                yield b''
+
+        self.eq([], [item async for item in s_scrape.contextScrapeGenr(empty())])
+
+        with self.raises(s_exc.BadArg):
+            await s_t_utils.alist(s_scrape.genTextWindows(genr(), size=1000, overlap=500))
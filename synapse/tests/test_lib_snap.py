@@ -3,6 +3,7 @@ import random
 import asyncio
 import contextlib
 import collections
+import unittest.mock as mock
 
 import synapse.exc as s_exc
 import synapse.common as s_common
@@ -132,6 +133,64 @@ class SnapTest(s_t_utils.SynTest):
                 self.eq(node2, node)
                 self.nn(node2.get('baz'))
 
+    async def test_addNodes_batch(self):
+
+        async with self.getTestCore() as core:
+
+            nexsoffs = await core.getNexsIndx()
+
+            ndefs = [(('test:int', x), {'tags': {'foo.bar': (x, x + 1)}}) for x in range(25)]
+            ndefs.append((('test:str', 'newp'), {'props': {'tick': 'newp'}}))
+            ndefs.append((('test:int', 'newp'), {}))
+            ndefs.append((('test:int', 3), {'tags': {'foo.bar': (100, 101)}, 'nodedata': {'hehe': 'haha'},
+                                           'edges': (('refs', ('test:str', 'haha')),)}))
+
+            async with await core.snap() as snap:
+                snap.nodeeditbatchsize = 10
+                nodes = await alist(snap.addNodes(ndefs, batch=True))
+
+            self.len(27, nodes)
+            self.eq([n.ndef[1] for n in nodes[:25]], list(range(25)))
+            self.eq(nodes[25].ndef, ('test:str', 'newp'))
+            self.none(nodes[25].get('tick'))
+            self.eq(nodes[26].ndef, ('test:int', 3))
+
+            # one nexus item per batch rather than one per nodedef
+            self.eq(3, await core.getNexsIndx() - nexsoffs)
+
+            self.len(25, await core.nodes('test:int#foo.bar'))
+            self.len(1, await core.nodes('syn:tag=foo.bar'))
+            self.len(1, await core.nodes('test:int=3 -(refs)> test:str'))
+
+            nodes = await core.nodes('test:int=3')
+            self.eq(nodes[0].get('#foo.bar'), (3, 101))
+            self.eq('haha', await nodes[0].getData('hehe'))
+
+            # a failed nodedef does not leave partial edits in the batch
+            async with await core.snap() as snap:
+
+                async def boom(self, tag, name, valu):
+                    await self.addTag('bad.tag')
+                    raise s_exc.SynErr(mesg='boom')
+
+                snap.strict = False
+                with mock.patch('synapse.lib.snap.ProtoNode.setTagProp', boom):
+                    ndefs = (
+                        (('test:int', 100), {}),
+                        (('test:int', 101), {'tagprops': {'foo': {'score': 10}}}),
+                        (('test:int', 102), {}),
+                    )
+                    nodes = await alist(snap.addNodes(ndefs, batch=True))
+                    self.eq([n.ndef[1] for n in nodes], [100, 102])
+
+                    snap.strict = True
+                    with self.raises(s_exc.SynErr):
+                        await alist(snap.addNodes(((('test:int', 103), {}), ndefs[1]), batch=True))
+
+            self.len(0, await core.nodes('test:int=101'))
+            self.len(0, await core.nodes('syn:tag=bad.tag'))
+            self.len(1, await core.nodes('test:int=103'))
+
     async def test_addNodesAuto(self):
         '''
         Secondary props that are forms when set make nodes
@@ -286,6 +345,62 @@ class SnapTest(s_t_utils.SynTest):
             async with await view1.snap(user=root) as snap:
                 await snap.applyNodeEdit((nodes[0].buid, 'inet:ipv4', edits))
 
+    async def test_cortex_lift_layers_chunks(self):
+
+        async with self._getTestCoreMultiLayer() as (view0, view1):
+
+            await view0.core.nodes('for $i in $lib.range(12) { [ test:int=$i :loc=us +#foo ] }')
+            await view1.core.nodes('for $i in $lib.range(18, start=6) { [ test:int=$i :loc=ca +#foo ] }',
+                                   opts={'view': view1.iden})
+
+            with mock.patch('synapse.cortex.SODE_CHUNK_SIZE', 5):
+
+                nodes = await alist(view1.eval('test:int'))
+                self.eq(list(range(18)), [n.ndef[1] for n in nodes])
+
+                nodes = await alist(view1.eval('test:int:loc=us'))
+                self.eq(list(range(6)), sorted(n.ndef[1] for n in nodes))
+
+                nodes = await alist(view1.eval('test:int:loc'))
+                self.eq(list(range(18)), sorted(n.ndef[1] for n in nodes))
+                self.eq(['ca'] * 12 + ['us'] * 6, [n.get('loc') for n in nodes])
+
+                nodes = await alist(view1.eval('#foo'))
+                self.len(18, nodes)
+
+            core = view0.core
+            with mock.patch('synapse.cortex.LIFT_CHUNK_SIZE', 5):
+
+                rows = await alist(core._liftByProp('test:int', None, view0.layers))
+                self.eq([5, 5, 2], [len(r) for r in rows])
+                self.eq(view0.layers[0].iden, rows[0][0][1][0][0])
+
+                nodes = await alist(view0.eval('test:int'))
+                self.eq(list(range(12)), [n.ndef[1] for n in nodes])
+
+                nodes = await alist(view0.eval('test:int:loc=us'))
+                self.len(12, nodes)
+
+                nodes = await alist(view0.eval('#foo'))
+                self.len(12, nodes)
+
+                async with await view0.snap(user=core.auth.rootuser) as snap:
+
+                    sleeps = 0
+                    sleep = asyncio.sleep
+
+                    async def countsleep(delay, *args, **kwargs):
+                        nonlocal sleeps
+                        sleeps += 1
+                        return await sleep(delay, *args, **kwargs)
+
+                    with mock.patch('asyncio.sleep', countsleep):
+                        nodes = await alist(snap.nodesByProp('test:int'))
+                        self.len(12, nodes)
+
+                    # one yield to the ioloop per chunk of rows
+                    self.eq(3, sleeps)
+
     async def test_cortex_lift_layers_bad_filter(self):
         '''
         Test a two layer cortex where a lift operation gives the wrong result
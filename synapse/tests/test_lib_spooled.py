@@ -1,7 +1,13 @@
 import os
+import asyncio
+
+import unittest.mock as mock
+
+import synapse.lib.const as s_const
 
 import synapse.tests.utils as s_test
 
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.spooled as s_spooled
 
 class SpooledTest(s_test.SynTest):
@@ -128,3 +134,151 @@ class SpooledTest(s_test.SynTest):
 
         async with await s_spooled.Dict.anit(size=1000) as sd1:
             await runtest(sd1)
+
+    async def test_spooled_bloom(self):
+
+        bloom = s_spooled.Bloom(capacity=1000)
+        self.eq(1248, bloom.size)
+        self.eq(998, bloom.capacity)
+
+        hkeys = [hash(s_msgpack.en(i)) for i in range(1000)]
+        [bloom.add(hkey) for hkey in hkeys]
+
+        # never any false negatives
+        self.true(all(bloom.has(hkey) for hkey in hkeys))
+        self.true(bloom.isfull())
+
+        newp = [hash(s_msgpack.en(i)) for i in range(1000, 2000)]
+        self.lt(len([hkey for hkey in newp if bloom.has(hkey)]), 50)
+
+        copy = bloom.copy()
+        self.true(all(copy.has(hkey) for hkey in hkeys))
+        copy.add(hash(b'visi'))
+        self.true(copy.has(hash(b'visi')))
+        self.eq(1001, copy.count)
+        self.eq(1000, bloom.count)
+
+        # a full filter which can not grow is still correct
+        bloom = s_spooled.Bloom(capacity=1000, maxsize=1024)
+        self.eq(1024, bloom.size)
+        self.eq(819, bloom.capacity)
+        [bloom.add(hkey) for hkey in hkeys]
+        self.false(bloom.isfull())
+        self.true(all(bloom.has(hkey) for hkey in hkeys))
+
+        # the filter grows until it reaches the max size
+        async with await s_spooled.Set.anit(size=10, memsize=8192) as sset:
+
+            for i in range(1000):
+                await sset.add(i)
+
+            self.gt(sset.bloom.size, 1024)
+            self.le(sset.bloom.size, 2048)
+            self.true(all(i in sset for i in range(1000)))
+            self.false(any(sset.has(i) for i in range(1000, 1100)))
+
+        # the filter grows while other tasks add items
+        with mock.patch.object(s_spooled, 'BLOOM_YIELD', 2):
+
+            async with await s_spooled.Set.anit(size=10, memsize=65536) as sset:
+
+                for i in range(4000, 4010):
+                    await sset.add(i)
+                self.true(sset.fallback)
+
+                async def addrange(start, stop):
+                    for i in range(start, stop):
+                        await sset.add(i)
+
+                await asyncio.gather(addrange(0, 2000), addrange(2000, 4000))
+
+                self.len(4010, sset)
+                self.none(sset.bloomadds)
+                self.gt(sset.bloom.size, 1024)
+                self.true(all(i in sset for i in range(4010)))
+                self.eq(list(range(4010)), sorted([x async for x in sset]))
+
+    async def test_spooled_memsize(self):
+
+        # the default memory limit scales with the spool size
+        async with await s_spooled.Set.anit(size=10) as sset:
+            self.eq(10 * s_const.kibibyte, sset.memsize)
+
+        async with await s_spooled.Set.anit() as sset:
+            self.eq(s_spooled.MAX_SPOOL_SIZE * s_const.kibibyte, sset.memsize)
+
+        async with await s_spooled.Set.anit(size=1000000) as sset:
+            self.eq(s_spooled.MAX_SPOOL_MEM, sset.memsize)
+
+        async with await s_spooled.Set.anit(size=10, memsize=8192) as sset:
+
+            for i in range(200):
+                await sset.add(i)
+                await sset.add(i)
+
+            self.true(sset.fallback)
+            self.len(200, sset)
+
+            # items were flushed to the slab in bulk and some are still buffered
+            self.gt(sset.slab.stat()['entries'], 10)
+            self.lt(sset.slab.stat()['entries'], 200)
+            self.true(sset.pending)
+
+            self.true(all(i in sset for i in range(200)))
+            self.false(any(sset.has(i) for i in range(200, 400)))
+
+            sset.discard(199)
+            sset.discard(0)
+            sset.discard(0)
+            sset.discard(999)
+            self.len(198, sset)
+            self.false(199 in sset)
+            self.false(0 in sset)
+
+            self.eq(list(range(1, 199)), [x async for x in sset])
+            self.false(sset.pending)
+            self.eq(198, sset.slab.stat()['entries'])
+
+            newset = await sset.copy()
+            self.len(198, newset)
+            await newset.add(0)
+            self.len(199, newset)
+            self.true(0 in newset)
+            self.false(0 in sset)
+            await newset.fini()
+
+        async with await s_spooled.Dict.anit(size=10, memsize=8192) as sdict:
+
+            for i in range(200):
+                await sdict.set(i, f'{i}')
+
+            self.true(sdict.fallback)
+            self.true(sdict.pending)
+            self.len(200, sdict)
+
+            # overwrite both flushed and buffered values
+            await sdict.set(1, 'hehe')
+            await sdict.set(199, 'haha')
+            self.len(200, sdict)
+
+            self.eq('hehe', sdict.get(1))
+            self.eq('haha', sdict.get(199))
+            self.eq('50', sdict.get(50))
+            self.none(sdict.get(500))
+            self.eq('newp', sdict.get(500, 'newp'))
+            self.true(sdict.has(100))
+            self.false(sdict.has(500))
+
+            self.eq('haha', sdict.pop(199))
+            self.eq('hehe', sdict.pop(1))
+            self.none(sdict.pop(1))
+            self.eq('newp', sdict.pop(500, 'newp'))
+            self.len(198, sdict)
+
+            keys = list(range(200))
+            keys.remove(1)
+            keys.remove(199)
+            # buffered items are merged in order without being flushed
+            self.true(sdict.pending)
+            self.eq(keys, list(sdict.keys()))
+            self.eq([(k, f'{k}') for k in keys], list(sdict.items()))
@@ -2,9 +2,12 @@ import copy
 import json
 import asyncio
 import datetime
+import contextlib
 import itertools
 import urllib.parse as u_parse
 
+from unittest import mock
+
 import synapse.exc as s_exc
 import synapse.common as s_common
 import synapse.telepath as s_telepath
@@ -2883,6 +2886,132 @@ class StormTest(s_t_utils.SynTest):
             q = '[ test:str=hehe ]  | movetag $node.iden() haha'
             await self.asyncraises(s_exc.StormRuntimeError, core.nodes(q))
 
+    async def test_storm_parallel_procs(self):
+
+        with self.getTestDir() as dirn:
+
+            path00 = s_common.gendir(dirn, 'core00')
+            path01 = s_common.gendir(dirn, 'core01')
+
+            async with self.getTestCore(dirn=path00) as core00:
+
+                msgs = await core00.stormlist('[ inet:ipv4=1.2.3.0/28 ] | parallel --procs 2 { +inet:ipv4 }')
+                self.stormIsInWarn('parallel --procs requires a Storm pool', msgs)
+                self.len(16, [m for m in msgs if m[0] == 'node'])
+
+                msgs = await core00.stormlist('parallel --help')
+                self.stormIsInPrint('requires a configured Storm pool', msgs)
+
+            s_tools_backup.backup(path00, path01)
+
+            async with self.getTestCore(dirn=path00) as core00:
+
+                conf01 = {'mirror': core00.getLocalUrl()}
+                async with self.getTestCore(dirn=path01, conf=conf01) as core01:
+
+                    async with core01.getLocalProxy() as proxy:
+
+                        class Pool:
+                            calls = 0
+
+                            def size(self):
+                                return 1
+
+                            async def proxy(self, timeout=None, weights=None):
+                                self.calls += 1
+                                return proxy
+
+                            def setProxyLag(self, proxy, lag):
+                                pass
+
+                            @contextlib.contextmanager
+                            def track(self, proxy):
+                                yield
+
+                        core00.stormpool = Pool()
+                        core00.stormpoolopts = {'timeout:connection': 10, 'timeout:sync': 10}
+
+                        # run the outer queries locally
+                        opts = {'mirror': False}
+
+                        await core00.nodes('for $i in $lib.range(300) { [ test:int=$i ] }', opts=opts)
+
+                        with self.raises(s_exc.BadArg):
+                            await core00.nodes('test:int | parallel --procs 0 { +test:int }', opts=opts)
+
+                        q = '''
+                        $x = (10)
+                        test:int
+                        | parallel --procs 3 {
+                            +test:int>=$x
+                            if ($node.value() = 20) { $lib.print(twenty) }
+                        }
+                        '''
+                        msgs = await core00.stormlist(q, opts=opts)
+                        self.stormHasNoWarnErr(msgs)
+                        self.stormIsInPrint('twenty', msgs)
+
+                        nodes = [m[1] for m in msgs if m[0] == 'node']
+                        self.len(290, nodes)
+                        self.eq(set(range(10, 300)), {n[0][1] for n in nodes})
+                        self.ge(core00.stormpool.calls, 3)
+
+                        # mirror pipelines are read-only
+                        with self.raises(s_exc.IsReadOnly):
+                            await core00.nodes('test:int=1 | parallel --procs 2 { [ :loc=us ] }', opts=opts)
+
+                        # pipelines run locally if a mirror is not available
+                        with mock.patch.object(core00, '_getMirrorProxy', return_value=None):
+                            nodes = await core00.nodes('test:int | parallel --procs 2 { +test:int<5 [ +#foo ] }', opts=opts)
+                            self.len(5, nodes)
+                            self.len(5, await core00.nodes('test:int#foo', opts=opts))
+
+    async def test_storm_profile(self):
+
+        async with self.getTestCore() as core:
+
+            await core.nodes('for $i in $lib.range(10) { [ test:str=$i :hehe=$i +#foo ] }')
+
+            msgs = await core.stormlist('test:str +#foo')
+            self.len(0, [m for m in msgs if m[0] == 'profile'])
+
+            q = 'test:str -:hehe=1 | limit 3 | { -> test:str } | tee { +:hehe=2 } | uniq'
+            msgs = await core.stormlist(q, opts={'profile': True})
+            self.stormHasNoWarnErr(msgs)
+
+            prof = [m[1] for m in msgs if m[0] == 'profile']
+            self.len(1, prof)
+
+            query = prof[0]['query']
+            self.eq(query['text'], q)
+            self.eq(query['runs'], 1)
+            self.eq(query['in'], 0)
+
+            opers = query['opers']
+            self.eq([o['name'] for o in opers], ['LiftProp', 'FiltOper', 'CmdOper', 'SubQuery', 'CmdOper', 'CmdOper'])
+            self.eq([o['text'] for o in opers], ['test:str', '-:hehe=1', 'limit 3', '{ -> test:str }',
+                                                 'tee { +:hehe=2 }', 'uniq'])
+            self.eq([(o['in'], o['out']) for o in opers], [(0, 4), (4, 3), (3, 3), (3, 3), (3, 1), (1, 1)])
+
+            self.ge(opers[0]['rows'], 4)
+            self.ge(opers[0]['sodes'], 4)
+            self.eq(opers[1]['rows'], 0)
+            for oper in opers:
+                self.ge(oper['took'], oper['self'])
+
+            subq = opers[3]['queries']
+            self.len(1, subq)
+            self.eq(subq[0]['text'], '-> test:str')
+            self.eq(subq[0]['runs'], 3)
+            self.eq(subq[0]['in'], 3)
+            self.eq(subq[0]['opers'][0]['name'], 'FormPivot')
+
+            subq = opers[4]['queries']
+            self.len(1, subq)
+            self.eq(subq[0]['text'], '+:hehe=2')
+            self.eq(subq[0]['in'], 3)
+            self.eq(subq[0]['opers'][0]['out'], 1)
+
     async def test_storm_spin(self):
 
         async with self.getTestCore() as core:
@@ -3207,6 +3336,33 @@ class StormTest(s_t_utils.SynTest):
             msgs = await core.stormlist('syn:trigger | scrape :storm --refs')
             self.stormIsInWarn('Edges cannot be used with runt nodes: syn:trigger', msgs)
 
+            # scrape files from the axon
+            text = 'hello 7.7.7.7 woot[.]com\n' * 100
+            size, sha256 = await core.axon.put(text.encode())
+            opts = {'vars': {'sha256': s_common.ehex(sha256)}}
+
+            with mock.patch('synapse.lib.scrape.SCRAPE_WINDOW_SIZE', 1000):
+                with mock.patch('synapse.lib.scrape.SCRAPE_WINDOW_OVERLAP', 100):
+
+                    nodes = await core.nodes('scrape --axon $sha256 --yield | uniq', opts=opts)
+                    self.sorteq(['inet:fqdn', 'inet:ipv4'], [n.ndef[0] for n in nodes])
+
+                    await core.nodes('[ file:bytes=$sha256 ] [ file:bytes=* ]', opts=opts)
+                    nodes = await core.nodes('file:bytes | scrape --axon --refs --yield --forms inet:ipv4', opts=opts)
+                    self.len(100, nodes)
+                    self.eq(('inet:ipv4', 0x07070707), nodes[0].ndef)
+
+                    nodes = await core.nodes('file:bytes | scrape --axon | -(refs)> *', opts=opts)
+                    self.len(1, nodes)
+
+                    q = '$x = $lib.list() for $item in $lib.axon.scrape($sha256, unique=$lib.true) { $x.append($item.0) } return($x)'
+                    self.sorteq(['inet:fqdn', 'inet:ipv4'], await core.callStorm(q, opts=opts))
+
+            visi = await core.auth.addUser('visi')
+            await visi.addRule((True, ('node',)))
+            msgs = await core.stormlist('scrape --axon $sha256', opts={'user': visi.iden, 'vars': opts['vars']})
+            self.stormIsInErr('must have permission storm.lib.axon.get', msgs)
+
     async def test_storm_tee(self):
 
         async with self.getTestCore() as core:
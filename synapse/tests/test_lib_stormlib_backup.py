@@ -35,7 +35,7 @@ class BackupTest(s_test.SynTest):
                 await core.callStorm('$lib.backup.del(foo)')
                 self.false(os.path.isdir(os.path.join(backdirn, 'foo')))
 
-                async def mockBackupTask(dirn):
+                async def mockBackupTask(dirn, basedirn=None):
                     await asyncio.sleep(5)
 
                 core._execBackupTask = mockBackupTask
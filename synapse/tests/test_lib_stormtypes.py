@@ -6163,6 +6163,13 @@ class StormTypesTest(s_test.SynTest):
                 return($items)
             ''', opts=opts))
 
+            opts = {'vars': {'sha256': linesitem[1]}}
+            self.eq((('inet:fqdn', 'vertex.link', 0), ('inet:fqdn', 'woot.com', 12)), await core.callStorm('''
+                $items = $lib.list()
+                for ($form, $valu, $info) in $lib.axon.scrape($sha256) { $items.append(($form, $valu, $info.offset)) }
+                return($items)
+            ''', opts=opts))
+
             async def waitlist():
                 items = await core.callStorm('''
                     $x=$lib.list()
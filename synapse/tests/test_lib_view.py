@@ -1,10 +1,14 @@
 import asyncio
 import collections
 
+from unittest import mock
+
 import synapse.exc as s_exc
 import synapse.common as s_common
 
+import synapse.lib.snap as s_snap
 import synapse.lib.time as s_time
+import synapse.lib.msgpack as s_msgpack
 
 import synapse.tests.utils as s_t_utils
 from synapse.tests.utils import alist
@@ -929,3 +933,126 @@ class ViewTest(s_t_utils.SynTest):
 
             opts['vars']['iden'] = view02.iden
             self.eq([], await core.callStorm(q, opts=opts))
+
+    async def test_view_merge_batched(self):
+
+        async with self.getTestCore() as core:
+
+            ninjas = await core.auth.addRole('ninjas')
+            opts = {'vars': {'role': ninjas.iden}}
+            await core.callStorm('return($lib.view.get().set(quorum, ({"count": 1, "roles": [$role]})))', opts=opts)
+
+            await core.nodes('[ test:int=1 ] $lib.trigger.add(({"cond": "node:add", "form": "test:int", "storm": "[ +#trig ]"}))')
+
+            fork = core.getView(await core.callStorm('return($lib.view.get().fork().iden)'))
+            forkopts = {'view': fork.iden}
+
+            await core.nodes('for $i in $lib.range(20) { [ test:str=$i :hehe=$i +#foo ] } [ test:int=(2) +(refs)> { test:str=1 } ]', opts=forkopts)
+            await core.nodes('for $i in $lib.range(10) { [ test:int=($i + 10) ] }', opts=forkopts)
+            await core.nodes('test:str=3 $node.data.set(foo, bar)', opts=forkopts)
+
+            await core.callStorm('return($lib.view.get().setMergeRequest())', opts=forkopts)
+
+            joined = []
+            saveNodeEdits = s_snap.Snap.saveNodeEdits
+
+            async def joinNodeEdits(self, edits, meta):
+                joined.extend(edits)
+                return await saveNodeEdits(self, edits, meta)
+
+            with mock.patch('synapse.lib.view.mergechunkmax', 7):
+                with mock.patch.object(s_snap.Snap, 'saveNodeEdits', joinNodeEdits):
+                    await fork.runViewMerge()
+
+            # only the nodes with triggers in the parent were joined
+            self.len(11, joined)
+            self.eq({'test:int'}, {edit[1] for edit in joined})
+
+            self.len(20, await core.nodes('test:str +#foo +:hehe'))
+            self.len(12, await core.nodes('test:int'))
+            self.len(11, await core.nodes('test:int +#trig'))
+            self.len(1, await core.nodes('test:int=2 -(refs)> test:str'))
+            self.eq('bar', await core.callStorm('test:str=3 return($node.data.get(foo))'))
+
+            self.none(core.getView(fork.iden))
+
+            # an interrupted merge resumes from its checkpoint
+            fork = core.getView(await core.callStorm('return($lib.view.get().fork().iden)'))
+            await core.nodes('for $i in $lib.range(10) { [ test:guid=* ] }', opts={'view': fork.iden})
+            await core.callStorm('return($lib.view.get().setMergeRequest())', opts={'view': fork.iden})
+
+            buids = [nodeedit[0] async for nodeedit in fork.layers[0].iterLayerNodeEdits()]
+            self.len(10, buids)
+            self.eq(buids, sorted(buids))
+
+            self.len(7, [ne async for ne in fork.layers[0].iterLayerNodeEdits(lastbuid=buids[2])])
+
+            prog = {'buid': buids[3], 'count': 4}
+            core.slab.put(fork.bidn + b'merge:prog', s_msgpack.en(prog), db='view:meta')
+
+            await fork.runViewMerge()
+
+            self.len(6, await core.nodes('test:guid'))
+            for buid in buids[:4]:
+                self.eq({}, await core.getView().layers[0].getStorNode(buid))
+            for buid in buids[4:]:
+                self.nn((await core.getView().layers[0].getStorNode(buid)).get('valu'))
+
+            self.none(core.slab.get(fork.bidn + b'merge:prog', db='view:meta'))
+
+    async def test_view_merge_callbacks(self):
+
+        async with self.getTestCore() as core:
+
+            ninjas = await core.auth.addRole('ninjas')
+            opts = {'vars': {'role': ninjas.iden}}
+            await core.callStorm('return($lib.view.get().set(quorum, ({"count": 1, "roles": [$role]})))', opts=opts)
+
+            dels = []
+            core.model.form('test:int').onDel(dels.append)
+            core.model.prop('test:guid:size').onDel(dels.append)
+
+            fork = core.getView(await core.callStorm('return($lib.view.get().fork().iden)'))
+            forkopts = {'view': fork.iden}
+
+            await core.nodes('[ test:str=a test:str=b test:str=c +#foo.bar ]', opts=forkopts)
+            await core.nodes('test:str=c | delnode', opts=forkopts)
+            await core.nodes('test:str=b [ -#foo.bar ]', opts=forkopts)
+            await core.nodes('[ test:int=1 ]', opts=forkopts)
+            await core.nodes('[ test:guid=* :size=3 ]', opts=forkopts)
+
+            await core.callStorm('return($lib.view.get().setMergeRequest())', opts=forkopts)
+
+            evnts = []
+            layr = core.getView().layers[0]
+            layr.on('tag:add', evnts.append)
+            layr.on('tag:del', evnts.append)
+
+            joined = []
+            saveNodeEdits = s_snap.Snap.saveNodeEdits
+
+            async def joinNodeEdits(self, edits, meta):
+                joined.extend(edits)
+                return await saveNodeEdits(self, edits, meta)
+
+            with mock.patch.object(s_snap.Snap, 'saveNodeEdits', joinNodeEdits):
+                await fork.runViewMerge()
+
+            # forms with ondel callbacks are joined, the others are saved to the layer
+            self.eq({'test:int', 'test:guid'}, {edit[1] for edit in joined})
+
+            # the deleted node and removed tag were not merged
+            self.len(0, await core.nodes('test:str=c'))
+            self.len(1, await core.nodes('test:str=b +#foo -#foo.bar'))
+            self.len(1, await core.nodes('test:str=a +#foo.bar'))
+
+            # the layer tag events were fired for the merged tags
+            astr = await core.callStorm('test:str=a return($node.iden())')
+            bstr = await core.callStorm('test:str=b return($node.iden())')
+            self.sorteq([
+                ('tag:add', 'foo', astr),
+                ('tag:add', 'foo.bar', astr),
+                ('tag:add', 'foo', bstr),
+            ], [(name, info['tag'], info['node']) for (name, info) in evnts])
+
+            self.len(0, dels)
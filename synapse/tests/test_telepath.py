@@ -112,6 +112,14 @@ class Foo:
         await asyncio.sleep(5)
         return 42
 
+    def biggenr(self, x):
+        for i in range(x):
+            yield (i, 'V' * 1024)
+
+    async def bigagenr(self, x):
+        for i in range(x):
+            yield (i, 'V' * 1024)
+
     async def corogenr(self, x):
         for i in range(x):
             yield i
@@ -279,6 +287,32 @@ class TeleTest(s_t_utils.SynTest):
             async with await s_telepath.openurl('tcp://127.0.0.1/foo', port=dmon.addr[1]) as prox:
                 self.eq((10, 20, 30), await s_coro.executor(sync))
 
+    async def test_telepath_genr_batch(self):
+
+        foo = Foo()
+
+        async with self.getTestDmon() as dmon:
+
+            dmon.share('foo', foo)
+
+            async with await s_telepath.openurl('tcp://127.0.0.1/foo', port=dmon.addr[1]) as prox:
+
+                # stream more than link.txbufsize through t2call
+                items = [(i, 'V' * 1024) for i in range(1000)]
+
+                self.eq(items, [item async for item in await prox.biggenr(1000)])
+                self.eq(items, [item async for item in prox.bigagenr(1000)])
+
+                # a slow async generator still streams items as they are produced
+                async def first(n):
+                    retn = []
+                    async for item in prox.corogenr(1000):
+                        retn.append(item)
+                        if len(retn) == n:
+                            return retn
+
+                self.eq([0, 1], await asyncio.wait_for(first(2), timeout=6))
+
     def test_telepath_sync_genr_break(self):
 
         try:
@@ -889,6 +923,85 @@ class TeleTest(s_t_utils.SynTest):
         await dmon0.fini()
         await dmon1.fini()
 
+    async def test_telepath_client_load(self):
+
+        foo = Foo()
+
+        async with self.getTestDmon() as dmon:
+            dmon.share('foo', foo)
+            url = f'tcp://127.0.0.1:{dmon.addr[1]}/foo'
+
+            async with await s_telepath.open(url) as targ:
+
+                await targ.waitready(timeout=12)
+                prox00 = await targ.proxy(timeout=12)
+
+                prox01 = await s_telepath.openurl(url)
+                await targ._onPoolLink(prox01, s_telepath.chopurl(url))
+                self.eq(2, targ.size())
+
+                # without any load information the selection is still round-robin
+                weights = {'inflight': 1.0, 'latency': 1.0, 'lag': 1.0}
+                proxies = [await targ.proxy(weights=weights) for _ in range(4)]
+                self.len(2, set(proxies))
+                self.ne(proxies[0], proxies[1])
+                self.eq(proxies[0], proxies[2])
+
+                # busy proxies are avoided
+                with targ.track(prox00):
+                    for _ in range(3):
+                        self.true(prox01 is await targ.proxy(weights=weights))
+
+                    self.eq(1, sum(info['inflight'] for info in targ.getProxyLoad()))
+
+                # slow proxies are avoided
+                with targ.track(prox00):
+                    self.eq(30, await prox00.echo(30))
+                    await asyncio.sleep(0.1)
+
+                for _ in range(3):
+                    self.true(prox01 is await targ.proxy(weights=weights))
+
+                # latency may be ignored via the weights
+                proxies = [await targ.proxy(weights={'inflight': 1.0}) for _ in range(2)]
+                self.len(2, set(proxies))
+
+                # lagging proxies are avoided
+                with targ.track(prox01):
+                    self.eq(30, await prox01.echo(30))
+                    await asyncio.sleep(0.2)
+
+                targ.setProxyLag(prox01, 100)
+                self.true(prox00 is await targ.proxy(weights=weights))
+
+                load = targ.getProxyLoad()
+                self.len(2, load)
+                self.eq([0, 0], [info['inflight'] for info in load])
+                self.eq([1, 2], sorted(info['count'] for info in load))
+                self.eq([0, 100], sorted(info['lag'] for info in load))
+                self.gt(min(info['latency'] for info in load), 0)
+
+                # old load information loses its weight
+                self.gt(targ._getLoadScore(prox01, weights), 100)
+                with mock.patch('synapse.telepath.LOAD_HALFLIFE', 0.001):
+                    await asyncio.sleep(0.1)
+                    self.lt(targ._getLoadScore(prox01, weights), 0.001)
+
+                # round-robin remains the default
+                targ.setProxyLag(prox01, 100)
+                proxies = [await targ.proxy() for _ in range(2)]
+                self.len(2, set(proxies))
+
+                await prox01.fini()
+                self.len(1, targ.getProxyLoad())
+
+                # load is not tracked for unknown proxies
+                with targ.track(prox01):
+                    pass
+
+                targ.setProxyLag(prox01, 10)
+                self.len(1, targ.getProxyLoad())
+
     async def test_telepath_poolsize(self):
 
         # While test_telepath_sync_genr_break also touches the link pool,
@@ -962,6 +1075,95 @@ class TeleTest(s_t_utils.SynTest):
                 await client.waitready()
                 self.true(client._t_proxy._link_poolsize, 2)
 
+    async def test_telepath_poolmax(self):
+
+        foo = Foo()
+
+        async with self.getTestDmon() as dmon:
+            dmon.share('foo', foo)
+            url = f'tcp://127.0.0.1:{dmon.addr[1]}/foo'
+
+            async with await s_telepath.openurl(url) as prox:
+
+                prox._link_poolmax = 2
+
+                # a burst of concurrent calls shares the bounded set of links
+                coros = [prox.corovalu(i, 1) for i in range(20)]
+                self.eq([i * 2 + 1 for i in range(20)], await asyncio.gather(*coros))
+
+                info = prox.getPoolInfo()
+                self.eq(2, info['size'])
+                self.eq(2, info['idle'])
+                self.eq(0, info['waiting'])
+                self.eq(2, info['created'])
+                self.eq(0, info['closed'])
+                self.eq(2, info['poolmax'])
+                self.eq(4, info['poolsize'])
+                self.gt(info['waits'], 0)
+                self.ge(info['waittime'], 0)
+
+                # a waiting call is handed the link from a finished genr
+                genr0 = await prox.genr()
+                genr1 = await prox.genr()
+                self.eq(0, prox.getPoolInfo()['idle'])
+
+                task = prox.schedCoro(prox.echo(10))
+                await asyncio.sleep(0.1)
+                self.false(task.done())
+                self.eq(1, prox.getPoolInfo()['waiting'])
+
+                self.eq(await genr0.list(), (10, 20, 30))
+                self.eq(10, await asyncio.wait_for(task, timeout=5))
+
+                # a closed link allows a waiting call to create a new one
+                genr0 = await prox.genr()
+                task = prox.schedCoro(prox.echo(20))
+                await asyncio.sleep(0.1)
+                self.false(task.done())
+
+                self.eq(await genr1.genr.__anext__(), 10)
+                await genr1.genr.aclose()
+
+                self.eq(20, await asyncio.wait_for(task, timeout=5))
+                self.eq(await genr0.list(), (10, 20, 30))
+
+                info = prox.getPoolInfo()
+                self.eq(2, info['size'])
+                self.eq(3, info['created'])
+                self.eq(1, info['closed'])
+
+                # cancelled waiters do not leak links
+                genr0 = await prox.genr()
+                genr1 = await prox.genr()
+
+                task = prox.schedCoro(prox.echo(30))
+                await asyncio.sleep(0.1)
+                task.cancel()
+                await asyncio.sleep(0)
+
+                self.eq(await genr0.list(), (10, 20, 30))
+                self.eq(await genr1.list(), (10, 20, 30))
+
+                info = prox.getPoolInfo()
+                self.eq(2, info['size'])
+                self.eq(2, info['idle'])
+                self.eq(0, info['waiting'])
+
+                # waiters are released when the proxy is fini
+                genr0 = await prox.genr()
+                genr1 = await prox.genr()
+                task = asyncio.create_task(prox.echo(40))
+                await asyncio.sleep(0.1)
+
+            with self.raises(s_exc.IsFini):
+                await task
+
+            conf = {'link_poolmax': 3, 'timeout': 2}
+            async with await s_telepath.Client.anit(url, conf=conf) as client:
+                await client.waitready()
+                self.eq(3, client._t_proxy._link_poolmax)
+                self.eq(3, (await client.proxy()).getPoolInfo()['poolmax'])
+
     async def test_link_fini_breaking_tasks(self):
         foo = Foo()
 
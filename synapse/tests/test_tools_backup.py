@@ -1,5 +1,7 @@
 import os
 
+import synapse.exc as s_exc
+
 import synapse.common as s_common
 import synapse.lib.lmdbslab as s_lmdbslab
 
@@ -39,7 +41,7 @@ class BackupTest(s_t_utils.SynTest):
             skipdirs = set()
 
         set1 = self.dirset(dir1, skipfns, skipdirs)
-        set2 = self.dirset(dir2, skipfns, set())
+        set2 = self.dirset(dir2, skipfns | {s_backup.manifest}, set())
         self.gt(len(set1), 1)
         self.gt(len(set2), 1)
         self.eq(set1, set2)
@@ -120,3 +122,76 @@ class BackupTest(s_t_utils.SynTest):
 
                 self.true(os.path.exists(s_common.genpath(dirn2, 'slabs', 'cell.lmdb')))
                 self.isin(f'/slabs/cell.lmdb/data.mdb', fpset)
+
+    async def test_backup_incremental(self):
+
+        with self.getTestDir() as dirn:
+
+            coredirn = s_common.gendir(dirn, 'core')
+            fulldirn = s_common.genpath(dirn, 'backups', 'full')
+            inc0dirn = s_common.genpath(dirn, 'backups', 'inc0')
+            inc1dirn = s_common.genpath(dirn, 'backups', 'inc1')
+
+            async with self.getTestCore(dirn=coredirn) as core:
+                layriden = core.getLayer().iden
+                await core.nodes('[ inet:ipv4=1.2.3.4 ]')
+
+            self.eq(0, s_backup.main((coredirn, fulldirn)))
+
+            mani = s_backup.getBackupManifest(fulldirn)
+            self.none(mani['base'])
+            self.isin(f'layers/{layriden}/layer_v2.lmdb', mani['lmdbs'])
+            self.true(all(info.get('from') is None for info in mani['lmdbs'].values()))
+
+            async with self.getTestCore(dirn=coredirn) as core:
+                await core.nodes('[ inet:ipv4=5.6.7.8 ]')
+
+            self.eq(0, s_backup.main((coredirn, inc0dirn, '--base', fulldirn)))
+
+            mani = s_backup.getBackupManifest(inc0dirn)
+            self.eq('../full', mani['base'])
+
+            # the modified layer is copied and the unmodified view state is not
+            layrinfo = mani['lmdbs'][f'layers/{layriden}/layer_v2.lmdb']
+            self.none(layrinfo.get('from'))
+            self.true(os.path.isfile(s_common.genpath(inc0dirn, 'layers', layriden, 'layer_v2.lmdb', 'data.mdb')))
+
+            unmodified = [name for (name, info) in mani['lmdbs'].items() if info.get('from') == '../full']
+            self.isin('slabs/graphs.lmdb', unmodified)
+            for name in unmodified:
+                self.false(os.path.exists(s_common.genpath(inc0dirn, name)))
+
+            # an incremental backup from an incremental backup tracks where the lmdb files live
+            s_backup.backup(coredirn, inc1dirn, basedir=inc0dirn)
+
+            mani = s_backup.getBackupManifest(inc1dirn)
+            self.eq('../inc0', mani['base'])
+            self.eq('../full', mani['lmdbs']['slabs/graphs.lmdb']['from'])
+            self.eq('../inc0', mani['lmdbs'][f'layers/{layriden}/layer_v2.lmdb']['from'])
+
+            with self.getTestDir() as restdirn:
+
+                restdirn = s_common.genpath(restdirn, 'core')
+                self.eq(0, s_backup.main((inc1dirn, restdirn, '--restore')))
+
+                self.compare_dirs(coredirn, restdirn, skipfns={'lock.mdb'}, skipdirs={'tmp'})
+
+                mani = s_backup.getBackupManifest(restdirn)
+                self.none(mani['base'])
+                self.true(all(info.get('from') is None for info in mani['lmdbs'].values()))
+
+                async with self.getTestCore(dirn=restdirn) as core:
+                    self.len(2, await core.nodes('inet:ipv4'))
+
+            with self.getTestDir() as dirn2:
+
+                with self.raises(s_exc.BadArg):
+                    s_backup.backup(coredirn, dirn2, basedir=coredirn)
+
+                with self.raises(s_exc.BadArg):
+                    s_backup.restore(coredirn, s_common.genpath(dirn2, 'newp'))
+
+                s_common.yamlsave({'base': '../newp', 'lmdbs': {'slabs/cell.lmdb': {'from': '../newp'}}},
+                                  dirn2, 'backup.yaml')
+                with self.raises(s_exc.NoSuchFile):
+                    s_backup.restore(dirn2, s_common.genpath(dirn, 'newp'))
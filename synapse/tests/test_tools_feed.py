@@ -1,4 +1,6 @@
+import os
 import json
+import asyncio
 import hashlib
 
 from unittest import mock
@@ -6,6 +8,7 @@ from unittest import mock
 import synapse.exc as s_exc
 import synapse.common as s_common
 
+import synapse.lib.snap as s_snap
 import synapse.lib.msgpack as s_msgpack
 
 import synapse.tools.feed as s_feed
@@ -138,3 +141,146 @@ class FeedTest(s_t_utils.SynTest):
 
             nodes = await core.nodes('test:int', opts={'view': oldview})
             self.len(0, nodes)
+
+    async def test_synnodes_pipeline(self):
+
+        async with self.getTestCore() as core:
+
+            await self.addCreatorDeleterRoles(core)
+
+            host, port = await core.dmon.listen('tcp://127.0.0.1:0/')
+
+            curl = f'tcp://icanadd:secret@{host}:{port}/'
+
+            with self.getTestDir() as dirn:
+
+                jsonlfp = s_common.genpath(dirn, 'podes.jsonl')
+                with s_common.genfile(jsonlfp) as fd:
+                    for i in range(20):
+                        pode = (('test:int', i), {})
+                        _ = fd.write(json.dumps(pode).encode() + b'\n')
+
+                ckptfp = s_common.genpath(dirn, 'feed.ckpt')
+
+                argv = ['--cortex', curl,
+                        '--format', 'syn.nodes',
+                        '--modules', 'synapse.tests.utils.TestModule',
+                        '--chunksize', '3',
+                        '--pipeline', '3',
+                        '--checkpoint', ckptfp,
+                        jsonlfp]
+
+                addFeedData = s_snap.Snap.addFeedData
+
+                async def failFeedData(self, name, items):
+                    if any(item[0][1] == 10 for item in items):
+                        raise s_exc.SynErr(mesg='failed chunk')
+                    return await addFeedData(self, name, items)
+
+                outp = self.getTestOutp()
+                with mock.patch('synapse.lib.snap.Snap.addFeedData', failFeedData):
+                    with self.raises(s_exc.SynErr):
+                        await s_feed.main(argv, outp=outp)
+
+                # only the chunks before the failed chunk are committed
+                ckpt = s_feed.loadCheckpoint(ckptfp)
+                info = ckpt.get(s_common.genpath(jsonlfp))
+                self.false(info.get('done'))
+                self.eq(info.get('offs'), 9)
+                self.len(9, await core.nodes('test:int +test:int<9'))
+
+                outp = self.getTestOutp()
+                self.eq(await s_feed.main(argv, outp=outp), 0)
+                outp.expect('from checkpoint offset [9]')
+                outp.expect('Added [3] items from [podes.jsonl] - offset [12]')
+                outp.expect('Added [2] items from [podes.jsonl] - offset [20]')
+
+                ckpt = s_feed.loadCheckpoint(ckptfp)
+                info = ckpt.get(s_common.genpath(jsonlfp))
+                self.eq(info.get('offs'), 20)
+                self.true(info.get('done'))
+                self.eq(info.get('size'), os.stat(jsonlfp).st_size)
+                self.eq(info.get('mtime'), os.stat(jsonlfp).st_mtime_ns)
+
+                self.len(20, await core.nodes('test:int'))
+
+                outp = self.getTestOutp()
+                self.eq(await s_feed.main(argv, outp=outp), 0)
+                outp.expect('which was completed according to the checkpoint')
+                self.false(outp.expect('Added [', throw=False))
+
+                # the checkpoint only advances past chunks once the chunks before them are added
+                saved = []
+                slow = asyncio.Event()
+                origsave = s_feed.saveCheckpoint
+
+                def saveCheckpoint(path, info):
+                    saved.append((info[s_common.genpath(jsonlfp)]['offs'], slow.is_set()))
+                    return origsave(path, info)
+
+                async def slowFeedData(self, name, items):
+                    if any(item[0][1] == 4 for item in items):
+                        await asyncio.sleep(0.5)
+                        slow.set()
+                    return await addFeedData(self, name, items)
+
+                os.unlink(ckptfp)
+
+                outp = self.getTestOutp()
+                with mock.patch('synapse.lib.snap.Snap.addFeedData', slowFeedData), \
+                     mock.patch.object(s_feed, 'CHECKPOINT_INTERVAL', 0), \
+                     mock.patch.object(s_feed, 'saveCheckpoint', saveCheckpoint):
+                    self.eq(await s_feed.main(argv, outp=outp), 0)
+
+                self.eq(saved[0], (3, False))
+                self.eq(saved[-1], (20, True))
+                self.eq(saved, sorted(saved))
+                self.true(all(offs <= 3 for (offs, isdone) in saved if not isdone))
+
+                # checkpoint writes are throttled while a file is loading
+                saved.clear()
+                slow.clear()
+                os.unlink(ckptfp)
+
+                outp = self.getTestOutp()
+                with mock.patch.object(s_feed, 'saveCheckpoint', saveCheckpoint):
+                    self.eq(await s_feed.main(argv, outp=outp), 0)
+
+                self.eq(saved, [(20, False)])
+
+                # adapt the chunk size to the observed latency
+                argv = ['--cortex', curl,
+                        '--format', 'syn.nodes',
+                        '--modules', 'synapse.tests.utils.TestModule',
+                        '--chunksize', '2',
+                        '--chunk-latency', '1000',
+                        jsonlfp]
+
+                outp = self.getTestOutp()
+                self.eq(await s_feed.main(argv, outp=outp), 0)
+                outp.expect('Added [2] items from [podes.jsonl] - offset [2]')
+                outp.expect('Added [4] items from [podes.jsonl] - offset [6]')
+                outp.expect('Added [8] items from [podes.jsonl] - offset [14]')
+                outp.expect('Added [6] items from [podes.jsonl] - offset [20]')
+
+                outp = self.getTestOutp()
+                self.eq(await s_feed.main(argv[:-1] + ['--pipeline', '0', jsonlfp], outp=outp), 1)
+                outp.expect('The --pipeline value must be greater than 0.')
+
+                # a checkpoint for a file which has changed is refused
+                with s_common.genfile(jsonlfp) as fd:
+                    fd.seek(0, os.SEEK_END)
+                    _ = fd.write(json.dumps((('test:int', 20), {})).encode() + b'\n')
+
+                argv = argv[:-1] + ['--checkpoint', ckptfp, jsonlfp]
+
+                outp = self.getTestOutp()
+                self.eq(await s_feed.main(argv, outp=outp), 1)
+                outp.expect('does not match the size and modification time of the file')
+                self.len(0, await core.nodes('test:int=20'))
+
+        self.eq(s_feed._adaptChunkSize(100, 0.1, 1.0), 200)
+        self.eq(s_feed._adaptChunkSize(100, 1.0, 1.0), 100)
+        self.eq(s_feed._adaptChunkSize(100, 3.0, 1.0), 50)
+        self.eq(s_feed._adaptChunkSize(1, 3.0, 1.0), s_feed.MIN_CHUNKSIZE)
+        self.eq(s_feed._adaptChunkSize(s_feed.MAX_CHUNKSIZE, 0.1, 1.0), s_feed.MAX_CHUNKSIZE)
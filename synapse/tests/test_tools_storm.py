@@ -247,6 +247,31 @@ class StormCliTest(s_test.SynTest):
                 await s_t_storm.main(('--optsfile', optsfile, url, 'file:bytes'), outp=outp)
                 self.isin('aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa', str(outp))
 
+    async def test_tools_storm_profile(self):
+
+        async with self.getTestCore() as core:
+
+            url = core.getLocalUrl()
+
+            pars = s_t_storm.getArgParser()
+            opts = pars.parse_args(('woot', '--profile'))
+            self.true(opts.profile)
+
+            await core.nodes('[ test:str=foo test:str=bar ]')
+
+            outp = s_output.OutPutStr()
+            await s_t_storm.main(('--profile', url, 'test:str | { -> test:str }'), outp=outp)
+            text = str(outp)
+            self.isin('query: test:str | { -> test:str } (runs=1 in=0)', text)
+            self.isin('    test:str (LiftProp)', text)
+            self.isin('        in=0 out=2 self=', text)
+            self.isin('        query: -> test:str (runs=2 in=2)', text)
+            self.isin('            -> test:str (FormPivot)', text)
+
+            outp = s_output.OutPutStr()
+            await s_t_storm.main((url, 'test:str'), outp=outp)
+            self.notin('query: test:str', str(outp))
+
     async def test_storm_tab_completion(self):
         class DummyStorm:
             def __init__(self, core):
@@ -10,11 +10,15 @@ import contextlib
 
 import lmdb
 
+import synapse.exc as s_exc
 import synapse.common as s_common
 
 logger = logging.getLogger(__name__)
 
-def backup(srcdir, dstdir, skipdirs=None):
+# The manifest file which records the state of the lmdb files in a backup
+manifest = 'backup.yaml'
+
+def backup(srcdir, dstdir, skipdirs=None, basedir=None):
     '''
     Create a backup of a Synapse application.
 
@@ -22,12 +26,25 @@ def backup(srcdir, dstdir, skipdirs=None):
         srcdir (str): Path to the directory to backup.
         dstdir (str): Path to backup target directory.
         skipdirs (list or None): Optional list of relative directory name glob patterns to exclude from the backup.
+        basedir (str or None): Optional path to a previous backup to create an incremental backup from.
 
     Note:
         Running this method from the same process as a running user of the directory may lead to a segmentation fault
     '''
     with capturelmdbs(srcdir, skipdirs=skipdirs) as lmdbinfo:
-        txnbackup(lmdbinfo, srcdir, dstdir, skipdirs=skipdirs)
+        txnbackup(lmdbinfo, srcdir, dstdir, skipdirs=skipdirs, basedir=basedir)
+
+def getBackupManifest(dirn):
+    '''
+    Load the manifest of a backup directory.
+
+    Args:
+        dirn (str): Path to the backup directory.
+
+    Returns:
+        dict: The backup manifest or None if the backup does not have one.
+    '''
+    return s_common.yamlload(dirn, manifest)
 
 @contextlib.contextmanager
 def capturelmdbs(srcdir, skipdirs=None, onlydirs=None):
@@ -70,7 +87,7 @@ def capturelmdbs(srcdir, skipdirs=None, onlydirs=None):
 
         yield lmdbinfo
 
-def txnbackup(lmdbinfo, srcdir, dstdir, skipdirs=None):
+def txnbackup(lmdbinfo, srcdir, dstdir, skipdirs=None, basedir=None):
     '''
     Create a backup of a Synapse application under a (hopefully consistent) set of transactions.
 
@@ -79,15 +96,34 @@ def txnbackup(lmdbinfo, srcdir, dstdir, skipdirs=None):
         srcdir (str): Path to the directory to backup.
         dstdir (str): Path to backup target directory.
         skipdirs (list or None): Optional list of relative directory name glob patterns to exclude from the backup.
+        basedir (str or None): Optional path to a previous backup to create an incremental backup from.
 
-    Note:
+    Notes:
         Running this method from the same process as a running user of the directory may lead to a segmentation fault
+
+        When basedir is specified, lmdb files which have not been modified since the base backup was created are
+        not copied. The manifest of the incremental backup records which backup contains each of them, and the
+        restore() function must be used to create a complete copy of the backup.
     '''
     tick = s_common.now()
 
     srcdir = s_common.reqdir(srcdir)
     dstdir = s_common.gendir(dstdir)
 
+    baselmdbs = {}
+    if basedir is not None:
+
+        basedir = s_common.reqdir(basedir)
+
+        basemani = getBackupManifest(basedir)
+        if basemani is None:
+            mesg = f'Base backup {basedir} has no {manifest} file.'
+            raise s_exc.BadArg(mesg=mesg, path=basedir)
+
+        baselmdbs = basemani.get('lmdbs', {})
+
+    lmdbs = {}
+
     if skipdirs is None:
         skipdirs = []
 
@@ -118,10 +154,25 @@ def txnbackup(lmdbinfo, srcdir, dstdir, skipdirs=None):
             info = lmdbinfo.get(os.path.abspath(srcpath))
 
             if info is not None:
-                logger.debug('backing up lmdb file: %s', srcpath)
                 dnames.remove(name)
                 env, txn = info
+
+                slabname = os.path.normpath(relname)
+                slabinfo = {
+                    'txnid': txn.id(),
+                    'inode': os.stat(os.path.join(srcpath, 'data.mdb')).st_ino,
+                }
+
+                holddirn = _getBaseHoldDirn(basedir, baselmdbs.get(slabname), slabinfo, slabname)
+                if holddirn is not None:
+                    logger.debug('lmdb file unchanged since base backup: %s', srcpath)
+                    slabinfo['from'] = os.path.relpath(holddirn, dstdir)
+                    lmdbs[slabname] = slabinfo
+                    continue
+
+                logger.debug('backing up lmdb file: %s', srcpath)
                 backup_lmdb(env, dstpath, txn=txn)
+                lmdbs[slabname] = slabinfo
                 continue
 
             if name.endswith('.lmdb'):
@@ -143,11 +194,78 @@ def txnbackup(lmdbinfo, srcdir, dstdir, skipdirs=None):
             logger.debug(f'copying: {srcpath} -> {dstpath}')
             shutil.copy(srcpath, dstpath)
 
+    mani = {
+        'time': tick,
+        'base': None,
+        'lmdbs': lmdbs,
+    }
+
+    if basedir is not None:
+        mani['base'] = os.path.relpath(basedir, dstdir)
+
+    s_common.yamlsave(mani, dstdir, manifest)
+
     tock = s_common.now()
 
     logger.debug(f'Backup complete. Took [{tock-tick:.2f}] for [{srcdir}]')
     return
 
+def _getBaseHoldDirn(basedir, baseinfo, info, slabname):
+    # return the backup dir which holds an unmodified copy of the lmdb file or None
+    if baseinfo is None:
+        return None
+
+    if baseinfo.get('txnid') != info.get('txnid') or baseinfo.get('inode') != info.get('inode'):
+        return None
+
+    holddirn = basedir
+    if baseinfo.get('from') is not None:
+        holddirn = os.path.normpath(os.path.join(basedir, baseinfo.get('from')))
+
+    if not os.path.isfile(os.path.join(holddirn, slabname, 'data.mdb')):
+        return None
+
+    return holddirn
+
+def restore(srcdir, dstdir):
+    '''
+    Create a complete copy of a backup, including the lmdb files it shares with previous backups.
+
+    Args:
+        srcdir (str): Path to the (possibly incremental) backup directory.
+        dstdir (str): Path to the target directory.
+    '''
+    srcdir = s_common.reqdir(srcdir)
+
+    mani = getBackupManifest(srcdir)
+    if mani is None:
+        mesg = f'Backup {srcdir} has no {manifest} file.'
+        raise s_exc.BadArg(mesg=mesg, path=srcdir)
+
+    logger.debug(f'Restoring backup [{srcdir}] to [{dstdir}]')
+
+    shutil.copytree(srcdir, dstdir)
+
+    for slabname, info in mani.get('lmdbs', {}).items():
+
+        frompath = info.get('from')
+        if frompath is None:
+            continue
+
+        srcpath = os.path.normpath(os.path.join(srcdir, frompath, slabname))
+        if not os.path.isfile(os.path.join(srcpath, 'data.mdb')):
+            mesg = f'Backup {srcdir} requires the missing lmdb file {srcpath}.'
+            raise s_exc.NoSuchFile(mesg=mesg, path=srcpath)
+
+        logger.debug(f'copying: {srcpath} -> {dstdir}')
+        dstpath = s_common.gendir(dstdir, slabname)
+        shutil.copy(os.path.join(srcpath, 'data.mdb'), os.path.join(dstpath, 'data.mdb'))
+
+        info.pop('from')
+
+    mani['base'] = None
+    s_common.yamlsave(mani, dstdir, manifest)
+
 def backup_lmdb(env: lmdb.Environment, dstdir: str, txn=None):
 
     tick = time.time()
@@ -161,7 +279,12 @@ def backup_lmdb(env: lmdb.Environment, dstdir: str, txn=None):
 
 def main(argv):
     args = parse_args(argv)
-    backup(args.srcdir, args.dstdir, args.skipdirs)
+
+    if args.restore:
+        restore(args.srcdir, args.dstdir)
+        return 0
+
+    backup(args.srcdir, args.dstdir, args.skipdirs, basedir=args.base)
     return 0
 
 def parse_args(argv):
@@ -171,6 +294,10 @@ def parse_args(argv):
     parser.add_argument('dstdir', help='Path to the backup target directory.')
     parser.add_argument('--skipdirs', nargs='+',
                         help='Glob patterns of relative directory names to exclude from the backup.')
+    parser.add_argument('--base', default=None,
+                        help='Path to a previous backup. Only lmdb files modified since the previous backup are copied.')
+    parser.add_argument('--restore', default=False, action='store_true',
+                        help='Restore a complete copy of the (possibly incremental) backup in srcdir to dstdir.')
     args = parser.parse_args(argv)
     return args
 
@@ -1,9 +1,11 @@
 import os
 import sys
+import json
 import time
 import asyncio
 import logging
 import argparse
+import collections
 
 import synapse.exc as s_exc
 import synapse.common as s_common
@@ -20,6 +22,17 @@ logger = logging.getLogger(__name__)
 
 reqver = '>=0.2.0,<3.0.0'
 
+# bounds for the chunk size when adapting it to the observed chunk latency
+MIN_CHUNKSIZE = 1
+MAX_CHUNKSIZE = 100_000
+
+# the minimum number of seconds between checkpoint writes while a file is being loaded
+CHECKPOINT_INTERVAL = 5.0
+
+def _iterJsonLines(path):
+    with s_common.genfile(path) as fd:
+        yield from s_encoding.iterdata(fd, False, format='jsonl')
+
 def getItems(*paths):
     items = []
     for path in paths:
@@ -29,9 +42,7 @@ def getItems(*paths):
                 item = [item]
             items.append((path, item))
         elif path.endswith('.jsonl'):
-            with s_common.genfile(path) as fd:
-                item = list(s_encoding.iterdata(fd, False, format='jsonl'))
-                items.append((path, item))
+            items.append((path, _iterJsonLines(path)))
         elif path.endswith(('.yaml', '.yml')):
             item = s_common.yamlload(path)
             if not isinstance(item, list):
@@ -44,30 +55,250 @@ def getItems(*paths):
             logger.warning('Unsupported file path: [%s]', path)
     return items
 
-async def addFeedData(core, outp, feedformat, debug=False, *paths, chunksize=1000, offset=0, viewiden=None):
+def loadCheckpoint(path):
+    '''
+    Load a feed checkpoint file.
+
+    Returns:
+        dict: A dictionary of input file paths to their checkpoint information.
+    '''
+    if path is None or not os.path.isfile(path):
+        return {}
+
+    with open(path, 'rb') as fd:
+        return json.loads(fd.read())
+
+def getFileIdentity(path):
+    '''
+    Get the size and modification time used to check that a checkpoint matches a file.
+    '''
+    info = os.stat(path)
+    return {'size': info.st_size, 'mtime': info.st_mtime_ns}
+
+def saveCheckpoint(path, info):
+    '''
+    Atomically save a feed checkpoint file.
+    '''
+    temp = f'{path}.tmp'
+    with open(temp, 'wb') as fd:
+        fd.write(json.dumps(info, indent=2, sort_keys=True).encode())
+        fd.flush()
+        os.fsync(fd.fileno())
+
+    os.replace(temp, path)
+
+def _genChunks(item, sizes):
+
+    chunk = []
+    for valu in item:
+
+        chunk.append(valu)
+        if len(chunk) >= sizes['chunksize']:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+def _adaptChunkSize(chunksize, took, latency):
+
+    # grow or shrink the chunk size to keep the round trip near the target latency
+    if took < latency / 2:
+        return min(chunksize * 2, MAX_CHUNKSIZE)
+
+    if took > latency * 2:
+        return max(chunksize // 2, MIN_CHUNKSIZE)
+
+    return chunksize
+
+async def addFeedData(core, outp, feedformat, debug=False, *paths, chunksize=1000, offset=0, viewiden=None,
+                      pipeline=1, latency=None, checkpoint=None):
+    '''
+    Add feed data from the given files to a Cortex.
+
+    Args:
+        core: A Cortex or Cortex telepath Proxy.
+        outp: The output object.
+        feedformat (str): The feed format of the data.
+        debug (bool): Drop into an interactive prompt after loading data.
+        *paths: The paths of the files to load.
+        chunksize (int): The number of items sent to the Cortex in each chunk.
+        offset (int): The item offset to start consuming data from.
+        viewiden (str): The iden of the View to add the data to.
+        pipeline (int): The maximum number of chunks to have in flight at once.
+        latency (float): If set, the chunk size is adjusted to keep each chunk near this many seconds.
+        checkpoint (str): The path to a checkpoint file used to resume a previous load.
+
+    Notes:
+        The checkpoint file records the offset of the items in each file which have been
+        added to the Cortex, along with the size and modification time of the file. The
+        checkpoint offset only advances past chunks once every chunk before them has been
+        added, and is written at most every CHECKPOINT_INTERVAL seconds while a file is
+        loading. If a load is resumed, chunks which were added after the last checkpoint
+        was written may be added again.
+
+    Raises:
+        s_exc.BadArg: If the checkpoint was saved for a file which has since changed.
+    '''
+    ckptinfo = loadCheckpoint(checkpoint)
+
+    sizes = {'chunksize': chunksize}
 
     items = getItems(*paths)
+
+    if checkpoint is not None:
+        for path, _ in items:
+
+            fileckpt = ckptinfo.get(os.path.abspath(path))
+            if fileckpt is None:
+                continue
+
+            fileiden = getFileIdentity(path)
+            if any(fileckpt.get(name) != valu for (name, valu) in fileiden.items()):
+                mesg = f'The checkpoint for [{path}] does not match the size and modification time of the file.'
+                raise s_exc.BadArg(mesg=mesg, path=path)
+
     for path, item in items:
 
         bname = os.path.basename(path)
+        ckptkey = os.path.abspath(path)
+
+        start = 0
+        fileckpt = ckptinfo.get(ckptkey)
+        if fileckpt is not None:
+
+            if fileckpt.get('done'):
+                outp.printf(f'Skipping [{path}] which was completed according to the checkpoint')
+                continue
+
+            start = fileckpt.get('offs', 0)
+            outp.printf(f'Resuming [{path}] from checkpoint offset [{start}]')
 
         tick = time.time()
         outp.printf(f'Adding items from [{path}]')
 
-        foff = 0
-        for chunk in s_common.chunks(item, chunksize):
+        ckpt = {'offs': start, 'saved': start, 'tick': time.monotonic()}
+        if checkpoint is not None:
+            fileiden = getFileIdentity(path)
 
-            clen = len(chunk)
-            if offset and foff + clen < offset:
-                # We have not yet encountered a chunk which
-                # will include the offset size.
-                foff += clen
-                continue
+        def saveFileCheckpoint(done=False, force=False):
+
+            if checkpoint is None:
+                return
+
+            if not done:
+
+                if ckpt['offs'] == ckpt['saved']:
+                    return
+
+                if not force and time.monotonic() - ckpt['tick'] < CHECKPOINT_INTERVAL:
+                    return
 
+            ckptinfo[ckptkey] = {'offs': ckpt['offs'], 'done': done, **fileiden}
+            saveCheckpoint(checkpoint, ckptinfo)
+
+            ckpt['saved'] = ckpt['offs']
+            ckpt['tick'] = time.monotonic()
+
+        async def addChunk(chunk):
+
+            tick = time.monotonic()
             await core.addFeedData(feedformat, chunk, viewiden=viewiden)
 
-            foff += clen
-            outp.printf(f'Added [{clen}] items from [{bname}] - offset [{foff}]')
+            if latency is not None:
+                sizes['chunksize'] = _adaptChunkSize(sizes['chunksize'], time.monotonic() - tick, latency)
+
+        # chunks which have not been committed, in the order they were read
+        todo = collections.deque()
+
+        def commitChunks():
+
+            # commit the completed chunks which follow the last committed chunk
+            while todo and todo[0][2].done():
+
+                foff, clen, task = todo[0]
+                if task.cancelled() or task.exception() is not None:
+                    return
+
+                todo.popleft()
+                ckpt['offs'] = foff
+
+                outp.printf(f'Added [{clen}] items from [{bname}] - offset [{foff}]')
+
+        async def waitChunks(count):
+
+            # wait until no more than count chunks are in flight
+            while True:
+
+                tasks = [task for (_, _, task) in todo if not task.done()]
+                if len(tasks) <= count:
+                    break
+
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+
+            commitChunks()
+            saveFileCheckpoint()
+
+        try:
+
+            foff = 0
+            for chunk in _genChunks(item, sizes):
+
+                clen = len(chunk)
+
+                if start:
+                    # skip the items which were added according to the checkpoint
+                    skip = min(clen, start - foff)
+                    chunk = chunk[skip:]
+                    foff += skip
+                    clen -= skip
+                    if foff < start:
+                        continue
+                    start = 0
+
+                    if not chunk:
+                        continue
+
+                elif offset and foff + clen < offset:
+                    # We have not yet encountered a chunk which
+                    # will include the offset size.
+                    foff += clen
+                    continue
+
+                foff += clen
+                todo.append((foff, clen, asyncio.create_task(addChunk(chunk))))
+
+                await waitChunks(pipeline - 1)
+
+            await waitChunks(0)
+
+        except asyncio.CancelledError:
+            for (_, _, task) in todo:
+                task.cancel()
+            raise
+
+        finally:
+
+            if todo:
+
+                # finish the chunks before a failed chunk so they are recorded in the checkpoint
+                failed = False
+                for (_, _, task) in todo:
+                    if failed:
+                        task.cancel()
+                    elif task.done() and not task.cancelled() and task.exception() is not None:
+                        failed = True
+
+                await asyncio.wait([task for (_, _, task) in todo])
+                [task.exception() for (_, _, task) in todo if not task.cancelled()]
+
+                commitChunks()
+                saveFileCheckpoint(force=True)
+
+        ckpt['offs'] = foff
+        saveFileCheckpoint(done=True)
 
         tock = time.time()
 
@@ -93,12 +324,23 @@ async def main(argv, outp=None):
         outp.printf(f'Starting from offset [{opts.offset}] - it may take a while'
                     f' to get to that location in the input file.')
 
+    if opts.pipeline < 1:
+        outp.printf('The --pipeline value must be greater than 0.')
+        return 1
+
     if opts.test:
         async with s_cortex.getTempCortex(mods=opts.modules) as prox:
-            await addFeedData(prox, outp, opts.format, opts.debug,
-                        chunksize=opts.chunksize,
-                        offset=opts.offset,
-                        *opts.files)
+            try:
+                await addFeedData(prox, outp, opts.format, opts.debug,
+                            chunksize=opts.chunksize,
+                            offset=opts.offset,
+                            pipeline=opts.pipeline,
+                            latency=opts.chunk_latency,
+                            checkpoint=opts.checkpoint,
+                            *opts.files)
+            except s_exc.BadArg as e:
+                outp.printf(e.get('mesg'))
+                return 1
 
     elif opts.cortex:
         async with s_telepath.withTeleEnv():
@@ -111,10 +353,17 @@ async def main(argv, outp=None):
                     outp.printf(f'Please use a version of Synapse which supports {valu}; '
                           f'current version is {s_version.verstring}.')
                     return 1
-                await addFeedData(core, outp, opts.format, opts.debug,
-                                  chunksize=opts.chunksize,
-                                  offset=opts.offset, viewiden=opts.view,
-                                  *opts.files)
+                try:
+                    await addFeedData(core, outp, opts.format, opts.debug,
+                                      chunksize=opts.chunksize,
+                                      offset=opts.offset, viewiden=opts.view,
+                                      pipeline=opts.pipeline,
+                                      latency=opts.chunk_latency,
+                                      checkpoint=opts.checkpoint,
+                                      *opts.files)
+                except s_exc.BadArg as e:
+                    outp.printf(e.get('mesg'))
+                    return 1
 
     else:  # pragma: no cover
         outp.printf('No valid options provided [%s]', opts)
@@ -144,6 +393,12 @@ def makeargparser():
                       help='Item offset to start consuming data from.')
     pars.add_argument('--view', type=str, action='store', default=None,
                       help='The View to ingest the data into.')
+    pars.add_argument('--pipeline', type=int, action='store', default=1,
+                      help='The maximum number of chunks to send to the Cortex concurrently.')
+    pars.add_argument('--chunk-latency', type=float, action='store', default=None,
+                      help='Adjust the chunksize to keep each chunk near the given number of seconds.')
+    pars.add_argument('--checkpoint', type=str, action='store', default=None,
+                      help='A checkpoint file used to record progress and resume a previous load.')
     pars.add_argument('files', nargs='*', help='json/yaml/msgpack feed files')
 
     return pars
@@ -16,6 +16,9 @@ Examples:
     # Generate a backup from inside a Synapse service container
     python -m synapse.tools.livebackup
 
+    # Generate an incremental backup which only copies the files modified since a previous backup
+    python -m synapse.tools.livebackup --base 20220422094622
+
 '''
 
 async def main(argv, outp=s_output.stdout):
@@ -25,6 +28,7 @@ async def main(argv, outp=s_output.stdout):
 
     pars.add_argument('--url', default='cell:///vertex/storage', help='The telepath URL of the Synapse service.')
     pars.add_argument('--name', default=None, help='Specify a name for the backup.  Defaults to an automatically generated timestamp.')
+    pars.add_argument('--base', default=None, help='The name of a previous backup to create an incremental backup from.')
 
     opts = pars.parse_args(argv)
 
@@ -32,7 +36,7 @@ async def main(argv, outp=s_output.stdout):
 
         async with await s_telepath.openurl(opts.url) as cell:
             outp.printf(f'Running backup of: {opts.url}')
-            name = await cell.runBackup(name=opts.name)
+            name = await cell.runBackup(name=opts.name, base=opts.base)
             outp.printf(f'...backup created: {name}')
     return 0
 
@@ -448,6 +448,9 @@ class StormCli(s_cli.Cli):
             if opts.view:
                 self.stormopts['view'] = opts.view
 
+            if opts.profile:
+                self.stormopts['profile'] = True
+
         self.hidetags = False
         self.hideprops = False
         self._print_skips = []
@@ -504,6 +507,16 @@ class StormCli(s_cli.Cli):
     def _printNodeProp(self, name, valu):
         self.printf(f'        {name} = {valu}')
 
+    def _printProfile(self, query, depth=0):
+        indent = '    ' * depth
+        self.printf(f'{indent}query: {query.get("text")} (runs={query.get("runs")} in={query.get("in")})')
+        for oper in query.get('opers'):
+            self.printf(f'{indent}    {oper.get("text")} ({oper.get("name")})')
+            self.printf(f'{indent}        in={oper.get("in")} out={oper.get("out")} self={oper.get("self")}ms '
+                        f'took={oper.get("took")}ms rows={oper.get("rows")} sodes={oper.get("sodes")}')
+            for subq in oper.get('queries'):
+                self._printProfile(subq, depth=depth + 2)
+
     async def storm(self, text, opts=None):
 
         ret = True
@@ -598,6 +611,9 @@ class StormCli(s_cli.Cli):
             elif mtyp == 'print':
                 self.printf(mesg[1].get('mesg'))
 
+            elif mtyp == 'profile':
+                self._printProfile(mesg[1].get('query'))
+
             elif mtyp == 'warn':
                 info = mesg[1]
                 warn = info.pop('mesg', '')
@@ -618,6 +634,8 @@ def getArgParser():
     pars.add_argument('onecmd', nargs='?', help='A single storm command to run and exit.')
     pars.add_argument('--view', default=None, help='The view iden to work in.')
     pars.add_argument('--optsfile', default=None, help='A JSON/YAML file which contains storm runtime options.')
+    pars.add_argument('--profile', default=False, action='store_true',
+                      help='Print per-operator timing and row counts for each query.')
     return pars
 
 async def main(argv, outp=s_output.stdout):